@@ -94,6 +94,9 @@ create_session_state() {
     # Generate ISO 8601 UTC timestamp
     local timestamp=$(date -u +"%Y-%m-%dT%H:%M:%SZ")
 
+    # Commit the feature branch starts from (bounds the wrap-up summary)
+    local base_commit=$(git rev-parse HEAD 2>/dev/null || echo "")
+
     # Build JSON (handle optional issue_number)
     if [ -n "$issue_number" ]; then
         cat > "$state_file" <<EOF
@@ -102,6 +105,7 @@ create_session_state() {
   "created_at": "$timestamp",
   "feature_branch": "$feature_branch",
   "parent_branch": "$parent_branch",
+  "base_commit": "$base_commit",
   "issue_number": $issue_number,
   "github_issue": null
 }
@@ -113,6 +117,7 @@ EOF
   "created_at": "$timestamp",
   "feature_branch": "$feature_branch",
   "parent_branch": "$parent_branch",
+  "base_commit": "$base_commit",
   "issue_number": null,
   "github_issue": null
 }
@@ -88,6 +88,9 @@ create_session_state() {
     # Generate ISO 8601 UTC timestamp
     local timestamp=$(date -u +"%Y-%m-%dT%H:%M:%SZ")
 
+    # Commit the feature branch starts from (bounds the wrap-up summary)
+    local base_commit=$(git rev-parse HEAD 2>/dev/null || echo "")
+
     # Build JSON
     cat > "$state_file" <<EOF
 {
@@ -95,6 +98,7 @@ create_session_state() {
   "created_at": "$timestamp",
   "feature_branch": "$feature_branch",
   "parent_branch": "$parent_branch",
+  "base_commit": "$base_commit",
   "task_name": "$task_name"
 }
 EOF
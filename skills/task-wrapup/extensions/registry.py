@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Extension Registry for Task Wrap-Up Skill
+
+Discovers Extension subclasses without importing them:
+
+- Entry points in the "task_wrapup.extensions" group (name = extension name)
+- Modules in the extensions/ package (name = module name), e.g.
+  extensions/future/discord.py -> "discord"
+
+An extension runs only when its config section (config["extensions"][name])
+has "enabled": true. Only then is its module imported and the class
+instantiated, and its validate_config() is checked before any channel is
+dispatched. Disabled extensions cost no import time and no threads.
+"""
+
+import importlib
+import inspect
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from extensions.base import Extension
+
+ENTRY_POINT_GROUP = "task_wrapup.extensions"
+
+# Modules in the package that are infrastructure, not extensions
+_RESERVED_MODULES = {"base", "registry"}
+
+
+@dataclass
+class ExtensionSpec:
+    """Where to find an extension, resolved without importing it."""
+
+    name: str
+    source: str  # "entry_point" or "package"
+    target: str  # Module path, or "module:attr" for entry points
+    loader: Optional[Callable[[], Any]] = None
+
+    def load_class(self) -> type:
+        """Import the extension module and return its Extension subclass."""
+        if self.loader is not None:
+            loaded = self.loader()
+        else:
+            loaded = importlib.import_module(self.target)
+
+        if inspect.isclass(loaded):
+            if issubclass(loaded, Extension):
+                return loaded
+            raise TypeError(f"{self.target} is not an Extension subclass")
+
+        classes = [
+            obj for obj in vars(loaded).values()
+            if inspect.isclass(obj) and issubclass(obj, Extension)
+            and obj.__module__ == loaded.__name__ and not inspect.isabstract(obj)
+        ]
+        if len(classes) != 1:
+            raise TypeError(f"{self.target} must define exactly one Extension subclass, found {len(classes)}")
+        return classes[0]
+
+
+def _entry_points() -> List[Any]:
+    from importlib.metadata import entry_points
+
+    found = entry_points()
+    if hasattr(found, "select"):
+        return list(found.select(group=ENTRY_POINT_GROUP))
+    return list(found.get(ENTRY_POINT_GROUP, []))  # Python < 3.10
+
+
+class ExtensionRegistry:
+    """Extension specs by name; entry points take precedence over package modules."""
+
+    def __init__(self, specs: Optional[Dict[str, ExtensionSpec]] = None):
+        self.specs: Dict[str, ExtensionSpec] = dict(specs or {})
+
+    @classmethod
+    def discover(cls, package_dir: Optional[str] = None, use_entry_points: bool = True) -> "ExtensionRegistry":
+        """
+        Collect extension specs from the extensions/ package and entry points.
+
+        Args:
+            package_dir: Directory of the extensions package (default: this package)
+            use_entry_points: Also read the task_wrapup.extensions entry point group
+        """
+        package_dir = package_dir or os.path.dirname(os.path.abspath(__file__))
+        registry = cls()
+
+        for root, dirs, files in os.walk(package_dir):
+            dirs[:] = sorted(d for d in dirs if not d.startswith(("_", ".")) and d != "tests")
+            relative = os.path.relpath(root, package_dir)
+            prefix = "extensions" if relative == "." else "extensions." + relative.replace(os.sep, ".")
+            for filename in sorted(files):
+                name, ext = os.path.splitext(filename)
+                if ext != ".py" or name.startswith("_") or name in _RESERVED_MODULES:
+                    continue
+                registry.specs.setdefault(name, ExtensionSpec(name, "package", f"{prefix}.{name}"))
+
+        if use_entry_points:
+            try:
+                points = _entry_points()
+            except Exception:
+                points = []
+            for point in points:
+                registry.specs[point.name] = ExtensionSpec(point.name, "entry_point", point.value, point.load)
+
+        return registry
+
+    @staticmethod
+    def is_enabled(name: str, config: Dict[str, Any]) -> bool:
+        """Whether config["extensions"][name] is enabled."""
+        section = config.get("extensions", {}).get(name)
+        return isinstance(section, dict) and bool(section.get("enabled", False))
+
+    def enabled(self, config: Dict[str, Any]) -> List[ExtensionSpec]:
+        """Specs of extensions enabled in config (nothing is imported)."""
+        return [spec for name, spec in sorted(self.specs.items()) if self.is_enabled(name, config)]
+
+    def load(
+        self,
+        config: Dict[str, Any],
+        reserved: Tuple[str, ...] = ()
+    ) -> Tuple[Dict[str, Extension], Dict[str, Dict[str, Any]]]:
+        """
+        Import, instantiate and validate every enabled extension.
+
+        Args:
+            config: Full configuration
+            reserved: Names taken by built-in channels
+
+        Returns:
+            (ready extensions by name, error results by name for extensions
+            that failed to import, instantiate or validate)
+        """
+        ready: Dict[str, Extension] = {}
+        failures: Dict[str, Dict[str, Any]] = {}
+
+        for spec in self.enabled(config):
+            if spec.name in reserved:
+                failures[spec.name] = {"status": "error",
+                                       "reason": f"Extension name conflicts with built-in channel: {spec.name}"}
+                continue
+            try:
+                extension = spec.load_class()(config)
+                extension.enabled = True
+                valid, errors = extension.validate_config()
+            except Exception as e:
+                failures[spec.name] = {"status": "error",
+                                       "reason": f"Failed to load extension ({spec.target}): {e}"}
+                continue
+
+            if not valid:
+                failures[spec.name] = {"status": "error",
+                                       "reason": f"Invalid configuration: {'; '.join(errors)}"}
+                continue
+            ready[spec.name] = extension
+
+        return ready, failures
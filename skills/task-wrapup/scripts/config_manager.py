@@ -31,6 +31,17 @@ DEFAULT_CONFIG = {
             "serena_memory": True,
             "file_changes": True
         },
+        "source_timeouts": {
+            "git": 20,
+            "todo_tasks": 5,
+            "serena_memory": 5
+        },
+        "repo_workers": 4,
+        "cache": {
+            "enabled": True,
+            "max_entries": 2000,
+            "max_bytes": 2097152
+        },
         "intelligence": {
             "extract_key_decisions": True,
             "identify_blockers": True,
@@ -51,6 +62,9 @@ DEFAULT_CONFIG = {
             "enabled": True,
             "recipients": [],
             "max_length": 320,
+            "max_concurrent": 3,
+            "rate_per_second": 1.0,
+            "burst": 2,
             "critical_only": False
         },
         "slack": {
@@ -66,6 +80,7 @@ DEFAULT_CONFIG = {
         "prompt_for_duration": True,
         "default_duration_minutes": None,
         "round_to_nearest": 15,
+        "max_length": 300,
         "date_handling": {
             "prompt_for_date": False,
             "default": "today",
@@ -102,11 +117,22 @@ DEFAULT_CONFIG = {
         }
     },
 
+    "extensions": {},
+
     "execution": {
         "preview_before_send": True,
         "parallel_execution": True,
+        "engine": "async",
+        "max_parallel_workers": 5,
+        "channel_concurrency": {},
+        "channel_timeout_seconds": 120,
         "max_retries": 3,
-        "retry_delay_seconds": 5
+        "retry_delay_seconds": 5,
+        "max_retry_delay_seconds": 300,
+        "outbox": {
+            "enabled": True,
+            "file": ".claude/task_wrapup_outbox.db"
+        }
     }
 }
 
@@ -11,16 +11,59 @@ Orchestrates parallel execution of notifications across multiple channels:
 - Calendar (optional, via calendar skill)
 - GitHub (optional, via /sc:git)
 
+Email, SMS and worklog deliveries are recorded in a durable outbox
+(notification_outbox.py) before they are sent; failures are retried with
+exponential backoff, and `drain` resends whatever is still pending.
+
+Extensions (extensions/registry.py) enabled under config["extensions"]
+are imported lazily, validated before anything is sent, and scheduled on
+the same engine as the built-in channels.
+
+Channels run on an asyncio engine by default: every channel and every
+SMS recipient is one task, subprocesses are started with
+asyncio.create_subprocess_exec, and concurrency is bounded by a global
+limit plus per-channel semaphores. The thread-pool engine remains
+available (--threaded, or --sequential for one channel at a time).
+
 Collects results and generates final summary report.
 """
 
+import asyncio
 import json
 import subprocess
 import sys
 import os
+import threading
+import time
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import asynccontextmanager
+
+from notification_outbox import Outbox
+from summary_generator import channel_budgets, truncate_to_budget
+
+# Skill root, so the extensions package is importable from scripts/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from extensions.base import Extension  # noqa: E402
+from extensions.registry import ExtensionRegistry  # noqa: E402
+
+# Concurrent subprocesses across all channels (execution.max_parallel_workers)
+DEFAULT_MAX_CONCURRENCY = 5
+
+# Whole-channel deadline on the async engine (execution.channel_timeout_seconds)
+DEFAULT_CHANNEL_TIMEOUT = 120
+
+# SMS fan-out: concurrent sends and token-bucket rate (communication.sms.*)
+DEFAULT_SMS_CONCURRENCY = 3
+DEFAULT_SMS_RATE_PER_SECOND = 1.0
+DEFAULT_SMS_BURST = 2
+
+# Reason reported for deliveries skipped by the idempotency ledger
+DEDUPLICATED_REASON = "Already delivered this session"
+
+# Error recorded for a delivery whose channel was cancelled mid-send
+CANCELLED_REASON = "Channel timed out before the send completed"
 
 
 def run_command(cmd: List[str], timeout: int = 60) -> tuple[int, str, str]:
@@ -34,18 +77,24 @@ def run_command(cmd: List[str], timeout: int = 60) -> tuple[int, str, str]:
         return 1, "", str(e)
 
 
-def send_email(summary: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
-    """Send email via email skill."""
+def email_request(summary: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the email skill invocation.
+
+    Returns:
+        {"cmd", "msg_file", "recipients", "cc"}, or {"result": ...} when
+        nothing is sent (disabled or misconfigured)
+    """
     email_config = config["communication"]["email"]
 
     if not email_config.get("enabled", False):
-        return {"status": "skipped", "reason": "Email disabled"}
+        return {"result": {"status": "skipped", "reason": "Email disabled"}}
 
     recipients = email_config.get("recipients", [])
     cc = email_config.get("cc", [])
 
     if not recipients:
-        return {"status": "error", "reason": "No email recipients configured"}
+        return {"result": {"status": "error", "reason": "No email recipients configured"}}
 
     # Use custom summary if provided, otherwise use full summary
     content = summary.get("email_summary", summary["full_summary"])
@@ -65,106 +114,418 @@ def send_email(summary: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any
         f.write(content)
         msg_file = f.name
 
+    # Invoke email skill via Claude Code
+    # Note: This assumes we're running within Claude Code context
+    # In production, this would use the Skill tool invocation
+    skill_path = os.path.expanduser("~/.claude/skills/email/gmail_manager.rb")
+
+    cmd = ["ruby", skill_path, "--send",
+           "--to", ",".join(to_addrs),
+           "--subject", subject,
+           "--body-file", msg_file]
+
+    if cc_addrs:
+        cmd.extend(["--cc", ",".join(cc_addrs)])
+
+    return {"cmd": cmd, "msg_file": msg_file, "content": content, "recipients": to_addrs, "cc": cc_addrs}
+
+
+def email_result(request: Dict[str, Any], returncode: int, stderr: str) -> Dict[str, Any]:
+    """Interpret the email skill's exit status."""
+    if returncode == 0:
+        return {
+            "status": "success",
+            "recipients": request["recipients"],
+            "cc": request["cc"] if request["cc"] else []
+        }
+    else:
+        return {
+            "status": "error",
+            "reason": stderr or "Email sending failed",
+            "attempted_recipients": request["recipients"]
+        }
+
+
+async def run_command_async(cmd: List[str], timeout: float = 60) -> tuple[int, str, str]:
+    """
+    Async counterpart of run_command (returncode, stdout, stderr).
+
+    The child is killed if it overruns the timeout or the awaiting task
+    is cancelled, so no subprocess outlives its channel.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+    except Exception as e:
+        return 1, "", str(e)
+
     try:
-        # Invoke email skill via Claude Code
-        # Note: This assumes we're running within Claude Code context
-        # In production, this would use the Skill tool invocation
-        skill_path = os.path.expanduser("~/.claude/skills/email/gmail_manager.rb")
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return 1, "", f"Command timed out after {timeout}s"
+    except asyncio.CancelledError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
 
-        cmd = ["ruby", skill_path, "--send",
-               "--to", ",".join(to_addrs),
-               "--subject", subject,
-               "--body-file", msg_file]
 
-        if cc_addrs:
-            cmd.extend(["--cc", ",".join(cc_addrs)])
+async def run_in_daemon_thread(fn: Callable[[], Any], name: str) -> Any:
+    """
+    Run a blocking callable on a daemon thread and await its result.
 
-        returncode, stdout, stderr = run_command(cmd, timeout=30)
+    Unlike asyncio.to_thread, the thread is not in the loop's default
+    executor, so when the awaiting task is cancelled (channel timeout) the
+    thread is abandoned: asyncio.run returns without joining it and it
+    never holds up process exit.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(result: Any, error: Optional[BaseException]) -> None:
+        if future.done():
+            return  # Cancelled while the thread was still running
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
 
-        os.unlink(msg_file)  # Clean up temp file
+    def run() -> None:
+        result, error = None, None
+        try:
+            result = fn()
+        except BaseException as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(settle, result, error)
+        except RuntimeError:
+            pass  # Loop already closed; nobody is waiting any more
+
+    threading.Thread(target=run, name=f"dispatch-{name}", daemon=True).start()
+    return await future
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` sends per second, bursts of `capacity`.
 
-        if returncode == 0:
-            return {
-                "status": "success",
-                "recipients": to_addrs,
-                "cc": cc_addrs if cc_addrs else []
-            }
+    Each caller reserves a token up front (the balance may go negative) and
+    sleeps until its turn, so waiters are served in arrival order from both
+    threads and coroutines. A rate of 0 disables limiting.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token; return how long to wait before using it."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        time.sleep(self._reserve())
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the loop) until a token is available."""
+        await asyncio.sleep(self._reserve())
+
+
+def sms_rate_limiter(config: Dict[str, Any]) -> TokenBucket:
+    """Token bucket for one SMS fan-out (communication.sms.rate_per_second/burst)."""
+    sms_config = config["communication"]["sms"]
+    return TokenBucket(
+        sms_config.get("rate_per_second", DEFAULT_SMS_RATE_PER_SECOND),
+        sms_config.get("burst", DEFAULT_SMS_BURST)
+    )
+
+
+class DispatchLimits:
+    """Global and per-channel concurrency limits for the async engine."""
+
+    def __init__(self, config: Dict[str, Any]):
+        execution = config.get("execution", {})
+        self.global_limit = asyncio.Semaphore(execution.get("max_parallel_workers", DEFAULT_MAX_CONCURRENCY))
+        self.channel_limits = {
+            channel: asyncio.Semaphore(limit)
+            for channel, limit in execution.get("channel_concurrency", {}).items()
+        }
+        if "sms" not in self.channel_limits:
+            sms_config = config.get("communication", {}).get("sms", {})
+            self.channel_limits["sms"] = asyncio.Semaphore(
+                sms_config.get("max_concurrent", DEFAULT_SMS_CONCURRENCY)
+            )
+
+    @asynccontextmanager
+    async def slot(self, channel: str, ready=None):
+        """
+        Hold a channel slot (if the channel is limited) and a global slot.
+
+        Args:
+            channel: Channel name
+            ready: Optional coroutine function awaited once the channel slot
+                is held, before taking a global slot (e.g. a rate limiter)
+        """
+        channel_limit = self.channel_limits.get(channel)
+        if channel_limit is None:
+            if ready is not None:
+                await ready()
+            async with self.global_limit:
+                yield
         else:
-            return {
-                "status": "error",
-                "reason": stderr or "Email sending failed",
-                "attempted_recipients": to_addrs
-            }
+            async with channel_limit:
+                if ready is not None:
+                    await ready()
+                async with self.global_limit:
+                    yield
+
+
+def enqueue_delivery(outbox: Optional[Outbox], channel: str, recipient: str, cmd: List[str],
+                     body: Optional[str] = None,
+                     body_file: Optional[str] = None) -> tuple[Optional[int], bool]:
+    """
+    Record a delivery as pending in the outbox (if any) before it is sent.
+
+    A temporary body file is not kept: its content is stored instead and
+    written to a fresh file when the delivery is resent. The idempotency
+    key covers the command with the body in place of the file path.
 
+    Returns:
+        (delivery ID or None, whether it was already delivered and must be skipped)
+    """
+    if outbox is None:
+        return None, False
+    payload = {"cmd": cmd, "timeout": 30}
+    content = cmd
+    if body_file is not None:
+        payload.update(body=body, body_index=cmd.index(body_file))
+        content = [body if arg == body_file else arg for arg in cmd]
+    delivery_id = outbox.enqueue(channel, recipient, payload, content)
+    return delivery_id, delivery_id is None
+
+
+def record_delivery(outbox: Optional[Outbox], delivery_id: Optional[int],
+                    returncode: int, stderr: str) -> None:
+    """Record an attempt's outcome in the outbox (failures are scheduled for retry)."""
+    if outbox is not None and delivery_id is not None:
+        outbox.record(delivery_id, returncode == 0, stderr)
+
+
+async def send_recorded(outbox: Optional[Outbox], delivery_id: Optional[int],
+                        limits: DispatchLimits, channel: str, cmd: List[str]) -> tuple[int, str, str]:
+    """
+    Run a delivery's command in a channel slot and record the attempt.
+
+    If the channel is cancelled (timed out) mid-send, the attempt is
+    recorded as failed before the cancellation propagates, so the outbox
+    row gets its retry schedule instead of staying pending unattempted.
+    """
+    try:
+        async with limits.slot(channel):
+            returncode, stdout, stderr = await run_command_async(cmd, timeout=30)
+    except asyncio.CancelledError:
+        record_delivery(outbox, delivery_id, 1, CANCELLED_REASON)
+        raise
+    record_delivery(outbox, delivery_id, returncode, stderr)
+    return returncode, stdout, stderr
+
+
+def send_email(summary: Dict[str, Any], config: Dict[str, Any],
+               outbox: Optional[Outbox] = None) -> Dict[str, Any]:
+    """Send email via email skill."""
+    request = email_request(summary, config)
+    if "result" in request:
+        return request["result"]
+
+    try:
+        delivery_id, duplicate = enqueue_delivery(outbox, "email", ",".join(request["recipients"]),
+                                                  request["cmd"], request["content"], request["msg_file"])
+        if duplicate:
+            return {"status": "deduplicated", "recipients": request["recipients"], "reason": DEDUPLICATED_REASON}
+        returncode, stdout, stderr = run_command(request["cmd"], timeout=30)
+        record_delivery(outbox, delivery_id, returncode, stderr)
+        return email_result(request, returncode, stderr)
     except Exception as e:
-        if os.path.exists(msg_file):
-            os.unlink(msg_file)
         return {"status": "error", "reason": str(e)}
+    finally:
+        if os.path.exists(request["msg_file"]):
+            os.unlink(request["msg_file"])  # Clean up temp file
 
 
-def send_sms(summary: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
-    """Send SMS via text-message skill (individual messages to each recipient)."""
+async def send_email_async(summary: Dict[str, Any], config: Dict[str, Any],
+                           limits: DispatchLimits, outbox: Optional[Outbox] = None) -> Dict[str, Any]:
+    """Async engine variant of send_email."""
+    request = email_request(summary, config)
+    if "result" in request:
+        return request["result"]
+
+    try:
+        delivery_id, duplicate = enqueue_delivery(outbox, "email", ",".join(request["recipients"]),
+                                                  request["cmd"], request["content"], request["msg_file"])
+        if duplicate:
+            return {"status": "deduplicated", "recipients": request["recipients"], "reason": DEDUPLICATED_REASON}
+        returncode, stdout, stderr = await send_recorded(outbox, delivery_id, limits, "email", request["cmd"])
+        return email_result(request, returncode, stderr)
+    finally:
+        if os.path.exists(request["msg_file"]):
+            os.unlink(request["msg_file"])
+
+
+def sms_request(summary: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Resolve the SMS text and recipients.
+
+    Returns:
+        {"content", "recipients"}, or {"result": ...} when nothing is sent
+    """
     sms_config = config["communication"]["sms"]
 
     if not sms_config.get("enabled", False):
-        return {"status": "skipped", "reason": "SMS disabled"}
+        return {"result": {"status": "skipped", "reason": "SMS disabled"}}
 
     recipients = sms_config.get("recipients", [])
 
     if not recipients:
-        return {"status": "error", "reason": "No SMS recipients configured"}
+        return {"result": {"status": "error", "reason": "No SMS recipients configured"}}
 
-    # Use custom summary if provided, otherwise use concise summary
-    content = summary.get("sms_summary", summary["concise_summary"])
+    # Use custom summary if provided, otherwise the variant packed for the SMS budget
+    content = summary.get("sms_summary") or summary.get("channel_summaries", {}).get("sms") \
+        or summary["concise_summary"]
 
-    # Enforce max length if configured
-    max_length = sms_config.get("max_length", 320)
-    if len(content) > max_length:
-        content = content[:max_length - 3] + "..."
+    # Remove apostrophes to prevent AppleScript failures, then enforce the
+    # SMS budget with the packer's rule (custom text is not pre-packed)
+    budget = channel_budgets(config)["sms"]
+    content = truncate_to_budget(content.replace("'", ""), budget["limit"], budget["unit"])
 
-    # Send individual messages (NEVER group texts)
-    script_path = os.path.expanduser("~/.claude/skills/text-message/scripts/send_message.sh")
-    results = []
+    return {"content": content, "recipients": recipients}
 
-    for recipient in recipients:
-        phone = recipient["phone"]
-        name = f"{recipient['first_name']} {recipient['last_name']}"
 
-        # Remove apostrophes to prevent AppleScript failures
-        safe_content = content.replace("'", "")
+def sms_command(recipient: Dict[str, Any], content: str) -> List[str]:
+    """text-message skill invocation for one recipient (never a group text)."""
+    script_path = os.path.expanduser("~/.claude/skills/text-message/scripts/send_message.sh")
+    return [script_path, recipient["phone"], content]
+
+
+def sms_recipient_result(recipient: Dict[str, Any], returncode: int, stderr: str,
+                         queued: float = 0.0, latency: float = 0.0) -> Dict[str, Any]:
+    """Outcome of one individual SMS, with time spent queued and sending (seconds)."""
+    result = {
+        "recipient": f"{recipient['first_name']} {recipient['last_name']}",
+        "phone": recipient["phone"],
+        "status": "success" if returncode == 0 else "error",
+        "queued_ms": round(queued * 1000),
+        "latency_ms": round(latency * 1000)
+    }
+    if returncode != 0:
+        result["reason"] = stderr or "SMS sending failed"
+    return result
 
-        returncode, stdout, stderr = run_command(
-            [script_path, phone, safe_content],
-            timeout=30
-        )
 
-        if returncode == 0:
-            results.append({
-                "recipient": name,
-                "phone": phone,
-                "status": "success"
-            })
-        else:
-            results.append({
-                "recipient": name,
-                "phone": phone,
-                "status": "error",
-                "reason": stderr or "SMS sending failed"
-            })
+def sms_deduplicated_result(recipient: Dict[str, Any]) -> Dict[str, Any]:
+    """Outcome of an SMS skipped because this session already delivered it."""
+    return {
+        "recipient": f"{recipient['first_name']} {recipient['last_name']}",
+        "phone": recipient["phone"],
+        "status": "deduplicated",
+        "reason": DEDUPLICATED_REASON
+    }
 
-    # Aggregate results
+
+def sms_result(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate per-recipient SMS outcomes."""
     successful = [r for r in results if r["status"] == "success"]
     failed = [r for r in results if r["status"] == "error"]
+    deduplicated = [r for r in results if r["status"] == "deduplicated"]
+
+    if failed:
+        status = "partial"
+    elif deduplicated and not successful:
+        status = "deduplicated"
+    else:
+        status = "success"
 
     return {
-        "status": "success" if len(failed) == 0 else "partial",
-        "total": len(recipients),
+        "status": status,
+        "total": len(results),
         "successful": len(successful),
         "failed": len(failed),
+        "deduplicated": len(deduplicated),
         "details": results
     }
 
 
+def send_sms(summary: Dict[str, Any], config: Dict[str, Any],
+             outbox: Optional[Outbox] = None) -> Dict[str, Any]:
+    """Send SMS via text-message skill (individual messages to each recipient)."""
+    request = sms_request(summary, config)
+    if "result" in request:
+        return request["result"]
+
+    sms_config = config["communication"]["sms"]
+    bucket = sms_rate_limiter(config)
+    started = time.monotonic()
+
+    def send_one(recipient: Dict[str, Any]) -> Dict[str, Any]:
+        cmd = sms_command(recipient, request["content"])
+        delivery_id, duplicate = enqueue_delivery(outbox, "sms", recipient["phone"], cmd)
+        if duplicate:
+            return sms_deduplicated_result(recipient)
+        bucket.acquire()
+        sent = time.monotonic()
+        returncode, stdout, stderr = run_command(cmd, timeout=30)
+        record_delivery(outbox, delivery_id, returncode, stderr)
+        return sms_recipient_result(recipient, returncode, stderr, sent - started, time.monotonic() - sent)
+
+    # Send individual messages (NEVER group texts), several at a time
+    workers = max(1, min(sms_config.get("max_concurrent", DEFAULT_SMS_CONCURRENCY), len(request["recipients"])))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(send_one, request["recipients"]))
+
+    return sms_result(results)
+
+
+async def send_sms_async(summary: Dict[str, Any], config: Dict[str, Any],
+                         limits: DispatchLimits, outbox: Optional[Outbox] = None) -> Dict[str, Any]:
+    """Async engine variant of send_sms: one task per recipient (still individual messages)."""
+    request = sms_request(summary, config)
+    if "result" in request:
+        return request["result"]
+
+    bucket = sms_rate_limiter(config)
+    started = time.monotonic()
+
+    async def send_one(recipient: Dict[str, Any]) -> Dict[str, Any]:
+        cmd = sms_command(recipient, request["content"])
+        delivery_id, duplicate = enqueue_delivery(outbox, "sms", recipient["phone"], cmd)
+        if duplicate:
+            return sms_deduplicated_result(recipient)
+        try:
+            async with limits.slot("sms", ready=bucket.acquire_async):
+                sent = time.monotonic()
+                returncode, stdout, stderr = await run_command_async(cmd, timeout=30)
+        except asyncio.CancelledError:
+            record_delivery(outbox, delivery_id, 1, CANCELLED_REASON)
+            raise
+        record_delivery(outbox, delivery_id, returncode, stderr)
+        return sms_recipient_result(recipient, returncode, stderr, sent - started, time.monotonic() - sent)
+
+    results = await asyncio.gather(*(send_one(recipient) for recipient in request["recipients"]))
+    return sms_result(list(results))
+
+
 def send_slack(summary: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
     """Send Slack message."""
     slack_config = config["communication"]["slack"]
@@ -195,15 +556,22 @@ def send_slack(summary: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any
     }
 
 
-def create_worklog_entry(summary: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
-    """Create worklog entry via worklog skill."""
+def worklog_request(summary: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the worklog skill invocation.
+
+    Returns:
+        {"cmd", "date", "description", "client"}, or {"result": ...} when
+        nothing is logged
+    """
     worklog_config = config.get("worklog", {})
 
     if not worklog_config.get("enabled", False):
-        return {"status": "skipped", "reason": "Worklog disabled"}
+        return {"result": {"status": "skipped", "reason": "Worklog disabled"}}
 
-    # Use custom summary if provided, otherwise use concise summary
-    description = summary.get("worklog_summary", summary["concise_summary"])
+    # Use custom summary if provided, otherwise the variant packed for the worklog budget
+    description = summary.get("worklog_summary") or summary.get("channel_summaries", {}).get("worklog") \
+        or summary["concise_summary"]
 
     # Get current date from system clock
     current_date = datetime.now().strftime("%Y-%m-%d")
@@ -237,14 +605,17 @@ def create_worklog_entry(summary: Dict[str, Any], config: Dict[str, Any]) -> Dic
     elif default_duration:
         cmd.extend(["--hours", str(default_duration / 60.0)])
 
-    returncode, stdout, stderr = run_command(cmd, timeout=30)
+    return {"cmd": cmd, "date": current_date, "description": description, "client": project_name}
+
 
+def worklog_result(request: Dict[str, Any], returncode: int, stderr: str) -> Dict[str, Any]:
+    """Interpret the worklog skill's exit status."""
     if returncode == 0:
         return {
             "status": "success",
-            "date": current_date,
-            "description": description,
-            "client": project_name
+            "date": request["date"],
+            "description": request["description"],
+            "client": request["client"]
         }
     else:
         return {
@@ -253,6 +624,46 @@ def create_worklog_entry(summary: Dict[str, Any], config: Dict[str, Any]) -> Dic
         }
 
 
+def worklog_deduplicated_result(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Outcome of a worklog entry skipped because this session already logged it."""
+    return {
+        "status": "deduplicated",
+        "date": request["date"],
+        "description": request["description"],
+        "client": request["client"],
+        "reason": DEDUPLICATED_REASON
+    }
+
+
+def create_worklog_entry(summary: Dict[str, Any], config: Dict[str, Any],
+                         outbox: Optional[Outbox] = None) -> Dict[str, Any]:
+    """Create worklog entry via worklog skill."""
+    request = worklog_request(summary, config)
+    if "result" in request:
+        return request["result"]
+
+    delivery_id, duplicate = enqueue_delivery(outbox, "worklog", request["client"] or "worklog", request["cmd"])
+    if duplicate:
+        return worklog_deduplicated_result(request)
+    returncode, stdout, stderr = run_command(request["cmd"], timeout=30)
+    record_delivery(outbox, delivery_id, returncode, stderr)
+    return worklog_result(request, returncode, stderr)
+
+
+async def create_worklog_entry_async(summary: Dict[str, Any], config: Dict[str, Any],
+                                     limits: DispatchLimits, outbox: Optional[Outbox] = None) -> Dict[str, Any]:
+    """Async engine variant of create_worklog_entry."""
+    request = worklog_request(summary, config)
+    if "result" in request:
+        return request["result"]
+
+    delivery_id, duplicate = enqueue_delivery(outbox, "worklog", request["client"] or "worklog", request["cmd"])
+    if duplicate:
+        return worklog_deduplicated_result(request)
+    returncode, stdout, stderr = await send_recorded(outbox, delivery_id, limits, "worklog", request["cmd"])
+    return worklog_result(request, returncode, stderr)
+
+
 def update_documentation(summary: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
     """Update project documentation via /sc:document command."""
     docs_config = config.get("documentation", {})
@@ -394,6 +805,20 @@ def load_session_state() -> Optional[Dict[str, Any]]:
         return None
 
 
+def delivery_session(directory: str = ".") -> str:
+    """
+    Scope of the delivery idempotency keys.
+
+    The task session (feature branch + start time) when one is active,
+    otherwise the project directory and today's date, so a same-day re-run
+    of the same wrap-up does not send it twice.
+    """
+    state = load_session_state()
+    if state:
+        return f"{state['feature_branch']}@{state['created_at']}"
+    return f"{os.path.abspath(directory)}@{datetime.now().strftime('%Y-%m-%d')}"
+
+
 def get_pr_error_help(exit_code: int) -> str:
     """Map pr-workflow.sh exit codes to user-friendly error messages."""
     error_messages = {
@@ -536,8 +961,126 @@ def cleanup_session_state(config: Dict[str, Any]) -> None:
             pass  # Fail silently
 
 
+# Channel name -> synchronous implementation (threaded and sequential engines)
+CHANNELS = {
+    "email": send_email,
+    "sms": send_sms,
+    "slack": send_slack,
+    "worklog": create_worklog_entry,
+    "documentation": update_documentation,
+    "calendar": create_calendar_event,
+    "github": create_github_item
+}
+
+# Channels whose deliveries go through the outbox (they take an `outbox` argument)
+OUTBOX_CHANNELS = {"email", "sms", "worklog"}
+
+# Channels with native async implementations; the rest run on a worker thread
+ASYNC_CHANNELS = {
+    "email": send_email_async,
+    "sms": send_sms_async,
+    "worklog": create_worklog_entry_async
+}
+
+# Config section holding each built-in channel's "enabled" flag
+CHANNEL_SECTIONS = {
+    "email": ("communication", "email"),
+    "sms": ("communication", "sms"),
+    "slack": ("communication", "slack"),
+    "worklog": ("worklog",),
+    "documentation": ("documentation",),
+    "calendar": ("optional_actions", "calendar"),
+    "github": ("optional_actions", "github")
+}
+
+
+def channel_enabled(name: str, config: Dict[str, Any]) -> bool:
+    """Whether a built-in channel's config section is enabled."""
+    section = config
+    for key in CHANNEL_SECTIONS[name]:
+        section = section.get(key, {})
+    return bool(section.get("enabled", False))
+
+
+def load_extensions(config: Dict[str, Any]) -> tuple[Dict[str, Extension], Dict[str, Dict[str, Any]]]:
+    """Import and validate the enabled extensions (see ExtensionRegistry.load)."""
+    return ExtensionRegistry.discover().load(config, reserved=tuple(CHANNELS))
+
+
+def channel_tasks(summary: Dict[str, Any], config: Dict[str, Any], outbox: Optional[Outbox],
+                  extensions: Dict[str, Extension]) -> tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Split channels into work to schedule and results known up front.
+
+    Disabled built-in channels are resolved inline (they only report
+    "skipped"), so they never occupy a worker thread or task.
+
+    Returns:
+        (name -> zero-argument callable for every enabled channel and
+        extension, name -> result of every disabled channel)
+    """
+    tasks, resolved = {}, {}
+    for name, fn in CHANNELS.items():
+        if name in OUTBOX_CHANNELS:
+            task = (lambda fn=fn: fn(summary, config, outbox))
+        else:
+            task = (lambda fn=fn: fn(summary, config))
+        if channel_enabled(name, config):
+            tasks[name] = task
+        else:
+            resolved[name] = task()
+
+    for name, extension in extensions.items():
+        tasks[name] = (lambda extension=extension: extension.execute(summary))
+    return tasks, resolved
+
+
+async def dispatch_notifications_async(summary: Dict[str, Any], config: Dict[str, Any],
+                                       outbox: Optional[Outbox] = None,
+                                       extensions: Optional[Dict[str, Extension]] = None) -> Dict[str, Any]:
+    """
+    Dispatch every channel (and every SMS recipient) as one asyncio task graph.
+
+    Subprocesses are bounded by execution.max_parallel_workers overall and
+    by execution.channel_concurrency per channel. A channel that exceeds
+    execution.channel_timeout_seconds is cancelled: its subprocesses are
+    killed and its in-flight outbox deliveries are recorded as failed
+    attempts. Thread-backed channels and extensions run on daemon threads
+    that are abandoned on timeout, so they never hold up the dispatch.
+
+    Returns:
+        Dictionary with results from all channels
+    """
+    limits = DispatchLimits(config)
+    timeout = config.get("execution", {}).get("channel_timeout_seconds", DEFAULT_CHANNEL_TIMEOUT)
+    tasks, results = channel_tasks(summary, config, outbox, extensions or {})
+
+    async def run_channel(name: str) -> Dict[str, Any]:
+        if name in ASYNC_CHANNELS:
+            coro = ASYNC_CHANNELS[name](summary, config, limits, outbox)
+        else:
+            async def in_thread():
+                async with limits.slot(name):
+                    return await run_in_daemon_thread(tasks[name], name)
+            coro = in_thread()
+
+        try:
+            return await asyncio.wait_for(coro, timeout)
+        except asyncio.TimeoutError:
+            return {"status": "error", "reason": f"Timed out after {timeout}s"}
+        except Exception as e:
+            return {"status": "error", "reason": f"Exception: {str(e)}"}
+
+    names = list(tasks)
+    outcomes = await asyncio.gather(*(run_channel(name) for name in names))
+    results.update(zip(names, outcomes))
+    return results
+
+
 def dispatch_notifications(summary: Dict[str, Any], config: Dict[str, Any],
-                           parallel: bool = True) -> Dict[str, Any]:
+                           parallel: bool = True, engine: str = "async",
+                           outbox: Optional[Outbox] = None,
+                           extensions: Optional[Dict[str, Extension]] = None) -> Dict[str, Any]:
     """
     Dispatch notifications across all configured channels.
 
@@ -545,26 +1088,31 @@ def dispatch_notifications(summary: Dict[str, Any], config: Dict[str, Any],
         summary: Generated summary content
         config: Configuration with channel settings
         parallel: Whether to execute in parallel (default True)
+        engine: "async" (asyncio task graph) or "threaded" (thread pool);
+            ignored when not parallel
+        outbox: Durable outbox recording email/SMS/worklog deliveries
+        extensions: Validated extensions to run (default: load the enabled
+            ones from the registry; those failing validation are reported
+            as errors and never run)
 
     Returns:
         Dictionary with results from all channels
     """
-    results = {}
+    failures = {}
+    if extensions is None:
+        extensions, failures = load_extensions(config)
+
+    if parallel and engine == "async":
+        results = asyncio.run(dispatch_notifications_async(summary, config, outbox, extensions))
+        results.update(failures)
+        return results
 
     # Define tasks
-    tasks = {
-        "email": lambda: send_email(summary, config),
-        "sms": lambda: send_sms(summary, config),
-        "slack": lambda: send_slack(summary, config),
-        "worklog": lambda: create_worklog_entry(summary, config),
-        "documentation": lambda: update_documentation(summary, config),
-        "calendar": lambda: create_calendar_event(summary, config),
-        "github": lambda: create_github_item(summary, config)
-    }
+    tasks, results = channel_tasks(summary, config, outbox, extensions)
 
-    if parallel:
+    if parallel and tasks:
         # Execute tasks in parallel
-        max_workers = config.get("execution", {}).get("max_parallel_workers", 5)
+        max_workers = config.get("execution", {}).get("max_parallel_workers", DEFAULT_MAX_CONCURRENCY)
 
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_to_task = {executor.submit(task_fn): task_name
@@ -590,11 +1138,67 @@ def dispatch_notifications(summary: Dict[str, Any], config: Dict[str, Any],
                     "reason": f"Exception: {str(e)}"
                 }
 
+    results.update(failures)
     return results
 
 
-def format_final_summary(results: Dict[str, Any]) -> str:
-    """Format final summary of all notification results."""
+def resend_delivery(delivery: Dict[str, Any]) -> tuple[int, str, str]:
+    """Run a stored delivery's command again (recreating its body file if it had one)."""
+    payload = delivery["payload"]
+    cmd = list(payload["cmd"])
+    body_file = None
+    if "body_index" in payload:
+        import tempfile
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+            f.write(payload["body"])
+            body_file = f.name
+        cmd[payload["body_index"]] = body_file
+
+    try:
+        return run_command(cmd, timeout=payload.get("timeout", 30))
+    finally:
+        if body_file and os.path.exists(body_file):
+            os.unlink(body_file)
+
+
+def drain_outbox(outbox: Outbox, run_id: Optional[str] = None, wait: bool = True,
+                 ignore_schedule: bool = False) -> List[Dict[str, Any]]:
+    """
+    Retry scheduler: resend pending deliveries as they come due.
+
+    Args:
+        outbox: Delivery outbox
+        run_id: Only deliveries of this dispatch run (default: all)
+        wait: Sleep until retries scheduled later come due and keep going
+            until nothing is pending; otherwise make one pass over due ones
+        ignore_schedule: Resend every pending delivery now (first pass only)
+
+    Returns:
+        One {"id", "channel", "recipient", "attempt", "status", "error"} per resend
+    """
+    attempts = []
+    while True:
+        for delivery in outbox.due(run_id, ignore_schedule):
+            returncode, stdout, stderr = resend_delivery(delivery)
+            status = outbox.record(delivery["id"], returncode == 0, stderr)
+            attempts.append({
+                "id": delivery["id"],
+                "channel": delivery["channel"],
+                "recipient": delivery["recipient"],
+                "attempt": delivery["attempts"] + 1,
+                "status": status,
+                "error": stderr.strip() if returncode != 0 else None
+            })
+        ignore_schedule = False
+
+        next_attempt_at = outbox.next_attempt_at(run_id) if wait else None
+        if next_attempt_at is None:
+            return attempts
+        time.sleep(max(0.0, next_attempt_at - time.time()))
+
+
+def format_final_summary(results: Dict[str, Any], retries: Optional[List[Dict[str, Any]]] = None) -> str:
+    """Format final summary of all notification results (and outbox retries)."""
     lines = []
     lines.append("=" * 70)
     lines.append("TASK WRAP-UP SUMMARY")
@@ -605,6 +1209,7 @@ def format_final_summary(results: Dict[str, Any]) -> str:
     success_count = 0
     skip_count = 0
     error_count = 0
+    dedup_count = 0
 
     for channel, result in results.items():
         status = result.get("status", "unknown")
@@ -619,6 +1224,9 @@ def format_final_summary(results: Dict[str, Any]) -> str:
             success_count += 0.5
             error_count += 0.5
             icon = "⚠️ "
+        elif status == "deduplicated":
+            dedup_count += 1
+            icon = "♻️ "
         else:
             error_count += 1
             icon = "❌"
@@ -631,15 +1239,22 @@ def format_final_summary(results: Dict[str, Any]) -> str:
             if channel == "email" and "recipients" in result:
                 lines.append(f"   Recipients: {', '.join(result['recipients'])}")
             elif channel == "sms" and "details" in result:
-                lines.append(f"   Sent: {result['successful']}/{result['total']}")
+                sent = f"   Sent: {result['successful']}/{result['total']}"
+                if result.get("deduplicated"):
+                    sent += f" ({result['deduplicated']} deduplicated)"
+                lines.append(sent)
+                latencies = [d["latency_ms"] for d in result["details"] if "latency_ms" in d]
+                if latencies:
+                    lines.append(f"   Slowest send: {max(latencies)} ms")
             elif channel == "worklog" and "date" in result:
                 lines.append(f"   Date: {result['date']}")
 
         elif status == "error" or status == "partial":
-            reason = result.get("reason", "Unknown error")
+            # Extensions report "message" rather than "reason"
+            reason = result.get("reason") or result.get("message", "Unknown error")
             lines.append(f"   Error: {reason}")
 
-        elif status == "skipped":
+        elif status == "skipped" or status == "deduplicated":
             reason = result.get("reason", "Disabled")
             lines.append(f"   Reason: {reason}")
 
@@ -651,59 +1266,101 @@ def format_final_summary(results: Dict[str, Any]) -> str:
     lines.append(f"✅ Success: {int(success_count)}")
     lines.append(f"⏭️  Skipped: {skip_count}")
     lines.append(f"❌ Errors: {int(error_count)}")
+    if dedup_count:
+        lines.append(f"♻️  Deduplicated: {dedup_count}")
+    if retries:
+        recovered = sum(1 for attempt in retries if attempt["status"] == "sent")
+        lines.append(f"🔁 Retries: {len(retries)} ({recovered} delivered)")
     lines.append("=" * 70)
 
     return "\n".join(lines)
 
 
+def load_json_file(path: str, code: str, label: str) -> Dict[str, Any]:
+    """Load a JSON input file, exiting with a JSON error on failure."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        print(json.dumps({
+            "status": "error",
+            "code": code,
+            "message": f"Failed to load {label}: {e}"
+        }), file=sys.stderr)
+        sys.exit(1)
+
+
 def main():
     """Command-line interface for notification dispatch."""
     import argparse
 
     parser = argparse.ArgumentParser(description="Dispatch task wrap-up notifications")
-    parser.add_argument("--summary", required=True, help="Path to summary JSON file")
+    parser.add_argument("command", nargs="?", choices=["send", "drain"], default="send",
+                        help="send (default) dispatches a summary; drain resends pending outbox deliveries")
+    parser.add_argument("--summary", help="Path to summary JSON file (send)")
     parser.add_argument("--config", required=True, help="Path to configuration JSON file")
     parser.add_argument("--sequential", action="store_true", help="Execute sequentially instead of parallel")
+    parser.add_argument("--threaded", action="store_true",
+                        help="Use the thread-pool engine instead of asyncio")
+    parser.add_argument("--no-retry", action="store_true",
+                        help="send: leave failed deliveries pending for a later drain")
+    parser.add_argument("--now", action="store_true",
+                        help="drain: resend pending deliveries without waiting for their backoff")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="drain: also resend deliveries that ran out of attempts")
 
     args = parser.parse_args()
 
-    # Load summary
-    try:
-        with open(args.summary, 'r') as f:
-            summary = json.load(f)
-    except Exception as e:
-        print(json.dumps({
-            "status": "error",
-            "code": "SUMMARY_LOAD_ERROR",
-            "message": f"Failed to load summary: {e}"
-        }), file=sys.stderr)
-        sys.exit(1)
+    if args.command == "send" and not args.summary:
+        parser.error("--summary is required for send")
 
     # Load config
-    try:
-        with open(args.config, 'r') as f:
-            config = json.load(f)
-    except Exception as e:
+    config = load_json_file(args.config, "CONFIG_LOAD_ERROR", "config")
+    outbox = Outbox.for_project(config, session=delivery_session())
+
+    if args.command == "drain":
+        if outbox is None:
+            print(json.dumps({"status": "error", "code": "OUTBOX_DISABLED",
+                              "message": "execution.outbox.enabled is false"}), file=sys.stderr)
+            sys.exit(1)
+        reset = outbox.retry_failed() if args.retry_failed else 0
+        retries = drain_outbox(outbox, ignore_schedule=args.now)
         print(json.dumps({
-            "status": "error",
-            "code": "CONFIG_LOAD_ERROR",
-            "message": f"Failed to load config: {e}"
-        }), file=sys.stderr)
-        sys.exit(1)
+            "status": "success",
+            "requeued": reset,
+            "retries": retries,
+            "outbox": outbox.counts()
+        }))
+        outbox.close()
+        return
+
+    # Load summary
+    summary = load_json_file(args.summary, "SUMMARY_LOAD_ERROR", "summary")
 
     # Dispatch notifications
     parallel = not args.sequential
-    results = dispatch_notifications(summary, config, parallel=parallel)
+    engine = "threaded" if args.threaded else config.get("execution", {}).get("engine", "async")
+    results = dispatch_notifications(summary, config, parallel=parallel, engine=engine, outbox=outbox)
+
+    # Retry this run's failed deliveries with backoff
+    retries = []
+    if outbox is not None and not args.no_retry:
+        retries = drain_outbox(outbox, run_id=outbox.run_id)
 
     # Generate final summary
-    final_summary = format_final_summary(results)
+    final_summary = format_final_summary(results, retries)
 
     # Output results
-    print(json.dumps({
+    output = {
         "status": "success",
         "results": results,
         "summary": final_summary
-    }))
+    }
+    if outbox is not None:
+        output["retries"] = retries
+        output["outbox"] = outbox.counts()
+        outbox.close()
+    print(json.dumps(output))
 
     # Also print summary to stdout for user visibility
     print("\n" + final_summary, file=sys.stderr)
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Notification Outbox for Task Wrap-Up Skill
+
+Durable record of every channel x recipient delivery, kept in SQLite in
+the project's .claude dir. A delivery is written as pending before it is
+sent, so a crash or failure never loses it:
+
+- pending: not sent yet, or failed and scheduled for another attempt
+  (next_attempt_at, exponential backoff with jitter)
+- sent: delivered
+- failed: out of attempts (1 + execution.max_retries)
+
+Each delivery stores the command that sends it, so
+`notification_dispatcher.py drain` can resend exactly the pending ones
+without re-running the whole wrap-up.
+
+The outbox doubles as an idempotency ledger: every delivery carries a key
+hashed from (session, channel, recipient, content). Re-running a wrap-up
+skips deliveries already sent in the same session and reuses the row of
+one that is still pending, so only what actually failed is sent again.
+"""
+
+import hashlib
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+# Outbox database, relative to the project root
+OUTBOX_FILE = os.path.join(".claude", "task_wrapup_outbox.db")
+
+# Retry defaults (execution.max_retries / retry_delay_seconds / max_retry_delay_seconds)
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_DELAY = 5
+DEFAULT_MAX_RETRY_DELAY = 300
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS deliveries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    recipient TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    delivery_key TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_deliveries_due ON deliveries (status, next_attempt_at);
+"""
+
+KEY_INDEX = "CREATE UNIQUE INDEX IF NOT EXISTS idx_deliveries_key ON deliveries (delivery_key)"
+
+
+def delivery_key(session: str, channel: str, recipient: str, content: Any) -> str:
+    """Idempotency key of a delivery: SHA-256 of session, channel, recipient and content."""
+    material = json.dumps([session, channel, recipient, content], sort_keys=True)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def backoff_delay(attempts: int, base: float = DEFAULT_RETRY_DELAY,
+                  cap: float = DEFAULT_MAX_RETRY_DELAY) -> float:
+    """
+    Delay before the next attempt after `attempts` failures.
+
+    Exponential (base * 2^(attempts-1), capped) with "equal jitter": half
+    the delay is fixed and half random, so retries of many deliveries that
+    failed together spread out instead of hitting the service at once.
+    """
+    delay = min(cap, base * 2 ** max(0, attempts - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class Outbox:
+    """SQLite-backed delivery outbox shared by the dispatch threads/tasks."""
+
+    def __init__(self, path: str, max_retries: int = DEFAULT_MAX_RETRIES,
+                 retry_delay: float = DEFAULT_RETRY_DELAY,
+                 max_retry_delay: float = DEFAULT_MAX_RETRY_DELAY,
+                 session: str = ""):
+        self.path = path
+        # Scope of the idempotency keys (deliveries repeat only across sessions)
+        self.session = session
+        self.max_attempts = 1 + max(0, max_retries)
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        # Deliveries enqueued by this process belong to one dispatch run
+        self.run_id = uuid.uuid4().hex
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(SCHEMA)
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(deliveries)")}
+        if "delivery_key" not in columns:
+            # Outbox created before idempotency keys
+            self._conn.execute("ALTER TABLE deliveries ADD COLUMN delivery_key TEXT")
+        self._conn.execute(KEY_INDEX)
+        self._conn.commit()
+
+        # Keys already delivered, for O(1) duplicate checks before each send
+        self._sent_keys = {
+            row[0] for row in self._conn.execute(
+                "SELECT delivery_key FROM deliveries WHERE status = 'sent' AND delivery_key IS NOT NULL"
+            )
+        }
+
+    @classmethod
+    def for_project(cls, config: Dict[str, Any], directory: str = ".",
+                    session: str = "") -> Optional["Outbox"]:
+        """Open the project's outbox (None if execution.outbox.enabled is false)."""
+        execution = config.get("execution", {})
+        outbox_config = execution.get("outbox", {})
+        if not outbox_config.get("enabled", True):
+            return None
+
+        return cls(
+            os.path.join(directory, outbox_config.get("file", OUTBOX_FILE)),
+            execution.get("max_retries", DEFAULT_MAX_RETRIES),
+            execution.get("retry_delay_seconds", DEFAULT_RETRY_DELAY),
+            execution.get("max_retry_delay_seconds", DEFAULT_MAX_RETRY_DELAY),
+            session
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def enqueue(self, channel: str, recipient: str, payload: Dict[str, Any],
+                content: Any = None) -> Optional[int]:
+        """
+        Record a delivery as pending (before sending it).
+
+        Args:
+            channel: Channel name
+            recipient: Recipient identifier (address, phone, client)
+            payload: How to (re)send it ({"cmd", ...})
+            content: What is delivered, for the idempotency key (default: payload)
+
+        Returns:
+            The delivery ID to send, or None if the same delivery was already
+            sent this session (or is in flight in this run)
+        """
+        key = delivery_key(self.session, channel, recipient, payload if content is None else content)
+        if key in self._sent_keys:
+            return None
+
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT id, run_id, status FROM deliveries WHERE delivery_key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                if row["status"] == "sent" or row["run_id"] == self.run_id:
+                    return None
+                # Left pending or failed by an earlier run: attempt it again now
+                self._conn.execute(
+                    "UPDATE deliveries SET run_id = ?, payload = ?, status = 'pending', "
+                    "next_attempt_at = ?, max_attempts = MAX(max_attempts, attempts + ?), "
+                    "updated_at = ? WHERE id = ?",
+                    (self.run_id, json.dumps(payload), now, self.max_attempts, now, row["id"])
+                )
+                return row["id"]
+
+            cursor = self._conn.execute(
+                "INSERT INTO deliveries (run_id, channel, recipient, payload, max_attempts, "
+                "next_attempt_at, created_at, updated_at, delivery_key) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.run_id, channel, recipient, json.dumps(payload), self.max_attempts, now, now, now, key)
+            )
+            return cursor.lastrowid
+
+    def record(self, delivery_id: int, ok: bool, error: str = "") -> str:
+        """
+        Record the outcome of an attempt and schedule the next one if needed.
+
+        Returns:
+            The delivery's new status ("sent", "pending" or "failed")
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT attempts, max_attempts, delivery_key FROM deliveries WHERE id = ?", (delivery_id,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(f"Unknown delivery: {delivery_id}")
+
+            attempts = row["attempts"] + 1
+            if ok:
+                status, next_attempt_at, error = "sent", now, None
+                if row["delivery_key"]:
+                    self._sent_keys.add(row["delivery_key"])
+            elif attempts < row["max_attempts"]:
+                status = "pending"
+                next_attempt_at = now + backoff_delay(attempts, self.retry_delay, self.max_retry_delay)
+            else:
+                status, next_attempt_at = "failed", now
+
+            self._conn.execute(
+                "UPDATE deliveries SET status = ?, attempts = ?, next_attempt_at = ?, "
+                "last_error = ?, updated_at = ? WHERE id = ?",
+                (status, attempts, next_attempt_at, error, now, delivery_id)
+            )
+            return status
+
+    def _pending_filter(self, run_id: Optional[str]) -> tuple[str, List[Any]]:
+        clause, params = "status = 'pending'", []
+        if run_id:
+            clause += " AND run_id = ?"
+            params.append(run_id)
+        return clause, params
+
+    def due(self, run_id: Optional[str] = None, ignore_schedule: bool = False) -> List[Dict[str, Any]]:
+        """Pending deliveries whose next attempt is due (all pending with ignore_schedule)."""
+        clause, params = self._pending_filter(run_id)
+        if not ignore_schedule:
+            clause += " AND next_attempt_at <= ?"
+            params.append(time.time())
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM deliveries WHERE {clause} ORDER BY next_attempt_at, id", params
+            ).fetchall()
+        return [{**dict(row), "payload": json.loads(row["payload"])} for row in rows]
+
+    def next_attempt_at(self, run_id: Optional[str] = None) -> Optional[float]:
+        """Earliest scheduled attempt among pending deliveries (None if none are pending)."""
+        clause, params = self._pending_filter(run_id)
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT MIN(next_attempt_at) FROM deliveries WHERE {clause}", params
+            ).fetchone()
+        return row[0]
+
+    def retry_failed(self) -> int:
+        """Move failed deliveries back to pending with fresh attempts; returns how many."""
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE deliveries SET status = 'pending', attempts = 0, max_attempts = ?, "
+                "next_attempt_at = ?, updated_at = ? WHERE status = 'failed'",
+                (self.max_attempts, now, now)
+            )
+            return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """Number of deliveries per status."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM deliveries GROUP BY status"
+            ).fetchall()
+        return {status: count for status, count in rows}
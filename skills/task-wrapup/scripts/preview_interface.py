@@ -11,6 +11,11 @@ import sys
 from typing import Dict, List, Any, Optional
 
 
+def source_label(source: Dict[str, Any]) -> str:
+    """Source name, prefixed with its repository in --repos summaries."""
+    return f"{source['repo']}:{source['name']}" if source.get("repo") else source["name"]
+
+
 def format_summary_preview(summary: Dict[str, Any]) -> str:
     """Format summary for user preview."""
     lines = []
@@ -33,7 +38,13 @@ def format_summary_preview(summary: Dict[str, Any]) -> str:
 
     # Sources used
     if "sources_used" in summary:
-        lines.append(f"Sources: {', '.join(summary['sources_used'])}")
+        sources = [
+            f"{source_label(source)} ({source['elapsed_ms']} ms)" if isinstance(source, dict) else source
+            for source in summary["sources_used"]
+        ]
+        lines.append(f"Sources: {', '.join(sources)}")
+        for source in summary.get("sources_degraded", []):
+            lines.append(f"⚠️  {source_label(source)} skipped: {source['error']}")
         lines.append("")
 
     return "\n".join(lines)
@@ -164,6 +175,8 @@ def edit_summary(summary: Dict[str, Any]) -> Dict[str, Any]:
     new_concise = input("Concise summary: ").strip()
     if new_concise:
         summary["concise_summary"] = new_concise
+        # Packed channel variants are stale now; channels fall back to the edited text
+        summary.pop("channel_summaries", None)
 
     return summary
 
@@ -185,14 +198,15 @@ def customize_per_channel(summary: Dict[str, Any]) -> Dict[str, Any]:
         summary["email_summary"] = summary["full_summary"]
 
     # SMS content
+    sms_default = summary.get("channel_summaries", {}).get("sms", summary["concise_summary"])
     print("\nSMS content:")
-    print(summary["concise_summary"])
+    print(sms_default)
     print("\n[Press Enter to keep current, or type custom SMS content]")
     sms_content = input("SMS: ").strip()
     if sms_content:
         summary["sms_summary"] = sms_content
     else:
-        summary["sms_summary"] = summary["concise_summary"]
+        summary["sms_summary"] = sms_default
 
     # Slack content
     print("\nSlack content:")
@@ -205,14 +219,15 @@ def customize_per_channel(summary: Dict[str, Any]) -> Dict[str, Any]:
         summary["slack_summary"] = summary["full_summary"]
 
     # Worklog content
+    worklog_default = summary.get("channel_summaries", {}).get("worklog", summary["concise_summary"])
     print("\nWorklog description:")
-    print(summary["concise_summary"])
+    print(worklog_default)
     print("\n[Press Enter to keep current, or type custom worklog description]")
     worklog_content = input("Worklog: ").strip()
     if worklog_content:
         summary["worklog_summary"] = worklog_content
     else:
-        summary["worklog_summary"] = summary["concise_summary"]
+        summary["worklog_summary"] = worklog_default
 
     return summary
 
@@ -10,16 +10,24 @@ Intelligently generates work summaries from multiple sources:
 """
 
 import json
+import os
+import re
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from glob import glob
+from typing import Dict, Iterable, List, Any, Optional
 
 
-def run_command(cmd: List[str]) -> tuple[int, str, str]:
+def run_command(cmd: List[str], input_text: Optional[str] = None, timeout: float = 30) -> tuple[int, str, str]:
     """Run a shell command and return (returncode, stdout, stderr)."""
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, input=input_text)
         return result.returncode, result.stdout, result.stderr
     except subprocess.TimeoutExpired:
         return 1, "", "Command timed out"
@@ -27,153 +35,420 @@ def run_command(cmd: List[str]) -> tuple[int, str, str]:
         return 1, "", str(e)
 
 
-def get_git_commits_since_time(hours_ago: int = 12) -> List[Dict[str, str]]:
-    """Get git commits from the last N hours."""
-    try:
-        # Calculate time threshold
-        time_threshold = datetime.now() - timedelta(hours=hours_ago)
-        since_arg = time_threshold.strftime("%Y-%m-%d %H:%M:%S")
-
-        # Get commits
-        cmd = [
-            "git", "log",
-            f"--since={since_arg}",
-            "--pretty=format:%H|%s|%an|%ai",
-            "--no-merges"
-        ]
-
-        returncode, stdout, stderr = run_command(cmd)
-
-        if returncode != 0:
-            return []
-
-        commits = []
-        for line in stdout.strip().split("\n"):
-            if not line:
-                continue
+# Session state written by the task-start skill at the project root
+SESSION_STATE_FILE = ".task_session_state.json"
 
-            parts = line.split("|")
-            if len(parts) >= 4:
-                commits.append({
-                    "hash": parts[0][:8],
-                    "message": parts[1],
-                    "author": parts[2],
-                    "date": parts[3]
-                })
+# Time window used when no session state is available
+FALLBACK_HOURS = 12
 
-        return commits
+# Parsed-commit cache, relative to the project root
+COMMIT_CACHE_FILE = os.path.join(".claude", "task_wrapup_commit_cache.json")
+COMMIT_CACHE_VERSION = 1
+DEFAULT_CACHE_MAX_ENTRIES = 2000
+DEFAULT_CACHE_MAX_BYTES = 2 * 1024 * 1024
 
-    except Exception:
-        return []
+# Per-source time budgets in seconds (overridable via summary_generation.source_timeouts)
+DEFAULT_SOURCE_TIMEOUTS = {"git": 20, "todo_tasks": 5, "serena_memory": 5}
 
+# Length budget of concise_summary; channels use their own (sms.max_length, worklog.max_length)
+CONCISE_BUDGET = 300
 
-def get_changed_files() -> List[str]:
-    """Get list of files changed in recent commits."""
-    try:
-        cmd = ["git", "diff", "--name-only", "HEAD~5", "HEAD"]
-        returncode, stdout, stderr = run_command(cmd)
+# Token overlap at which two key points count as the same change
+DUPLICATE_SIMILARITY = 0.8
 
-        if returncode != 0:
-            return []
+# Sources that read a repository (run once per repo with --repos; the rest run once)
+REPO_SOURCES = ("git", "serena_memory")
 
-        return [f.strip() for f in stdout.strip().split("\n") if f.strip()]
+# Repositories summarized concurrently with --repos (summary_generation.repo_workers)
+DEFAULT_REPO_WORKERS = 4
 
-    except Exception:
-        return []
+# Claude Code TodoWrite lists
+TODOS_DIR = os.path.expanduser("~/.claude/todos")
 
+# Serena project memories, relative to the project root
+SERENA_MEMORIES_DIR = os.path.join(".serena", "memories")
 
-def get_file_stats() -> Dict[str, int]:
-    """Get statistics about file changes."""
-    try:
-        cmd = ["git", "diff", "--stat", "HEAD~5", "HEAD"]
-        returncode, stdout, stderr = run_command(cmd)
+# Separators for the single `git log` stream: one record per commit, one field per value
+RECORD_SEP = "\x1e"
+FIELD_SEP = "\x1f"
+GIT_LOG_FORMAT = f"--format={RECORD_SEP}%H{FIELD_SEP}%s{FIELD_SEP}%an{FIELD_SEP}%ai"
 
-        if returncode != 0:
-            return {"files_changed": 0, "insertions": 0, "deletions": 0}
+# "src/{old => new}/file.py" or "old.py => new.py" in --numstat rename lines
+_RENAME_BRACES = re.compile(r"\{[^{}]* => ([^{}]*)\}")
 
-        # Parse summary line like: "12 files changed, 543 insertions(+), 123 deletions(-)"
-        lines = stdout.strip().split("\n")
-        if not lines:
-            return {"files_changed": 0, "insertions": 0, "deletions": 0}
 
-        summary_line = lines[-1]
+def _numstat_path(path: str) -> str:
+    """Resolve a --numstat rename notation to the file's new path."""
+    if " => " not in path:
+        return path
+    if "{" in path:
+        return re.sub(r"//+", "/", _RENAME_BRACES.sub(r"\1", path))
+    return path.split(" => ", 1)[1]
 
-        stats = {"files_changed": 0, "insertions": 0, "deletions": 0}
 
-        if "file" in summary_line:
-            parts = summary_line.split(",")
-            for part in parts:
-                part = part.strip()
-                if "file" in part:
-                    stats["files_changed"] = int(part.split()[0])
-                elif "insertion" in part:
-                    stats["insertions"] = int(part.split()[0])
-                elif "deletion" in part:
-                    stats["deletions"] = int(part.split()[0])
+def parse_git_log_numstat(output: str) -> List[Dict[str, Any]]:
+    """
+    Parse `git log --numstat` output written with GIT_LOG_FORMAT.
 
-        return stats
+    Returns commits (newest first), each with a "files" list of
+    {"path", "insertions", "deletions"} (binary files count as 0/0).
+    """
+    commits = []
+    for record in output.split(RECORD_SEP):
+        lines = record.strip("\n").split("\n")
+        fields = lines[0].split(FIELD_SEP)
+        if len(fields) < 4:
+            continue
+
+        files = []
+        for line in lines[1:]:
+            parts = line.split("\t", 2)
+            if len(parts) != 3:
+                continue
+            insertions, deletions, path = parts
+            files.append({
+                "path": _numstat_path(path),
+                "insertions": int(insertions) if insertions.isdigit() else 0,
+                "deletions": int(deletions) if deletions.isdigit() else 0
+            })
+
+        commits.append({
+            "sha": fields[0],
+            "hash": fields[0][:8],
+            "message": fields[1],
+            "author": fields[2],
+            "date": fields[3],
+            "files": files
+        })
+    return commits
+
+
+def aggregate_file_changes(commits: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Fold per-commit numstat into per-file totals and overall stats.
 
-    except Exception:
-        return {"files_changed": 0, "insertions": 0, "deletions": 0}
+    Returns:
+        {"files": {path: {"insertions", "deletions"}}, "changed_files": [...],
+         "file_stats": {"files_changed", "insertions", "deletions"}}
+    """
+    files: Dict[str, Dict[str, int]] = {}
+    for commit in commits:
+        for change in commit.get("files", []):
+            totals = files.setdefault(change["path"], {"insertions": 0, "deletions": 0})
+            totals["insertions"] += change["insertions"]
+            totals["deletions"] += change["deletions"]
 
+    return {
+        "files": files,
+        # Most recently touched first
+        "changed_files": list(files),
+        "file_stats": {
+            "files_changed": len(files),
+            "insertions": sum(f["insertions"] for f in files.values()),
+            "deletions": sum(f["deletions"] for f in files.values())
+        }
+    }
 
-def extract_key_points_from_commits(commits: List[Dict[str, str]]) -> List[str]:
-    """Extract key points from commit messages."""
-    if not commits:
-        return []
 
-    key_points = []
+@lru_cache(maxsize=None)
+def repo_root(repo_path: str = ".") -> str:
+    """Top-level directory of the repository containing repo_path (repo_path if not a repo)."""
+    returncode, stdout, _ = run_command(["git", "-C", repo_path, "rev-parse", "--show-toplevel"])
+    return stdout.strip() if returncode == 0 and stdout.strip() else repo_path
 
-    for commit in commits:
-        message = commit["message"]
 
-        # Clean up common prefixes
-        message = message.replace("feat:", "").replace("fix:", "").replace("chore:", "")
-        message = message.replace("docs:", "").replace("refactor:", "").replace("test:", "")
-        message = message.strip()
+def load_session_state(repo_path: str = ".") -> Optional[Dict[str, Any]]:
+    """Load .task_session_state.json from the repository root (None if missing or invalid)."""
+    state_file = os.path.join(repo_root(repo_path), SESSION_STATE_FILE)
 
-        # Capitalize first letter
-        if message:
-            message = message[0].upper() + message[1:]
-            key_points.append(message)
+    try:
+        with open(state_file, 'r') as f:
+            state = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    return state if isinstance(state, dict) else None
+
+
+def hours_window(hours_ago: int = FALLBACK_HOURS) -> Dict[str, Any]:
+    """A plain "last N hours" window (used without session state)."""
+    since = (datetime.now() - timedelta(hours=hours_ago)).strftime("%Y-%m-%d %H:%M:%S")
+    return {"source": "time_window", "revision_range": None, "base": None, "since": since}
 
-    return key_points
 
+def session_start_timestamp(state: Optional[Dict[str, Any]]) -> float:
+    """Epoch seconds the session began (created_at, else FALLBACK_HOURS ago)."""
+    created_at = (state or {}).get("created_at")
+    if created_at:
+        try:
+            return datetime.fromisoformat(created_at.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            pass
+    return (datetime.now() - timedelta(hours=FALLBACK_HOURS)).timestamp()
 
-def generate_summary(config: Dict[str, Any], user_override: Optional[str] = None) -> Dict[str, Any]:
+
+def resolve_session_window(state: Optional[Dict[str, Any]] = None, repo_path: str = ".") -> Dict[str, Any]:
     """
-    Generate intelligent summary based on configuration and available sources.
+    Work out exactly which commits belong to the current task session.
 
-    Returns a dictionary with:
-    - full_summary: Complete detailed summary (for email, Slack)
-    - concise_summary: Brief version (for SMS, worklog)
-    - sources_used: List of sources that contributed to summary
-    - key_points: Bulleted list of accomplishments
+    In order of preference:
+    1. merge-base of the recorded `base_commit` and HEAD
+    2. merge-base of `parent_branch` and HEAD
+    3. commits since the session's `created_at`
+    4. the last FALLBACK_HOURS hours (no usable session state)
+
+    Returns:
+        {"source", "revision_range" ("<base>..HEAD" or None), "base", "since"}
     """
+    if state is None:
+        state = load_session_state(repo_path)
+    if not state:
+        return hours_window()
 
-    if user_override:
-        # User provided custom summary - use as-is
-        return {
-            "full_summary": user_override,
-            "concise_summary": user_override[:300] + "..." if len(user_override) > 300 else user_override,
-            "sources_used": ["user_input"],
-            "key_points": [user_override]
-        }
+    for source in ("base_commit", "parent_branch"):
+        ref = state.get(source)
+        if not ref:
+            continue
+        returncode, stdout, _ = run_command(["git", "-C", repo_path, "merge-base", ref, "HEAD"])
+        base = stdout.strip()
+        if returncode == 0 and base:
+            return {"source": source, "revision_range": f"{base}..HEAD", "base": base, "since": None}
 
-    sources_config = config.get("summary_generation", {}).get("sources", {})
-    intelligence = config.get("summary_generation", {}).get("intelligence", {})
+    if state.get("created_at"):
+        return {"source": "created_at", "revision_range": None, "base": None, "since": state["created_at"]}
+
+    return hours_window()
+
+
+class CommitCache:
+    """
+    On-disk cache of parsed commits (metadata, numstat, key point) keyed by SHA.
+
+    Commits are immutable, so entries never go stale; the least recently
+    used are evicted once the cache exceeds its entry or byte budget.
+    """
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+
+    @classmethod
+    def for_repo(cls, repo_path: str = ".", config: Optional[Dict[str, Any]] = None) -> Optional["CommitCache"]:
+        """Load the cache in the project's .claude dir (None if disabled in config)."""
+        cache_config = (config or {}).get("summary_generation", {}).get("cache", {})
+        if not cache_config.get("enabled", True):
+            return None
+
+        cache = cls(
+            os.path.join(repo_root(repo_path), COMMIT_CACHE_FILE),
+            cache_config.get("max_entries", DEFAULT_CACHE_MAX_ENTRIES),
+            cache_config.get("max_bytes", DEFAULT_CACHE_MAX_BYTES)
+        )
+        try:
+            with open(cache.path, 'r') as f:
+                data = json.load(f)
+            if data.get("version") == COMMIT_CACHE_VERSION:
+                cache.entries = data.get("commits", {})
+        except (OSError, json.JSONDecodeError, AttributeError):
+            pass
+        return cache
+
+    def get(self, sha: str) -> Optional[Dict[str, Any]]:
+        """Cached commit for a full SHA, marking it recently used.
+
+        A hit alone does not dirty the cache: recency is persisted the next
+        time a put or an eviction rewrites the file, so a fully warm run
+        writes nothing.
+        """
+        entry = self.entries.get(sha)
+        if entry is None:
+            return None
+        entry["last_used"] = time.time()
+        return entry["commit"]
+
+    def put(self, commit: Dict[str, Any]) -> None:
+        """Cache a parsed commit (with its key point)."""
+        commit.setdefault("key_point", commit_key_point(commit["message"]))
+        self.entries[commit["sha"]] = {"commit": commit, "last_used": time.time()}
+        self.dirty = True
+
+    def evict(self) -> None:
+        """Drop least recently used entries until within both budgets."""
+        ordered = sorted(self.entries, key=lambda sha: self.entries[sha]["last_used"], reverse=True)
+        kept, size = {}, 0
+        for sha in ordered[:self.max_entries]:
+            entry_size = len(json.dumps(self.entries[sha]))
+            if size + entry_size > self.max_bytes:
+                break
+            kept[sha] = self.entries[sha]
+            size += entry_size
+        if len(kept) != len(self.entries):
+            self.entries = kept
+            self.dirty = True
+
+    def save(self) -> None:
+        """Evict, then write the cache atomically (no-op if unchanged)."""
+        self.evict()
+        if not self.dirty:
+            return
+        try:
+            directory = os.path.dirname(self.path)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
+                json.dump({"version": COMMIT_CACHE_VERSION, "commits": self.entries}, f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError:
+            # A read-only checkout just means no caching
+            pass
+
+
+def _range_args(window: Dict[str, Any]) -> List[str]:
+    """git log / rev-list arguments selecting the window's commits."""
+    args = ["--no-merges"]
+    if window.get("since"):
+        args.append(f"--since={window['since']}")
+    # rev-list has no implicit HEAD, unlike log
+    args.append(window.get("revision_range") or "HEAD")
+    return args
+
+
+def collect_git_activity(
+    window: Optional[Dict[str, Any]] = None,
+    repo_path: str = ".",
+    cache: Optional[CommitCache] = None,
+    timeout: float = 30
+) -> Dict[str, Any]:
+    """
+    Collect commits, per-file stats and changed files with one git invocation.
+
+    Runs a single `git log --numstat` over the session window and derives
+    everything the summary needs from that stream. With a warm commit
+    cache, only the window's SHAs are listed (`git rev-list`, no diffs) and
+    numstat is read just for commits not cached yet; if that fails, the
+    uncached single pass is used instead.
+
+    Args:
+        window: Commit window from resolve_session_window() (resolved if omitted)
+        repo_path: Repository to read
+        cache: Parsed-commit cache to read from and fill
+        timeout: Per git invocation, in seconds
+
+    Returns:
+        {"available": bool, "window": {...}, "commits": [...], "files": {...},
+         "changed_files": [...], "file_stats": {...}}
+    """
+    if window is None:
+        window = resolve_session_window(repo_path=repo_path)
+
+    commits = None
+    if cache is not None and cache.entries:
+        returncode, stdout, stderr = run_command(
+            ["git", "-C", repo_path, "rev-list", *_range_args(window)], timeout=timeout
+        )
+        shas = stdout.split() if returncode == 0 else []
+        missing = [sha for sha in shas if sha not in cache.entries]
+        if missing:
+            rc, out, _ = run_command(
+                ["git", "-C", repo_path, "log", "--no-walk=unsorted", "--numstat", GIT_LOG_FORMAT, "--stdin"],
+                input_text="\n".join(missing) + "\n",
+                timeout=timeout
+            )
+            for commit in parse_git_log_numstat(out) if rc == 0 else []:
+                cache.put(commit)
+        # Any commit still missing (rev-list or the --stdin read failed) means
+        # the cached path can't answer; fall through to the uncached pass
+        if returncode == 0 and all(sha in cache.entries for sha in missing):
+            commits = [commit for commit in map(cache.get, shas) if commit is not None]
+
+    if commits is None:
+        cmd = ["git", "-C", repo_path, "log", "--numstat", GIT_LOG_FORMAT, *_range_args(window)]
+        returncode, stdout, stderr = run_command(cmd, timeout=timeout)
+        commits = parse_git_log_numstat(stdout) if returncode == 0 else []
+        if cache is not None:
+            for commit in commits:
+                cache.put(commit)
+
+    if cache is not None:
+        cache.save()
+
+    return {
+        "available": returncode == 0,
+        "window": window,
+        "commits": commits,
+        **aggregate_file_changes(commits)
+    }
+
+
+def get_git_commits_since_time(hours_ago: int = FALLBACK_HOURS) -> List[Dict[str, str]]:
+    """Get git commits from the last N hours."""
+    return collect_git_activity(hours_window(hours_ago))["commits"]
+
+
+def get_changed_files(window: Optional[Dict[str, Any]] = None) -> List[str]:
+    """Get list of files changed in the session's commits."""
+    return collect_git_activity(window)["changed_files"]
+
+
+def get_file_stats(window: Optional[Dict[str, Any]] = None) -> Dict[str, int]:
+    """Get statistics about file changes in the session's commits."""
+    return collect_git_activity(window)["file_stats"]
+
+
+def commit_key_point(message: str) -> str:
+    """Turn one commit subject into a key point ("" if nothing is left)."""
+    # Clean up common prefixes
+    message = message.replace("feat:", "").replace("fix:", "").replace("chore:", "")
+    message = message.replace("docs:", "").replace("refactor:", "").replace("test:", "")
+    message = message.strip()
+
+    # Capitalize first letter
+    return message[0].upper() + message[1:] if message else ""
+
+
+def extract_weighted_points(commits: List[Dict[str, Any]]) -> List[tuple[str, int]]:
+    """Key points from commit messages, each with its diff weight (lines added + deleted)."""
+    weighted = []
+
+    for commit in commits:
+        # Cached commits carry their key point already
+        point = commit.get("key_point")
+        if point is None:
+            point = commit_key_point(commit["message"])
+        if point:
+            weight = sum(f["insertions"] + f["deletions"] for f in commit.get("files", []))
+            weighted.append((point, weight))
+
+    return weighted
+
+
+def extract_key_points_from_commits(commits: List[Dict[str, str]]) -> List[str]:
+    """Extract key points from commit messages."""
+    return [point for point, _ in extract_weighted_points(commits)]
 
-    key_points = []
-    sources_used = []
-    sections = {}
+
+def git_source(context: Dict[str, Any]) -> Dict[str, Any]:
+    """Commits, file stats and changed files from one git pass."""
+    sources_config = context["sources_config"]
+    cache = CommitCache.for_repo(context["repo_path"], context["config"])
+    activity = collect_git_activity(context["window"], context["repo_path"], cache, context["timeout"])
+
+    used, key_points, weights, sections = [], [], [], {}
 
     # 1. Git commits
     if sources_config.get("git_commits", True):
-        commits = get_git_commits_since_time(12)
+        commits = activity["commits"]
         if commits:
-            sources_used.append("git_commits")
-            commit_points = extract_key_points_from_commits(commits)
+            used.append("git_commits")
+            weighted = extract_weighted_points(commits)
+            commit_points = [point for point, _ in weighted]
             key_points.extend(commit_points)
+            weights.extend(weight for _, weight in weighted)
             sections["commits"] = {
                 "title": "Code Changes",
                 "points": commit_points,
@@ -182,25 +457,266 @@ def generate_summary(config: Dict[str, Any], user_override: Optional[str] = None
 
     # 2. File statistics
     if sources_config.get("file_changes", True):
-        stats = get_file_stats()
+        stats = activity["file_stats"]
         if stats["files_changed"] > 0:
-            sources_used.append("file_changes")
+            used.append("file_changes")
             sections["files"] = stats
 
     # 3. Changed files list (for detail)
-    changed_files = get_changed_files()
+    changed_files = activity["changed_files"]
     if changed_files:
         sections["changed_files"] = changed_files[:10]  # Limit to first 10
 
-    # Generate full summary
+    sections["git_window"] = activity["window"]
+
+    return {"used": used, "key_points": key_points, "weights": weights, "sections": sections}
+
+
+def todo_source(context: Dict[str, Any]) -> Dict[str, Any]:
+    """Completed TodoWrite tasks from todo lists updated during the session."""
+    points = []
+    for path in glob(os.path.join(TODOS_DIR, "*.json")):
+        try:
+            if os.path.getmtime(path) < context["session_start"]:
+                continue
+            with open(path, 'r') as f:
+                todos = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+
+        for todo in todos if isinstance(todos, list) else []:
+            # Skip malformed items (null, strings, non-text content) instead of failing the source
+            if not isinstance(todo, dict) or not isinstance(todo.get("content"), str):
+                continue
+            content = todo["content"].strip()
+            if todo.get("status") == "completed" and content and content not in points:
+                points.append(content)
+
+    if not points:
+        return {"used": [], "key_points": [], "sections": {}}
+    return {
+        "used": ["todo_tasks"],
+        "key_points": points,
+        "sections": {"todos": {"title": "Completed Tasks", "points": points, "count": len(points)}}
+    }
+
+
+def serena_memory_source(context: Dict[str, Any]) -> Dict[str, Any]:
+    """Names of Serena memories written or updated during the session."""
+    directory = os.path.join(repo_root(context["repo_path"]), SERENA_MEMORIES_DIR)
+    memories = []
+    for path in sorted(glob(os.path.join(directory, "*.md"))):
+        try:
+            if os.path.getmtime(path) >= context["session_start"]:
+                memories.append(os.path.splitext(os.path.basename(path))[0])
+        except OSError:
+            continue
+
+    if not memories:
+        return {"used": [], "key_points": [], "sections": {}}
+    return {"used": ["serena_memory"], "key_points": [], "sections": {"memories": memories}}
+
+
+# Summary source plugins: name -> (config source flags that enable it, collector)
+SUMMARY_SOURCES = {
+    "git": (("git_commits", "file_changes"), git_source),
+    "todo_tasks": (("todo_tasks",), todo_source),
+    "serena_memory": (("serena_memory",), serena_memory_source),
+}
+
+
+def run_summary_sources(
+    config: Dict[str, Any],
+    repo_path: str = ".",
+    names: Optional[Iterable[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Run every enabled summary source concurrently, each within its own time budget.
+
+    Sources run on daemon threads, so one that overruns its budget is
+    reported as timed out and abandoned without holding up the others
+    (or process exit).
+
+    Args:
+        config: Skill configuration
+        repo_path: Repository the sources read
+        names: Restrict to these sources (default: all registered)
+
+    Returns:
+        One {"name", "status" ("ok"/"timeout"/"error"), "elapsed_ms",
+        "result" or "error"} per enabled source, in registry order
+    """
+    summary_config = config.get("summary_generation", {})
+    sources_config = summary_config.get("sources", {})
+    timeouts = {**DEFAULT_SOURCE_TIMEOUTS, **summary_config.get("source_timeouts", {})}
+
+    state = load_session_state(repo_path)
+    context = {
+        "config": config,
+        "sources_config": sources_config,
+        "repo_path": repo_path,
+        "window": resolve_session_window(state, repo_path),
+        "session_start": session_start_timestamp(state)
+    }
+
+    def run(source: Dict[str, Any], collector, timeout: float) -> None:
+        started = time.monotonic()
+        try:
+            source["result"] = collector({**context, "timeout": timeout})
+        except Exception as e:
+            source["error"] = str(e)
+        source["elapsed"] = time.monotonic() - started
+
+    started = time.monotonic()
+    pending = []
+    for name, (flags, collector) in SUMMARY_SOURCES.items():
+        if names is not None and name not in names:
+            continue
+        if not any(sources_config.get(flag, True) for flag in flags):
+            continue
+        timeout = timeouts.get(name, DEFAULT_SOURCE_TIMEOUTS.get(name, 10))
+        source = {}
+        thread = threading.Thread(target=run, args=(source, collector, timeout),
+                                  name=f"summary-source-{name}", daemon=True)
+        thread.start()
+        pending.append((name, thread, source, timeout))
+
+    runs = []
+    for name, thread, source, timeout in pending:
+        thread.join(max(0.0, started + timeout - time.monotonic()))
+        if thread.is_alive():
+            runs.append({"name": name, "status": "timeout", "elapsed_ms": round(timeout * 1000),
+                         "error": f"Timed out after {timeout}s"})
+        elif "error" in source:
+            runs.append({"name": name, "status": "error", "elapsed_ms": round(source["elapsed"] * 1000),
+                         "error": source["error"]})
+        else:
+            runs.append({"name": name, "status": "ok", "elapsed_ms": round(source["elapsed"] * 1000),
+                         "result": source["result"]})
+    return runs
+
+
+def merge_source_runs(runs: List[Dict[str, Any]], repo: Optional[str] = None) -> Dict[str, Any]:
+    """Fold source runs (in order) into key points, sections and used/degraded lists."""
+    merged = {"key_points": [], "weights": [], "sections": {}, "sources_used": [], "sources_degraded": []}
+    for run in runs:
+        label = {"repo": repo} if repo else {}
+        if run["status"] != "ok":
+            merged["sources_degraded"].append({**label, **{k: v for k, v in run.items() if k != "result"}})
+            continue
+        result = run["result"]
+        merged["key_points"].extend(result["key_points"])
+        # Points without a diff weight (e.g. completed tasks) are ranked by compact_summaries
+        merged["weights"].extend(result.get("weights") or [None] * len(result["key_points"]))
+        merged["sections"].update(result["sections"])
+        for name in result["used"]:
+            merged["sources_used"].append({**label, "name": name, "elapsed_ms": run["elapsed_ms"]})
+    return merged
+
+
+def summarize_repo(config: Dict[str, Any], repo_path: str) -> List[Dict[str, Any]]:
+    """Run the repository-scoped sources for one repo or worktree."""
+    if not os.path.isdir(repo_path):
+        raise ValueError(f"No such directory: {repo_path}")
+    returncode, _, stderr = run_command(["git", "-C", repo_path, "rev-parse", "--show-toplevel"])
+    if returncode != 0:
+        raise ValueError(stderr.strip() or f"Not a git repository: {repo_path}")
+    return run_summary_sources(config, repo_path, REPO_SOURCES)
+
+
+def repo_labels(repo_paths: List[str]) -> List[str]:
+    """Short display names for repos (directory name, full path when names collide)."""
+    names = [os.path.basename(os.path.abspath(path)) for path in repo_paths]
+    return [
+        name if names.count(name) == 1 else os.path.abspath(path)
+        for name, path in zip(names, repo_paths)
+    ]
+
+
+def summarize_repos(config: Dict[str, Any], repo_paths: List[str]) -> Dict[str, Any]:
+    """
+    Summarize several repositories/worktrees into one merged result.
+
+    Repositories are collected in parallel on a bounded worker pool
+    (summary_generation.repo_workers); each repo's sources keep their own
+    time budgets, so a slow or broken repo is reported as degraded without
+    holding up the rest. Session-wide sources (TodoWrite tasks) run once.
+
+    Returns:
+        Merged key points (prefixed with the repo name), sections with a
+        per-repo "repos" list and combined file stats, and used/degraded lists
+    """
+    # Worktrees and subdirectories of the same checkout collapse to one root
+    roots = list(dict.fromkeys(repo_root(path) for path in repo_paths))
+    labels = repo_labels(roots)
+    workers = config.get("summary_generation", {}).get("repo_workers", DEFAULT_REPO_WORKERS)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(roots)))) as pool:
+        futures = [pool.submit(summarize_repo, config, root) for root in roots]
+        session_names = [name for name in SUMMARY_SOURCES if name not in REPO_SOURCES]
+        session = merge_source_runs(run_summary_sources(config, roots[0], session_names))
+
+        merged = {"key_points": [], "weights": [], "sections": {}, "sources_used": [], "sources_degraded": []}
+        repos = []
+        totals = {"files_changed": 0, "insertions": 0, "deletions": 0}
+        for label, root, future in zip(labels, roots, futures):
+            try:
+                result = merge_source_runs(future.result(), label)
+            except Exception as e:
+                merged["sources_degraded"].append({"repo": label, "name": "repo", "status": "error",
+                                                   "elapsed_ms": 0, "error": str(e)})
+                continue
+
+            merged["key_points"].extend(f"[{label}] {point}" for point in result["key_points"])
+            merged["weights"].extend(result["weights"])
+            merged["sources_used"].extend(result["sources_used"])
+            merged["sources_degraded"].extend(result["sources_degraded"])
+            repos.append({"name": label, "path": root, **result})
+            for key in totals:
+                totals[key] += result["sections"].get("files", {}).get(key, 0)
+
+    merged["key_points"].extend(session["key_points"])
+    merged["weights"].extend(session["weights"])
+    merged["sources_used"].extend(session["sources_used"])
+    merged["sources_degraded"].extend(session["sources_degraded"])
+    merged["sections"] = {**session["sections"], "repos": repos}
+    if totals["files_changed"]:
+        merged["sections"]["files"] = totals
+    return merged
+
+
+def format_full_summary(sections: Dict[str, Any]) -> str:
+    """Detailed summary text (email, Slack) from collected sections."""
     full_summary_parts = []
 
+    # --repos: one block per repository, then the session-wide sections
+    if "repos" in sections:
+        for repo in sections["repos"]:
+            if full_summary_parts:
+                full_summary_parts.append("")
+            full_summary_parts.append(f"[{repo['name']}]")
+            if "commits" in repo["sections"] or "files" in repo["sections"]:
+                full_summary_parts.append(format_full_summary(repo["sections"]))
+            else:
+                full_summary_parts.append("No changes this session")
+        if "todos" in sections:
+            full_summary_parts.append("")
+            full_summary_parts.append(format_full_summary({"todos": sections["todos"]}))
+        return "\n".join(full_summary_parts) if full_summary_parts else "Work session completed"
+
     if "commits" in sections:
         commit_section = sections["commits"]
         full_summary_parts.append(f"Session Accomplishments:")
         for point in commit_section["points"]:
             full_summary_parts.append(f"• {point}")
 
+    if "todos" in sections:
+        if full_summary_parts:
+            full_summary_parts.append("")
+        full_summary_parts.append("Completed Tasks:")
+        for point in sections["todos"]["points"]:
+            full_summary_parts.append(f"• {point}")
+
     if "files" in sections:
         stats = sections["files"]
         full_summary_parts.append(f"\nFiles Modified: {stats['files_changed']} files changed")
@@ -209,31 +725,187 @@ def generate_summary(config: Dict[str, Any], user_override: Optional[str] = None
                 f"({stats.get('insertions', 0)} insertions, {stats.get('deletions', 0)} deletions)"
             )
 
-    # Generate concise summary (for SMS and worklog)
-    concise_parts = []
-    if key_points:
-        # Take top 3 most important points
-        top_points = key_points[:3]
-        concise_parts.append(", ".join(top_points))
+    if "memories" in sections:
+        full_summary_parts.append(f"\nSession Notes: {', '.join(sections['memories'])}")
+
+    return "\n".join(full_summary_parts) if full_summary_parts else "Work session completed"
+
+
+def _point_tokens(point: str) -> frozenset:
+    return frozenset(re.findall(r"[a-z0-9]+", point.lower()))
 
-        if "files" in sections:
-            stats = sections["files"]
-            concise_parts.append(f"({stats['files_changed']} files)")
 
-    full_summary = "\n".join(full_summary_parts) if full_summary_parts else "Work session completed"
-    concise_summary = ". ".join(concise_parts) if concise_parts else "Work session completed"
+def rank_key_points(key_points: List[str], weights: List[Optional[int]]) -> List[str]:
+    """
+    Merge near-identical points and order them by diff weight.
+
+    Points whose token sets overlap by DUPLICATE_SIMILARITY or more
+    (Jaccard) are one change: the first wording is kept and the weights
+    add up. Points without a weight count as an average weighted point.
+    Ties keep their original (newest first) order.
+    """
+    known = [w for w in weights if w is not None]
+    default_weight = sum(known) / len(known) if known else 1
+
+    kept: List[List[Any]] = []  # [point, tokens, weight, first index]
+    by_text: Dict[frozenset, List[Any]] = {}
+    for index, (point, weight) in enumerate(zip(key_points, weights)):
+        weight = default_weight if weight is None else weight
+        tokens = _point_tokens(point)
+        match = by_text.get(tokens)
+        if match is None and tokens:
+            for candidate in kept:
+                union = len(tokens | candidate[1])
+                if union and len(tokens & candidate[1]) / union >= DUPLICATE_SIMILARITY:
+                    match = candidate
+                    break
+        if match is not None:
+            match[2] += weight
+            continue
+        item = [point, tokens, weight, index]
+        kept.append(item)
+        by_text[tokens] = item
+
+    kept.sort(key=lambda item: (-item[2], item[3]))
+    return [item[0] for item in kept]
+
+
+def _measure(text: str, unit: str) -> int:
+    return len(text.encode("utf-8")) if unit == "bytes" else len(text)
+
+
+def truncate_to_budget(text: str, limit: int, unit: str = "chars") -> str:
+    """Cut text to fit the budget at a word boundary, marked with "..."."""
+    if _measure(text, unit) <= limit:
+        return text
+    # Longer prefixes can't fit in either unit (a character is at least one byte)
+    cut = text[:limit]
+    while cut and _measure(cut + "...", unit) > limit:
+        cut = cut[:-1]
+    if " " in cut:
+        cut = cut[:cut.rfind(" ")]
+    return cut.rstrip(" ,.;:") + "..."
+
+
+def pack_points(ranked_points: List[str], limit: int, unit: str = "chars", suffix: str = "") -> str:
+    """
+    Greedily pack ranked points into a length budget.
+
+    The best point always leads: it is truncated at a word boundary only
+    if it cannot fit on its own, and the suffix is dropped rather than
+    displacing it. The remaining points are added best first, skipping
+    any that don't fit in favour of smaller ones, so nothing else is cut
+    mid-word.
+
+    Args:
+        ranked_points: Points, most important first
+        limit: Budget in characters or UTF-8 bytes
+        unit: "chars" or "bytes"
+        suffix: Trailer kept when it fits (e.g. "(12 files)")
+    """
+    if not ranked_points:
+        return truncate_to_budget("Work session completed", limit, unit)
+
+    best = ranked_points[0]
+    if _measure(best, unit) > limit:
+        return truncate_to_budget(best, limit, unit)
+
+    trailer = f". {suffix}" if suffix else ""
+    if _measure(best + trailer, unit) > limit:
+        trailer = ""
+
+    packed = [best]
+    used = _measure(best + trailer, unit)
+    for point in ranked_points[1:]:
+        cost = _measure(point, unit) + 2
+        if used + cost <= limit:
+            packed.append(point)
+            used += cost
+    return ", ".join(packed) + trailer
+
+
+def channel_budgets(config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Length budget ({"limit", "unit"}) of every compacted summary variant."""
+    sms_config = config.get("communication", {}).get("sms", {})
+    worklog_config = config.get("worklog", {})
+    return {
+        "concise": {"limit": CONCISE_BUDGET, "unit": "chars"},
+        "sms": {"limit": sms_config.get("max_length", 320), "unit": sms_config.get("length_unit", "chars")},
+        "worklog": {"limit": worklog_config.get("max_length", CONCISE_BUDGET),
+                    "unit": worklog_config.get("length_unit", "chars")}
+    }
 
-    # Ensure concise fits in reasonable SMS length
-    if len(concise_summary) > 300:
-        concise_summary = concise_summary[:297] + "..."
 
+def compact_summaries(
+    key_points: List[str],
+    weights: List[Optional[int]],
+    sections: Dict[str, Any],
+    budgets: Dict[str, Dict[str, Any]]
+) -> Dict[str, str]:
+    """Rank and deduplicate key points once, then pack them into every budget."""
+    ranked = rank_key_points(key_points, weights)
+    suffix = f"({sections['files']['files_changed']} files)" if "files" in sections else ""
     return {
-        "full_summary": full_summary,
-        "concise_summary": concise_summary,
+        name: pack_points(ranked, budget["limit"], budget.get("unit", "chars"), suffix)
+        for name, budget in budgets.items()
+    }
+
+
+def generate_summary(
+    config: Dict[str, Any],
+    user_override: Optional[str] = None,
+    repo_paths: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Generate intelligent summary based on configuration and available sources.
+
+    With repo_paths, every repository/worktree is summarized (in parallel)
+    into one summary with per-repo sections; otherwise the current directory.
+
+    Returns a dictionary with:
+    - full_summary: Complete detailed summary (for email, Slack)
+    - concise_summary: Brief version (CONCISE_BUDGET characters)
+    - channel_summaries: Brief versions packed into the SMS and worklog budgets
+    - sources_used: Sources that contributed, each {"name", "elapsed_ms"}
+    - sources_degraded: Sources that timed out or failed (if any)
+    - key_points: Bulleted list of accomplishments
+    """
+
+    budgets = channel_budgets(config)
+
+    if user_override:
+        # User provided custom summary - use as-is
+        compacted = compact_summaries([user_override], [None], {}, budgets)
+        return {
+            "full_summary": user_override,
+            "concise_summary": compacted.pop("concise"),
+            "channel_summaries": compacted,
+            "sources_used": [{"name": "user_input", "elapsed_ms": 0}],
+            "key_points": [user_override]
+        }
+
+    # Sources run concurrently; results are merged in registry order
+    if repo_paths:
+        merged = summarize_repos(config, repo_paths)
+    else:
+        merged = merge_source_runs(run_summary_sources(config))
+    key_points = merged["key_points"]
+    sections = merged["sections"]
+    sources_used = merged["sources_used"]
+    sources_degraded = merged["sources_degraded"]
+    compacted = compact_summaries(key_points, merged["weights"], sections, budgets)
+
+    summary = {
+        "full_summary": format_full_summary(sections),
+        "concise_summary": compacted.pop("concise"),
+        "channel_summaries": compacted,
         "sources_used": sources_used,
         "key_points": key_points,
         "sections": sections
     }
+    if sources_degraded:
+        summary["sources_degraded"] = sources_degraded
+    return summary
 
 
 def main():
@@ -245,6 +917,8 @@ def main():
     parser.add_argument("--user-input", help="User-provided summary override")
     parser.add_argument("--format", choices=["full", "concise", "json"], default="json",
                        help="Output format")
+    parser.add_argument("--repos", nargs="+", metavar="PATH",
+                       help="Summarize several repositories/worktrees into one summary")
 
     args = parser.parse_args()
 
@@ -261,7 +935,7 @@ def main():
         sys.exit(1)
 
     # Generate summary
-    summary = generate_summary(config, args.user_input)
+    summary = generate_summary(config, args.user_input, args.repos)
 
     if args.format == "full":
         print(summary["full_summary"])
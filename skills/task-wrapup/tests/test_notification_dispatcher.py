@@ -0,0 +1,77 @@
+"""Tests for the notification dispatcher."""
+
+import asyncio
+import copy
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from config_manager import DEFAULT_CONFIG  # noqa: E402
+from notification_dispatcher import (  # noqa: E402
+    CANCELLED_REASON, CHANNEL_SECTIONS, DispatchLimits, dispatch_notifications, send_recorded
+)
+from notification_outbox import Outbox  # noqa: E402
+
+SUMMARY = {"full_summary": "Shipped billing", "concise_summary": "Shipped billing", "key_points": []}
+
+
+def quiet_config() -> dict:
+    """Default config with every built-in channel disabled."""
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    for keys in CHANNEL_SECTIONS.values():
+        section = config
+        for key in keys:
+            section = section[key]
+        section["enabled"] = False
+    return config
+
+
+class SlowExtension:
+    def execute(self, summary):
+        time.sleep(2)
+        return {"status": "success"}
+
+
+class AsyncEngineTimeoutTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir)
+
+    def test_hung_thread_channel_does_not_hold_dispatch(self):
+        config = quiet_config()
+        config["execution"]["channel_timeout_seconds"] = 0.2
+
+        started = time.monotonic()
+        results = dispatch_notifications(SUMMARY, config, extensions={"slow": SlowExtension()})
+
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(results["slow"]["status"], "error")
+        self.assertIn("Timed out", results["slow"]["reason"])
+
+    def test_cancelled_send_is_recorded_as_failed_attempt(self):
+        outbox = Outbox(str(self.dir / "outbox.db"), max_retries=2, retry_delay=60)
+        self.addCleanup(outbox.close)
+        cmd = ["sleep", "5"]
+        delivery_id = outbox.enqueue("worklog", "Acme", {"cmd": cmd})
+
+        async def send():
+            limits = DispatchLimits(quiet_config())
+            await asyncio.wait_for(send_recorded(outbox, delivery_id, limits, "worklog", cmd), 0.2)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(send())
+
+        row = outbox.due(ignore_schedule=True)[0]
+        self.assertEqual(row["attempts"], 1)
+        self.assertEqual(row["last_error"], CANCELLED_REASON)
+        self.assertGreater(row["next_attempt_at"], time.time())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Tests for the notification outbox."""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from notification_dispatcher import dispatch_notifications, drain_outbox  # noqa: E402
+from notification_outbox import Outbox, backoff_delay  # noqa: E402
+from test_notification_dispatcher import SUMMARY, quiet_config  # noqa: E402
+
+NOW = 1000.0
+
+
+class OutboxTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = str(self.dir / "outbox.db")
+
+    def outbox(self, **options) -> Outbox:
+        """Open the test outbox; each call is a separate run, like a new process."""
+        outbox = Outbox(self.path, **options)
+        self.addCleanup(outbox.close)
+        return outbox
+
+
+class IdempotencyTest(OutboxTestCase):
+
+    def test_duplicate_key_is_skipped(self):
+        first = self.outbox(session="s1")
+        delivery_id = first.enqueue("sms", "+15550100", {"cmd": ["true"]})
+        self.assertIsNotNone(delivery_id)
+        # In flight in this run
+        self.assertIsNone(first.enqueue("sms", "+15550100", {"cmd": ["true"]}))
+
+        first.record(delivery_id, True)
+        self.assertIsNone(self.outbox(session="s1").enqueue("sms", "+15550100", {"cmd": ["true"]}))
+        self.assertIsNotNone(self.outbox(session="s2").enqueue("sms", "+15550100", {"cmd": ["true"]}))
+
+    def test_rerun_dispatch_reports_deduplicated(self):
+        config = quiet_config()
+        config["project_name"] = "Acme Corp"
+        config["worklog"].update(enabled=True, default_duration_minutes=60)
+
+        async def succeed(cmd, timeout=60):
+            return 0, "", ""
+
+        with mock.patch("notification_dispatcher.run_command_async", side_effect=succeed) as send:
+            first = dispatch_notifications(SUMMARY, config, outbox=self.outbox(session="s1"))
+            again = dispatch_notifications(SUMMARY, config, outbox=self.outbox(session="s1"))
+
+        self.assertEqual(first["worklog"]["status"], "success")
+        self.assertEqual(again["worklog"]["status"], "deduplicated")
+        self.assertEqual(send.call_count, 1)
+
+    def test_unsent_row_is_reused_by_a_later_run(self):
+        first = self.outbox(max_retries=0)
+        delivery_id = first.enqueue("worklog", "Acme", {"cmd": ["false"]})
+        self.assertEqual(first.record(delivery_id, False, "boom"), "failed")
+
+        rerun = self.outbox(max_retries=0)
+        self.assertEqual(rerun.enqueue("worklog", "Acme", {"cmd": ["false"]}), delivery_id)
+        row = rerun.due()[0]
+        self.assertEqual((row["id"], row["status"], row["attempts"], row["max_attempts"]),
+                         (delivery_id, "pending", 1, 2))
+        self.assertEqual(rerun.counts(), {"pending": 1})
+
+
+class BackoffTest(OutboxTestCase):
+
+    def test_failed_row_is_retried_with_growing_next_attempt_at(self):
+        outbox = self.outbox(max_retries=3, retry_delay=10, max_retry_delay=300)
+        with mock.patch("notification_outbox.time.time", return_value=NOW), \
+                mock.patch("notification_outbox.random.uniform", return_value=0.0):
+            delivery_id = outbox.enqueue("sms", "+15550100", {"cmd": ["false"]})
+            delays = []
+            for _ in range(3):
+                self.assertEqual(outbox.record(delivery_id, False, "busy"), "pending")
+                delays.append(outbox.next_attempt_at() - NOW)
+            self.assertEqual(outbox.record(delivery_id, False, "busy"), "failed")
+
+        # Equal jitter with no random part: half of 10, 20, 40
+        self.assertEqual(delays, [5.0, 10.0, 20.0])
+        self.assertIsNone(outbox.next_attempt_at())
+
+    def test_jitter_stays_within_half_of_the_capped_delay(self):
+        for attempts, delay in ((1, 10), (3, 40), (10, 300)):
+            for _ in range(50):
+                self.assertTrue(delay / 2 <= backoff_delay(attempts, 10, 300) <= delay)
+
+
+class DrainTest(OutboxTestCase):
+
+    def test_pending_row_left_by_crashed_run_is_drained(self):
+        crashed = self.outbox()
+        delivery_id = crashed.enqueue("worklog", "Acme", {"cmd": ["true"]})
+        crashed.close()  # Never recorded an outcome
+
+        outbox = self.outbox()
+        attempts = drain_outbox(outbox, wait=False)
+
+        self.assertEqual([(a["id"], a["attempt"], a["status"]) for a in attempts], [(delivery_id, 1, "sent")])
+        self.assertEqual(outbox.counts(), {"sent": 1})
+
+    def test_drain_waits_for_scheduled_retries(self):
+        outbox = self.outbox(max_retries=1, retry_delay=0.05)
+        outbox.enqueue("worklog", "Acme", {"cmd": ["false"]})
+
+        attempts = drain_outbox(outbox)
+
+        self.assertEqual([(a["attempt"], a["status"]) for a in attempts], [(1, "pending"), (2, "failed")])
+        self.assertEqual(outbox.counts(), {"failed": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Tests for the summary generator's git collection and commit cache."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import summary_generator  # noqa: E402
+from summary_generator import CommitCache, collect_git_activity, hours_window  # noqa: E402
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "Test", "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "Test", "GIT_COMMITTER_EMAIL": "test@example.com",
+}
+
+
+class GitActivityTest(unittest.TestCase):
+
+    def setUp(self):
+        self.repo = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.repo)
+        self.git("init", "-q")
+        self.cache_path = os.path.join(self.repo, summary_generator.COMMIT_CACHE_FILE)
+
+    def git(self, *args: str) -> None:
+        subprocess.run(["git", "-C", self.repo, *args], check=True, capture_output=True,
+                       env={**os.environ, **GIT_ENV})
+
+    def commit(self, name: str, message: str) -> None:
+        Path(self.repo, name).write_text(f"{name}\n")
+        self.git("add", name)
+        self.git("commit", "-q", "-m", message)
+
+    def collect(self) -> dict:
+        return collect_git_activity(hours_window(1), self.repo, CommitCache.for_repo(self.repo))
+
+    def test_warm_run_does_not_rewrite_cache(self):
+        self.commit("a.txt", "feat: first")
+        self.collect()
+        written = os.stat(self.cache_path).st_mtime_ns
+
+        with mock.patch.object(CommitCache, "save", autospec=True,
+                               side_effect=CommitCache.save) as save:
+            activity = self.collect()
+            cache = save.call_args[0][0]
+
+        self.assertEqual([c["message"] for c in activity["commits"]], ["feat: first"])
+        self.assertFalse(cache.dirty)
+        self.assertEqual(os.stat(self.cache_path).st_mtime_ns, written)
+
+    def test_failed_stdin_read_falls_back_to_full_log(self):
+        self.commit("a.txt", "feat: first")
+        self.collect()
+        self.commit("b.txt", "feat: second")
+
+        run_command = summary_generator.run_command
+
+        def stdin_fails(cmd, input_text=None, timeout=30):
+            if "--stdin" in cmd:
+                return 128, "", "fatal: bad revision"
+            return run_command(cmd, input_text, timeout)
+
+        with mock.patch("summary_generator.run_command", side_effect=stdin_fails):
+            activity = self.collect()
+
+        self.assertTrue(activity["available"])
+        self.assertEqual([c["message"] for c in activity["commits"]], ["feat: second", "feat: first"])
+        self.assertEqual(sorted(activity["changed_files"]), ["a.txt", "b.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Worklog Analytics - Columnar in-memory view of worklog entries for reports
+
+Entries are loaded once into parallel array-backed columns instead of one
+dict per entry:
+
+- hours, rate: array('d') (rate is 0 for non-hourly clients)
+- client, date: array('I') codes into small dictionaries of distinct
+  client names and dates
+
+Group-bys accumulate into per-code arrays indexed by those codes, so
+string work (parsing dates into ISO weeks, formatting) happens once per
+distinct value rather than once per entry.
+"""
+
+from array import array
+from datetime import date as Date
+from typing import Dict, Iterable, List, Optional
+
+# Default billable capacity used for weekly utilization
+DEFAULT_WEEKLY_CAPACITY = 40.0
+
+
+class EntryColumns:
+    """Worklog entries as dictionary-encoded, array-backed columns."""
+
+    def __init__(self):
+        self.hours = array('d')
+        self.rate = array('d')
+        self.client_code = array('I')
+        self.date_code = array('I')
+        # Code -> value dictionaries and their reverse lookups
+        self.clients: List[str] = []
+        self.dates: List[str] = []
+        self._client_index: Dict[str, int] = {}
+        self._date_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.hours)
+
+    @staticmethod
+    def _encode(value: str, values: List[str], index: Dict[str, int]) -> int:
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(values)
+            values.append(value)
+        return code
+
+    def append(self, entry: Dict) -> None:
+        """Encode one entry into the columns."""
+        self.hours.append(entry["hours"])
+        self.rate.append(entry.get("hourly_rate") or 0.0)
+        self.client_code.append(self._encode(entry["client"], self.clients, self._client_index))
+        self.date_code.append(self._encode(entry["date"], self.dates, self._date_index))
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Dict]) -> "EntryColumns":
+        """Build columns from a stream of entries (entries are not retained)."""
+        columns = cls()
+        for entry in entries:
+            columns.append(entry)
+        return columns
+
+    def _sum_by(self, codes: array, size: int, weights: Optional[array] = None) -> array:
+        """Sum hours (or hours * weights) into a per-code array of length `size`."""
+        sums = array('d', bytes(8 * size))
+        if weights is None:
+            for code, hours in zip(codes, self.hours):
+                sums[code] += hours
+        else:
+            for code, hours, weight in zip(codes, self.hours, weights):
+                sums[code] += hours * weight
+        return sums
+
+    def hours_by_client(self) -> Dict[str, float]:
+        """Total hours per client."""
+        sums = self._sum_by(self.client_code, len(self.clients))
+        return {client: round(sums[code], 6) for code, client in enumerate(self.clients)}
+
+    def revenue_by_client(self) -> Dict[str, float]:
+        """Billed amount (hours * stored hourly rate) per client."""
+        sums = self._sum_by(self.client_code, len(self.clients), self.rate)
+        return {client: round(sums[code], 6) for code, client in enumerate(self.clients)}
+
+    def hours_by_week(self) -> Dict[str, float]:
+        """Total hours per ISO week ("YYYY-Www"), in week order."""
+        # Map each distinct date to a week code once, then group through it
+        weeks: List[str] = []
+        week_index: Dict[str, int] = {}
+        date_to_week = array('I')
+        for value in self.dates:
+            year, week, _ = Date.fromisoformat(value).isocalendar()
+            date_to_week.append(self._encode(f"{year}-W{week:02d}", weeks, week_index))
+
+        sums = array('d', bytes(8 * len(weeks)))
+        for code, hours in zip(self.date_code, self.hours):
+            sums[date_to_week[code]] += hours
+        return {week: round(sums[code], 6) for code, week in sorted(enumerate(weeks), key=lambda w: w[1])}
+
+    def top_clients(self, n: int = 5, by: str = "hours") -> List[Dict]:
+        """Top-N clients by "hours" or "revenue"."""
+        hours = self.hours_by_client()
+        revenue = self.revenue_by_client()
+        key = revenue if by == "revenue" else hours
+        ranked = sorted(self.clients, key=lambda client: key[client], reverse=True)[:n]
+        return [{"client": c, "hours": hours[c], "revenue": revenue[c]} for c in ranked]
+
+
+def build_report(
+    columns: EntryColumns,
+    top: int = 5,
+    weekly_capacity: float = DEFAULT_WEEKLY_CAPACITY
+) -> Dict:
+    """
+    Aggregate a columnar worklog into a report
+
+    Args:
+        columns: Entries to report on (already filtered)
+        top: Number of clients in the top-N list
+        weekly_capacity: Available hours per week for utilization
+
+    Returns:
+        Dictionary with totals, per-client, per-week and top-N sections
+    """
+    hours = columns.hours_by_client()
+    revenue = columns.revenue_by_client()
+    weeks = columns.hours_by_week()
+
+    return {
+        "entries": len(columns),
+        "total_hours": round(sum(columns.hours), 6),
+        "total_revenue": round(sum(revenue.values()), 6),
+        "clients": {
+            client: {"hours": hours[client], "revenue": revenue[client]}
+            for client in sorted(hours)
+        },
+        "weeks": {
+            week: {
+                "hours": week_hours,
+                "utilization": round(week_hours / weekly_capacity, 4) if weekly_capacity else None
+            }
+            for week, week_hours in weeks.items()
+        },
+        "top_clients": columns.top_clients(top)
+    }
@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+"""
+Worklog Benchmark - Performance benchmarks for the worklog skill
+
+Commands:
+- contention: Hammer add_entry from N processes at once and assert that no
+  entries are lost or duplicated and the rollup stays in sync
+- operations: Generate synthetic worklogs of increasing size and time
+  add_entry, list_entries (every filter combination), get_total_hours and
+  delete_entry, reporting latency percentiles, peak RSS and bytes written
+- compare: Compare two operations result files and flag p50 regressions
+
+All runs use a temporary worklog directory and a fake clients.json, so the
+real worklog is never touched.
+"""
+
+import json
+import multiprocessing
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from itertools import product
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import worklog_manager
+
+# Fake invoice clients used by every benchmark run
+BENCH_CLIENTS = [
+    {"name": "Acme Corp", "short_name": "Acme", "invoice_type": "hourly", "hourly_rate": 150.0},
+    {"name": "Globex", "short_name": "Globex", "invoice_type": "hourly", "hourly_rate": 120.0},
+    {"name": "Initech", "short_name": "Initech", "invoice_type": "hourly", "hourly_rate": 100.0},
+    {"name": "Umbrella", "short_name": "Umbrella", "invoice_type": "subscription"},
+]
+
+# Share of entries per client in synthetic histories (a few large accounts, a long tail)
+CLIENT_WEIGHTS = [0.55, 0.25, 0.15, 0.05]
+
+# Vocabulary for synthetic descriptions
+DESCRIPTION_WORDS = [
+    "implemented", "fixed", "reviewed", "refactored", "deployed", "investigated",
+    "authentication", "billing", "dashboard", "migration", "api", "reporting",
+    "database", "schema", "tests", "invoice", "export", "performance", "bug",
+    "meeting", "client", "call", "documentation", "release", "cache", "search"
+]
+
+
+def write_fake_clients(directory: Path) -> Path:
+    """Write a fake invoice clients.json and return its path."""
+    path = directory / "clients.json"
+    with open(path, 'w') as f:
+        json.dump({"clients": BENCH_CLIENTS}, f, indent=2)
+    return path
+
+
+def point_manager_at(worklog_dir: Path, clients_file: Path, backend: str) -> None:
+    """Redirect worklog_manager's data files to a benchmark directory."""
+    worklog_manager.WORKLOG_DIR = worklog_dir
+    worklog_manager.WORKLOG_FILE = worklog_dir / "worklog.json"
+    worklog_manager.WORKLOG_CONFIG_FILE = worklog_dir / "config.json"
+    worklog_manager.INVOICE_CLIENTS_FILE = clients_file
+    worklog_manager.set_backend(backend)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def latency_summary(seconds: List[float]) -> Dict[str, float]:
+    """Summarize latencies (seconds) as millisecond percentiles."""
+    return {
+        "p50": round(percentile(seconds, 50) * 1000, 3),
+        "p95": round(percentile(seconds, 95) * 1000, 3),
+        "p99": round(percentile(seconds, 99) * 1000, 3),
+        "max": round(max(seconds, default=0.0) * 1000, 3)
+    }
+
+
+def generate_history(count: int, seed: int = 0, days: int = 730) -> List[Dict]:
+    """
+    Build a synthetic worklog with a skewed client mix
+
+    Args:
+        count: Number of entries
+        seed: Random seed (same seed, same history)
+        days: Entries are spread over this many days ending today
+
+    Returns:
+        Entries in chronological order, shaped like build_entry() output
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    start = today - timedelta(days=days)
+    entries = []
+    for offset in sorted(rng.randrange(days) for _ in range(count)):
+        client = rng.choices(BENCH_CLIENTS, weights=CLIENT_WEIGHTS)[0]
+        day = start + timedelta(days=offset)
+        entries.append({
+            "id": f"{rng.getrandbits(48):012x}",
+            "client": client["name"],
+            "date": day.isoformat(),
+            "hours": rng.choice([0.25, 0.5, 1.0, 1.5, 2.0, 3.0, 4.0, 6.0, 8.0]),
+            "description": " ".join(rng.sample(DESCRIPTION_WORDS, rng.randint(3, 8))),
+            "hourly_rate": client.get("hourly_rate"),
+            "created_at": f"{day.isoformat()}T{rng.randrange(8, 19):02d}:{rng.randrange(60):02d}:00"
+        })
+    return entries
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None if unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def bytes_written() -> Optional[int]:
+    """Bytes this process has passed to write() so far (Linux only, else None)."""
+    try:
+        with open("/proc/self/io", 'r') as f:
+            for line in f:
+                if line.startswith("wchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _contention_worker(
+    worklog_dir: str,
+    clients_file: str,
+    backend: str,
+    worker_id: int,
+    count: int,
+    start_event,
+    results
+) -> None:
+    """Add `count` entries as fast as possible once the start event fires."""
+    point_manager_at(Path(worklog_dir), Path(clients_file), backend)
+    client = BENCH_CLIENTS[worker_id % len(BENCH_CLIENTS)]["name"]
+
+    start_event.wait()
+    latencies, errors = [], []
+    for i in range(count):
+        started = time.perf_counter()
+        try:
+            worklog_manager.add_entry(client, 0.25, f"worker-{worker_id}-entry-{i}", "2025-01-01")
+        except Exception as e:
+            errors.append(str(e))
+        latencies.append(time.perf_counter() - started)
+
+    results.put({"worker": worker_id, "latencies": latencies, "errors": errors})
+
+
+def run_contention(backend: str, processes: int, entries_per_process: int) -> Dict:
+    """
+    Run add_entry concurrently from several processes against one worklog
+
+    Args:
+        backend: Storage backend name
+        processes: Number of concurrent writer processes
+        entries_per_process: Entries each process adds
+
+    Returns:
+        Result dictionary including lost/duplicate counts and throughput
+    """
+    with tempfile.TemporaryDirectory(prefix="worklog-bench-") as tmp:
+        worklog_dir = Path(tmp)
+        clients_file = write_fake_clients(worklog_dir)
+
+        ctx = multiprocessing.get_context()
+        start_event = ctx.Event()
+        results = ctx.Queue()
+        workers = [
+            ctx.Process(
+                target=_contention_worker,
+                args=(str(worklog_dir), str(clients_file), backend, worker_id,
+                      entries_per_process, start_event, results)
+            )
+            for worker_id in range(processes)
+        ]
+        for worker in workers:
+            worker.start()
+
+        started = time.perf_counter()
+        start_event.set()
+        reports = [results.get() for _ in workers]
+        elapsed = time.perf_counter() - started
+        for worker in workers:
+            worker.join()
+
+        point_manager_at(worklog_dir, clients_file, backend)
+        stored = [e["description"] for e in worklog_manager.get_backend().iter_entries()]
+        expected = {
+            f"worker-{worker_id}-entry-{i}"
+            for worker_id in range(processes)
+            for i in range(entries_per_process)
+        }
+        drift = worklog_manager.verify_rollup()
+
+    latencies = [latency for report in reports for latency in report["latencies"]]
+    errors = [error for report in reports for error in report["errors"]]
+    total = processes * entries_per_process
+
+    return {
+        "backend": backend,
+        "processes": processes,
+        "entries_per_process": entries_per_process,
+        "expected": total,
+        "stored": len(stored),
+        "lost": len(expected - set(stored)),
+        "duplicates": len(stored) - len(set(stored)),
+        "errors": len(errors),
+        "rollup_drift": len(drift),
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_per_second": round(total / elapsed, 1) if elapsed else None,
+        "latency_ms": latency_summary(latencies)
+    }
+
+
+def _filter_variants(history: List[Dict]) -> List[Dict]:
+    """Every combination of client / start date / end date filters."""
+    client = BENCH_CLIENTS[0]["name"]
+    dates = sorted(e["date"] for e in history) or [date.today().isoformat()]
+    # A quarter of the history in the middle of the range
+    start, end = dates[len(dates) * 3 // 8], dates[len(dates) * 5 // 8]
+    return [
+        {"client_name": c, "start_date": s, "end_date": e}
+        for c, s, e in product([None, client], [None, start], [None, end])
+    ]
+
+
+def _operation_worker(
+    worklog_dir: str,
+    clients_file: str,
+    backend: str,
+    op: str,
+    params: Dict,
+    iterations: int,
+    seed: int,
+    results
+) -> None:
+    """Run one operation `iterations` times in a fresh process and report its costs."""
+    point_manager_at(Path(worklog_dir), Path(clients_file), backend)
+    rng = random.Random(seed)
+
+    if op == "delete_entry":
+        # Pick victims up front so the ID lookup isn't part of the timing
+        entry_ids = [e["id"] for e in worklog_manager.get_backend().iter_entries()]
+        victims = rng.sample(entry_ids, min(iterations, len(entry_ids)))
+
+    rss_before = peak_rss_mb()
+    written_before = bytes_written()
+    latencies = []
+    for i in range(iterations):
+        started = time.perf_counter()
+        if op == "add_entry":
+            client = rng.choices(BENCH_CLIENTS, weights=CLIENT_WEIGHTS)[0]["name"]
+            worklog_manager.add_entry(client, 1.0, f"benchmark add {i}", date.today().isoformat())
+        elif op == "list_entries":
+            worklog_manager.list_entries(**params)
+        elif op == "get_total_hours":
+            worklog_manager.get_total_hours(**params)
+        elif op == "delete_entry":
+            if i < len(victims):
+                worklog_manager.delete_entry_by_id(victims[i])
+        latencies.append(time.perf_counter() - started)
+
+    written_after = bytes_written()
+    results.put({
+        "latency_ms": latency_summary(latencies),
+        "peak_rss_mb": peak_rss_mb(),
+        "baseline_rss_mb": rss_before,
+        "bytes_written_per_op": (
+            (written_after - written_before) // max(iterations, 1)
+            if written_before is not None else None
+        )
+    })
+
+
+def run_operations(backend: str, size: int, iterations: int, seed: int = 0) -> List[Dict]:
+    """
+    Time every worklog operation against a synthetic history of `size` entries
+
+    Each operation runs in its own process, so peak RSS and bytes written
+    are attributable to that operation alone. Read-only operations run
+    first; adds and deletes then run against the same history.
+
+    Args:
+        backend: Storage backend name
+        size: Number of synthetic entries
+        iterations: Calls per operation (and per filter combination)
+        seed: Random seed for the history and the operations
+
+    Returns:
+        One result dictionary per operation/filter combination
+    """
+    history = generate_history(size, seed)
+    plan = [("list_entries", params) for params in _filter_variants(history)]
+    plan += [("get_total_hours", params) for params in _filter_variants(history)]
+    plan += [("add_entry", {}), ("delete_entry", {})]
+
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="worklog-bench-") as tmp:
+        worklog_dir = Path(tmp)
+        clients_file = write_fake_clients(worklog_dir)
+        point_manager_at(worklog_dir, clients_file, backend)
+        worklog_manager.get_backend().save({"entries": history})
+        # Build the rollup once so it isn't charged to the first operation
+        worklog_manager.get_rollup()
+        if backend == "sqlite":
+            # Don't hand an open connection to the forked workers
+            worklog_manager.get_backend().close()
+
+        ctx = multiprocessing.get_context()
+        for op, params in plan:
+            results = ctx.Queue()
+            worker = ctx.Process(
+                target=_operation_worker,
+                args=(str(worklog_dir), str(clients_file), backend, op, params, iterations, seed, results)
+            )
+            worker.start()
+            report = results.get()
+            worker.join()
+            rows.append({
+                "backend": backend,
+                "size": size,
+                "operation": op,
+                "filters": sorted(k for k, v in params.items() if v),
+                "iterations": iterations,
+                **report
+            })
+    return rows
+
+
+def result_key(row: Dict) -> str:
+    """Stable identifier of a benchmark row across runs."""
+    filters = "+".join(row["filters"]) or "none"
+    return f"{row['backend']}/{row['size']}/{row['operation']}/{filters}"
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float) -> List[Dict]:
+    """
+    Compare p50 latency of two operations result files
+
+    Args:
+        baseline: Earlier results document
+        current: New results document
+        threshold: Allowed relative slowdown (0.2 = 20%)
+
+    Returns:
+        One {"key", "baseline_p50", "current_p50", "ratio", "regressed"} per shared row
+    """
+    before = {result_key(row): row for row in baseline.get("results", [])}
+    rows = []
+    for row in current.get("results", []):
+        key = result_key(row)
+        if key not in before:
+            continue
+        old, new = before[key]["latency_ms"]["p50"], row["latency_ms"]["p50"]
+        ratio = new / old if old else None
+        rows.append({
+            "key": key,
+            "baseline_p50": old,
+            "current_p50": new,
+            "ratio": round(ratio, 3) if ratio is not None else None,
+            "regressed": ratio is not None and ratio > 1 + threshold
+        })
+    return rows
+
+
+def main():
+    """CLI interface for worklog benchmarks"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the worklog manager")
+    subparsers = parser.add_subparsers(dest="command", help="Benchmark to run")
+
+    contention_parser = subparsers.add_parser(
+        "contention", help="Concurrent add_entry from N processes; fails if entries are lost"
+    )
+    contention_parser.add_argument("--processes", type=int, nargs="+", default=[1, 4, 8],
+                                   help="Writer process counts to test")
+    contention_parser.add_argument("--entries", type=int, default=50,
+                                   help="Entries added by each process")
+    contention_parser.add_argument("--backend", nargs="+", default=["json", "journal", "sqlite"],
+                                   help="Storage backends to test")
+    contention_parser.add_argument("--output", help="Write results as JSON to this file")
+
+    operations_parser = subparsers.add_parser(
+        "operations", help="Latency, peak RSS and bytes written per operation on synthetic worklogs"
+    )
+    operations_parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000],
+                                   help="Synthetic history sizes (entries)")
+    operations_parser.add_argument("--iterations", type=int, default=10,
+                                   help="Calls per operation and filter combination")
+    operations_parser.add_argument("--backend", nargs="+", default=["json", "journal", "sqlite"],
+                                   help="Storage backends to test")
+    operations_parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    operations_parser.add_argument("--output", help="Write results as JSON to this file")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two operations result files")
+    compare_parser.add_argument("baseline", help="Earlier results JSON")
+    compare_parser.add_argument("current", help="New results JSON")
+    compare_parser.add_argument("--threshold", type=float, default=0.2,
+                                help="Allowed p50 slowdown before flagging (default: 0.2 = 20%%)")
+
+    args = parser.parse_args()
+
+    if args.command == "contention":
+        results = []
+        print(f"\n{'Backend':<10} {'Procs':>5} {'Stored':>8} {'Lost':>5} {'Dup':>4} "
+              f"{'Drift':>5} {'Ops/s':>9} {'p50 ms':>8} {'p95 ms':>8}")
+        print("-" * 72)
+        for backend in args.backend:
+            for processes in args.processes:
+                result = run_contention(backend, processes, args.entries)
+                results.append(result)
+                print(f"{backend:<10} {processes:>5} {result['stored']:>4}/{result['expected']:<4}"
+                      f"{result['lost']:>5} {result['duplicates']:>4} {result['rollup_drift']:>5} "
+                      f"{result['throughput_per_second']:>9} {result['latency_ms']['p50']:>8} "
+                      f"{result['latency_ms']['p95']:>8}")
+        print()
+
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump({"benchmark": "contention", "results": results}, f, indent=2)
+
+        failed = [r for r in results if r["lost"] or r["duplicates"] or r["errors"] or r["rollup_drift"]]
+        if failed:
+            print(f"❌ {len(failed)} run(s) lost, duplicated or failed entries")
+            return 1
+        print("✅ No entries lost under contention")
+
+    elif args.command == "operations":
+        results = []
+        print(f"\n{'Backend':<8} {'Size':>8} {'Operation':<16} {'Filters':<32} "
+              f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'RSS MB':>7} {'B/op':>10}")
+        print("-" * 116)
+        for backend in args.backend:
+            for size in args.sizes:
+                for row in run_operations(backend, size, args.iterations, args.seed):
+                    results.append(row)
+                    written = row["bytes_written_per_op"]
+                    print(f"{backend:<8} {size:>8} {row['operation']:<16} "
+                          f"{'+'.join(row['filters']) or '-':<32} "
+                          f"{row['latency_ms']['p50']:>9} {row['latency_ms']['p95']:>9} "
+                          f"{row['latency_ms']['p99']:>9} {row['peak_rss_mb'] or '-':>7} "
+                          f"{written if written is not None else '-':>10}")
+                    sys.stdout.flush()
+        print()
+
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump({
+                    "benchmark": "operations",
+                    "python": sys.version.split()[0],
+                    "iterations": args.iterations,
+                    "seed": args.seed,
+                    "results": results
+                }, f, indent=2)
+
+    elif args.command == "compare":
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        with open(args.current, 'r') as f:
+            current = json.load(f)
+
+        rows = compare_results(baseline, current, args.threshold)
+        print(f"\n{'Benchmark':<60} {'Before':>9} {'After':>9} {'Ratio':>7}")
+        print("-" * 88)
+        for row in rows:
+            flag = "  ⚠️" if row["regressed"] else ""
+            print(f"{row['key']:<60} {row['baseline_p50']:>9} {row['current_p50']:>9} "
+                  f"{row['ratio'] if row['ratio'] is not None else '-':>7}{flag}")
+        print()
+
+        regressed = [row for row in rows if row["regressed"]]
+        if regressed:
+            print(f"❌ {len(regressed)} benchmark(s) slower than {args.threshold:.0%} over baseline")
+            return 1
+        print("✅ No regressions")
+
+    else:
+        parser.print_help()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,16 +3,60 @@
 Worklog Manager - Track billable hours for clients
 """
 
+import csv
+import heapq
+import io
 import json
 import os
-from datetime import datetime
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from itertools import chain
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import IO, Any, Callable, Iterable, Optional, List, Dict, Union
+
+from worklog_analytics import DEFAULT_WEEKLY_CAPACITY, EntryColumns, build_report
+from worklog_rollup import RollupIndex, RollupLog, compute_totals, find_drift
+from worklog_search import SearchIndex
+from worklog_server import DaemonUnavailable, EntryCache
+from worklog_storage import (
+    JournalBackend, WorklogBackend, atomic_write_json, create_backend, entry_filter,
+    entry_modified_at, import_json_to_sqlite, make_entry_id
+)
 
 # Path to worklog data file
-WORKLOG_FILE = Path(__file__).parent.parent / "worklog.json"
+WORKLOG_DIR = Path(__file__).parent.parent
+WORKLOG_FILE = WORKLOG_DIR / "worklog.json"
+WORKLOG_CONFIG_FILE = WORKLOG_DIR / "config.json"
 INVOICE_CLIENTS_FILE = Path.home() / ".claude/skills/invoice/clients.json"
 
+# Default worklog configuration (overridden by config.json)
+DEFAULT_CONFIG = {
+    "storage": {
+        "backend": "json",
+        "sqlite_file": "worklog.db",
+        "journal_file": "worklog.journal.jsonl",
+        "compact_threshold_bytes": 1048576
+    },
+    "rollup": {
+        "enabled": True,
+        "file": "worklog.rollup.json",
+        "compact_records": 1000
+    },
+    "search": {
+        "enabled": True,
+        "file": "worklog.search.db"
+    },
+    "daemon": {
+        "enabled": True,
+        "socket_file": "worklog.sock"
+    },
+    "export": {
+        "watermark_file": "worklog.watermarks.json",
+        "grace_seconds": 60
+    }
+}
+
 # Client name aliases/synonyms
 CLIENT_ALIASES = {
     "ALT": "American Laboratory Trading",
@@ -20,35 +64,341 @@ CLIENT_ALIASES = {
 }
 
 
-def load_worklog() -> Dict:
-    """Load worklog data from JSON file"""
-    if not WORKLOG_FILE.exists():
-        return {"entries": []}
+_backend: Optional[WorklogBackend] = None
+# Table rows rendered per write when listing entries
+LIST_CHUNK_SIZE = 200
 
-    with open(WORKLOG_FILE, 'r') as f:
-        return json.load(f)
+_rollup: Optional[RollupIndex] = None
+_search_index: Optional[SearchIndex] = None
+
+
+def load_config() -> Dict:
+    """Load worklog configuration, merged over the defaults"""
+    config = json.loads(json.dumps(DEFAULT_CONFIG))
+
+    if WORKLOG_CONFIG_FILE.exists():
+        with open(WORKLOG_CONFIG_FILE, 'r') as f:
+            user_config = json.load(f)
+        for section, values in user_config.items():
+            if isinstance(values, dict) and isinstance(config.get(section), dict):
+                config[section].update(values)
+            else:
+                config[section] = values
+
+    # Environment override for quick side-by-side benchmarking
+    if os.environ.get("WORKLOG_BACKEND"):
+        config["storage"]["backend"] = os.environ["WORKLOG_BACKEND"]
+
+    return config
+
+
+def resolve_data_path(filename: str) -> Path:
+    """Resolve a configured data file relative to the worklog skill directory"""
+    path = Path(filename).expanduser()
+    return path if path.is_absolute() else WORKLOG_DIR / path
+
+
+def backend_data_path(filename: str) -> Path:
+    """Resolve a derived data file, suffixed with the backend name for non-JSON backends"""
+    path = resolve_data_path(filename)
+    backend = get_backend()
+    if backend.name != "json":
+        path = path.with_name(f"{path.stem}.{backend.name}{path.suffix}")
+    return path
+
+
+def get_backend(name: Optional[str] = None) -> WorklogBackend:
+    """
+    Get the configured storage backend
+
+    Args:
+        name: Backend name override ("json", "sqlite" or "journal")
+
+    Returns:
+        Storage backend instance (cached per process for the configured backend)
+    """
+    global _backend
+
+    if name is None and _backend is not None:
+        return _backend
+
+    storage = load_config()["storage"]
+    backend_name = name or storage["backend"]
+    if backend_name == "sqlite":
+        backend = create_backend(backend_name, resolve_data_path(storage["sqlite_file"]))
+    elif backend_name == "journal":
+        backend = create_backend(
+            backend_name, WORKLOG_FILE,
+            journal_path=resolve_data_path(storage["journal_file"]),
+            compact_threshold_bytes=storage["compact_threshold_bytes"]
+        )
+    else:
+        backend = create_backend(backend_name, WORKLOG_FILE)
+
+    # Give legacy entries stable IDs the first time they are opened
+    if backend.needs_migration():
+        backend.migrate()
+
+    if name is None:
+        _backend = backend
+    return backend
+
+
+def set_backend(name: str) -> WorklogBackend:
+    """Select the storage backend for the rest of this process"""
+    global _backend
+    _backend = get_backend(name)
+    return _backend
+
+
+def load_worklog() -> Dict:
+    """Load worklog data from the active storage backend"""
+    return get_backend().load()
 
 
 def save_worklog(data: Dict) -> None:
-    """Save worklog data to JSON file"""
-    with open(WORKLOG_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    """Save worklog data to the active storage backend"""
+    get_backend().save(data)
 
 
-def load_invoice_clients() -> List[Dict]:
-    """Load client list from invoice skill"""
-    if not INVOICE_CLIENTS_FILE.exists():
+def get_rollup() -> Optional[RollupIndex]:
+    """
+    Load the per-client daily rollup, rebuilding it if the worklog
+    changed underneath it (e.g. edited by hand or another backend)
+
+    Returns:
+        Current rollup index, or None if rollups are disabled
+    """
+    rollup_config = load_config()["rollup"]
+    if not rollup_config.get("enabled", True):
+        return None
+
+    global _rollup
+
+    backend = get_backend()
+    path = backend_data_path(rollup_config["file"])
+
+    # Reuse the in-process copy while storage is unchanged (long-running daemon)
+    fingerprint = backend.fingerprint()
+    if _rollup is not None and _rollup.path == path and _rollup.is_current(fingerprint):
+        return _rollup
+
+    rollup = RollupIndex.load(path, rollup_config.get("compact_records", 1000))
+    if not rollup.is_current(fingerprint):
+        rollup.rebuild(backend.iter_entries())
+        rollup.fingerprint = fingerprint
+        rollup.save()
+    _rollup = rollup
+    return rollup
+
+
+def get_search_index() -> Optional[SearchIndex]:
+    """
+    Open the description search index, rebuilding it if the worklog
+    changed underneath it
+
+    Returns:
+        Current search index, or None if the index is disabled
+    """
+    search_config = load_config()["search"]
+    if not search_config.get("enabled", True):
+        return None
+
+    global _search_index
+
+    backend = get_backend()
+    path = backend_data_path(search_config["file"])
+
+    # Keep the connection open in-process (long-running daemon)
+    if _search_index is None or _search_index.path != path:
+        _search_index = SearchIndex(path)
+
+    fingerprint = backend.fingerprint()
+    if not _search_index.is_current(fingerprint):
+        _search_index.rebuild(backend.iter_entries())
+        _search_index.fingerprint = fingerprint
+        _search_index.save()
+    return _search_index
+
+
+def get_rollup_log() -> Optional[Union[RollupIndex, RollupLog]]:
+    """
+    Rollup handle for a write, without loading the rollup
+
+    Returns:
+        The in-process rollup if it is loaded and current (daemon), else a
+        RollupLog that appends to the rollup's log; None if rollups are
+        disabled or the rollup is stale (the next total rebuilds it)
+    """
+    rollup_config = load_config()["rollup"]
+    if not rollup_config.get("enabled", True):
+        return None
+
+    path = backend_data_path(rollup_config["file"])
+    fingerprint = get_backend().fingerprint()
+    if _rollup is not None and _rollup.path == path and _rollup.is_current(fingerprint):
+        return _rollup
+
+    log = RollupLog.open(path, rollup_config.get("compact_records", 1000))
+    return log if log.is_current(fingerprint) else None
+
+
+def get_search_writer() -> Optional[SearchIndex]:
+    """
+    Search index handle for a write (the index is opened, never loaded)
+
+    Returns:
+        The search index if it is current; None if search is disabled or the
+        index is stale (the next search rebuilds it)
+    """
+    search_config = load_config()["search"]
+    if not search_config.get("enabled", True):
+        return None
+
+    path = backend_data_path(search_config["file"])
+    index = _search_index if _search_index is not None and _search_index.path == path else SearchIndex(path)
+    return index if index.is_current(get_backend().fingerprint()) else None
+
+
+def load_indexes() -> List:
+    """Current derived indexes (rollup log, search index) to keep in step with a write"""
+    return [index for index in (get_rollup_log(), get_search_writer()) if index is not None]
+
+
+def update_indexes(indexes: List, entries: List[Dict], sign: int) -> None:
+    """Apply adds (sign=1) or deletes (sign=-1) to current indexes and persist them"""
+    fingerprint = get_backend().fingerprint()
+    for index in indexes:
+        for entry in entries:
+            index.apply(entry, sign)
+        index.fingerprint = fingerprint
+        index.save()
+
+
+def verify_rollup(
+    client_name: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> List[Dict]:
+    """
+    Recompute totals from raw entries and compare them with the rollup
+
+    Any drift found is repaired by rebuilding the rollup.
+
+    Returns:
+        List of mismatches ({"client", "field", "rollup", "raw"}); empty if in sync
+    """
+    rollup = get_rollup()
+    if rollup is None:
         return []
 
-    with open(INVOICE_CLIENTS_FILE, 'r') as f:
-        data = json.load(f)
-        return data.get("clients", [])
+    resolved_name = resolve_client_alias(client_name) if client_name else None
+    raw = compute_totals(get_backend().query(resolved_name, start_date, end_date))
+    drift = find_drift(raw, rollup.totals(resolved_name, start_date, end_date))
+
+    if drift:
+        with get_backend().locked():
+            rollup.rebuild(get_backend().iter_entries())
+            rollup.fingerprint = get_backend().fingerprint()
+            rollup.save()
+
+    return drift
+
+
+_UNLOADED = object()
+
+
+class ClientRegistry:
+    """
+    In-memory index of the invoice skill's clients
+
+    Loads clients.json once and builds dict indexes by name and alias
+    (CLIENT_ALIASES merged with each client's "aliases" list and
+    "short_name"), so lookups are O(1). The file's mtime/size is checked on
+    access and the indexes are rebuilt only when it changes, keeping
+    long-running callers correct.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._signature = _UNLOADED
+        self.clients: List[Dict] = []
+        self.by_name: Dict[str, Dict] = {}
+        self.aliases: Dict[str, str] = {}
+
+    def _refresh(self) -> None:
+        """Reload the client file if it changed since the last load"""
+        try:
+            stat = self.path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            signature = None
+
+        if signature == self._signature:
+            return
+
+        clients = []
+        if signature is not None:
+            with open(self.path, 'r') as f:
+                clients = json.load(f).get("clients", [])
+
+        self.clients = clients
+        self.by_name = {client["name"]: client for client in clients}
+
+        aliases = {}
+        for client in clients:
+            for alias in [client.get("short_name")] + client.get("aliases", []):
+                if alias and alias not in self.by_name:
+                    aliases[alias] = client["name"]
+        aliases.update(CLIENT_ALIASES)
+        self.aliases = aliases
+        self._signature = signature
+
+    def names(self) -> List[str]:
+        """Valid client names in file order"""
+        self._refresh()
+        return [client["name"] for client in self.clients]
+
+    def resolve(self, client_name: str) -> str:
+        """Resolve an alias to the canonical client name (or return the input)"""
+        self._refresh()
+        return self.aliases.get(client_name, client_name)
+
+    def get(self, client_name: str) -> Optional[Dict]:
+        """Look up a client record by name or alias"""
+        # resolve() refreshes the indexes, so it must run before by_name is read
+        name = self.resolve(client_name)
+        return self.by_name.get(name)
+
+    def rate(self, client_name: str) -> Optional[float]:
+        """Hourly rate for a client by name or alias (None if not hourly)"""
+        client = self.get(client_name)
+        if client and client.get("invoice_type") == "hourly":
+            return client.get("hourly_rate")
+        return None
+
+
+_client_registry: Optional[ClientRegistry] = None
+
+
+def get_client_registry() -> ClientRegistry:
+    """Get the process-wide client registry for INVOICE_CLIENTS_FILE"""
+    global _client_registry
+    if _client_registry is None or _client_registry.path != INVOICE_CLIENTS_FILE:
+        _client_registry = ClientRegistry(INVOICE_CLIENTS_FILE)
+    return _client_registry
+
+
+def load_invoice_clients() -> List[Dict]:
+    """Load client list from invoice skill"""
+    registry = get_client_registry()
+    registry.names()
+    return registry.clients
 
 
 def get_client_names() -> List[str]:
     """Get list of valid client names from invoice skill"""
-    clients = load_invoice_clients()
-    return [client["name"] for client in clients]
+    return get_client_registry().names()
 
 
 def resolve_client_alias(client_name: str) -> str:
@@ -61,7 +411,7 @@ def resolve_client_alias(client_name: str) -> str:
     Returns:
         The actual client name (or the input if no alias match)
     """
-    return CLIENT_ALIASES.get(client_name, client_name)
+    return get_client_registry().resolve(client_name)
 
 
 def validate_client(client_name: str) -> bool:
@@ -69,10 +419,7 @@ def validate_client(client_name: str) -> bool:
     Check if client name exists in invoice skill
     Supports both actual names and aliases
     """
-    # Resolve alias first
-    resolved_name = resolve_client_alias(client_name)
-    valid_clients = get_client_names()
-    return resolved_name in valid_clients
+    return get_client_registry().get(client_name) is not None
 
 
 def get_client_rate(client_name: str) -> Optional[float]:
@@ -80,24 +427,17 @@ def get_client_rate(client_name: str) -> Optional[float]:
     Get hourly rate for a client (if hourly billing)
     Supports both actual names and aliases
     """
-    # Resolve alias first
-    resolved_name = resolve_client_alias(client_name)
-    clients = load_invoice_clients()
-    for client in clients:
-        if client["name"] == resolved_name:
-            if client.get("invoice_type") == "hourly":
-                return client.get("hourly_rate")
-    return None
+    return get_client_registry().rate(client_name)
 
 
-def add_entry(
+def build_entry(
     client_name: str,
     hours: float,
     description: str,
     date: Optional[str] = None
 ) -> Dict:
     """
-    Add a new worklog entry
+    Validate input and build a worklog entry (without storing it)
 
     Args:
         client_name: Name of the client (must match invoice skill) or alias
@@ -106,7 +446,10 @@ def add_entry(
         date: Date of work (YYYY-MM-DD format), defaults to today
 
     Returns:
-        The created entry dictionary
+        The entry dictionary
+
+    Raises:
+        ValueError: If the client, hours or date are invalid
     """
     # Resolve alias to actual client name
     resolved_client_name = resolve_client_alias(client_name)
@@ -134,7 +477,8 @@ def add_entry(
         raise ValueError("Date must be in YYYY-MM-DD format")
 
     # Create entry (using resolved/canonical client name)
-    entry = {
+    return {
+        "id": make_entry_id(),
         "client": resolved_client_name,
         "date": date,
         "hours": hours,
@@ -143,18 +487,156 @@ def add_entry(
         "created_at": datetime.now().isoformat()
     }
 
-    # Load, append, save
-    worklog = load_worklog()
-    worklog["entries"].append(entry)
-    save_worklog(worklog)
+
+def add_entry(
+    client_name: str,
+    hours: float,
+    description: str,
+    date: Optional[str] = None
+) -> Dict:
+    """
+    Add a new worklog entry
+
+    Args:
+        client_name: Name of the client (must match invoice skill) or alias
+        hours: Number of hours worked
+        description: Description of work performed
+        date: Date of work (YYYY-MM-DD format), defaults to today
+
+    Returns:
+        The created entry dictionary
+    """
+    entry = build_entry(client_name, hours, description, date)
+
+    # Lock spans the write and the rollup update so concurrent writers never
+    # lose entries or leave the rollup behind
+    with get_backend().locked():
+        indexes = load_indexes()
+        get_backend().append(entry)
+        update_indexes(indexes, [entry], 1)
 
     return entry
 
 
+def add_entries(rows: Iterable[Dict]) -> Dict[str, List[Dict]]:
+    """
+    Add many worklog entries in a single storage write
+
+    Each row is validated independently against the client registry; invalid
+    rows are reported and skipped without aborting the rest of the batch.
+
+    Args:
+        rows: Dictionaries with "client", "hours", "description" and optional "date"
+
+    Returns:
+        Dictionary with "added" (created entries) and "errors"
+        (list of {"row": one-based row number, "error": message})
+    """
+    added, errors = [], []
+
+    for row_number, row in enumerate(rows, start=1):
+        try:
+            if not isinstance(row, dict):
+                raise ValueError("Row must be an object")
+            # hours=0 is present but invalid; build_entry reports it as such
+            missing = [field for field in ("client", "hours", "description") if row.get(field) in (None, "")]
+            if missing:
+                raise ValueError(f"Missing required field(s): {', '.join(missing)}")
+            try:
+                hours = float(row["hours"])
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid hours value: {row['hours']!r}")
+            added.append(build_entry(row["client"], hours, row["description"], row.get("date") or None))
+        except ValueError as e:
+            errors.append({"row": row_number, "error": str(e)})
+
+    if added:
+        with get_backend().locked():
+            indexes = load_indexes()
+            get_backend().extend(added)
+            update_indexes(indexes, added, 1)
+
+    return {"added": added, "errors": errors}
+
+
+def read_batch_rows(source: IO[str], input_format: str = "auto") -> List[Dict]:
+    """
+    Parse batch input rows from JSON, JSON Lines or CSV
+
+    Args:
+        source: Open text stream (file or stdin)
+        input_format: "json" (array, {"entries": [...]} or a single row object),
+            "jsonl", "csv" or "auto"
+
+    Returns:
+        List of row dictionaries (unparseable JSONL lines become error markers
+        that add_entries reports)
+
+    Raises:
+        ValueError: If JSON input is not an object or a list of objects
+    """
+    text = source.read()
+
+    if input_format == "auto":
+        stripped = text.lstrip()
+        if not stripped:
+            return []
+        if stripped[0] in "[{":
+            try:
+                json.loads(text)
+                input_format = "json"
+            except json.JSONDecodeError:
+                input_format = "jsonl"
+        else:
+            input_format = "csv"
+
+    if input_format == "json":
+        data = json.loads(text)
+        if isinstance(data, dict):
+            # A lone object (e.g. one-line JSONL) is a single row
+            data = data["entries"] if "entries" in data else [data]
+        if not isinstance(data, list):
+            raise ValueError(f"JSON input must be an object or a list of objects, not {type(data).__name__}")
+        return data
+
+    if input_format == "jsonl":
+        rows = []
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                rows.append(json.loads(line))
+            except json.JSONDecodeError:
+                rows.append(line)
+        return rows
+
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+def select_recent(entries: Iterable[Dict], limit: Optional[int] = None, offset: int = 0) -> List[Dict]:
+    """
+    Most recent entries first, optionally one page of them
+
+    With a limit, only the newest offset + limit entries are kept (heap
+    selection) instead of sorting everything. Entries on the same date
+    keep storage order either way.
+
+    Args:
+        entries: Entries in storage order
+        limit: Page size (None for all)
+        offset: Number of newest entries to skip
+    """
+    if limit is None:
+        return sorted(entries, key=lambda e: e["date"], reverse=True)[offset:]
+    return heapq.nlargest(offset + limit, entries, key=lambda e: e["date"])[offset:]
+
+
 def list_entries(
     client_name: Optional[str] = None,
     start_date: Optional[str] = None,
-    end_date: Optional[str] = None
+    end_date: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0
 ) -> List[Dict]:
     """
     List worklog entries with optional filters
@@ -163,29 +645,51 @@ def list_entries(
         client_name: Filter by client name or alias
         start_date: Filter entries on or after this date (YYYY-MM-DD)
         end_date: Filter entries on or before this date (YYYY-MM-DD)
+        limit: Return at most this many entries
+        offset: Skip this many of the most recent matching entries
 
     Returns:
-        List of matching entries
+        List of matching entries, most recent first
     """
-    worklog = load_worklog()
-    entries = worklog.get("entries", [])
+    # Resolve alias before filtering
+    resolved_name = resolve_client_alias(client_name) if client_name else None
+    # Single streaming pass applies every filter; only matches are materialized
+    matches = get_backend().query(resolved_name, start_date, end_date)
 
-    # Apply filters
-    if client_name:
-        # Resolve alias before filtering
-        resolved_name = resolve_client_alias(client_name)
-        entries = [e for e in entries if e["client"] == resolved_name]
+    return select_recent(matches, limit, offset)
 
-    if start_date:
-        entries = [e for e in entries if e["date"] >= start_date]
 
-    if end_date:
-        entries = [e for e in entries if e["date"] <= end_date]
+@contextmanager
+def broken_pipe_guard():
+    """Stop writing quietly once stdout's reader (a pager or `head`) exits early"""
+    try:
+        yield
+    except BrokenPipeError:
+        # Silence the flush at interpreter exit, which would raise again
+        sys.stdout = open(os.devnull, 'w')
 
-    # Sort by date (most recent first)
-    entries.sort(key=lambda e: e["date"], reverse=True)
 
-    return entries
+def write_entry_table(entries: List[Dict], out: IO[str] = None, chunk_size: int = LIST_CHUNK_SIZE) -> None:
+    """
+    Render entries as the `list` table, a chunk of rows per write
+
+    The first chunk is flushed right away so the top of the list appears
+    before the rest is formatted.
+    """
+    out = out or sys.stdout
+    out.write(f"\n{'ID':<13} {'Date':<12} {'Client':<25} {'Hours':<8} {'Description'}\n")
+    out.write("-" * 93 + "\n")
+    for start in range(0, len(entries), chunk_size):
+        rows = []
+        for entry in entries[start:start + chunk_size]:
+            desc = entry["description"][:40] + "..." if len(entry["description"]) > 40 else entry["description"]
+            rows.append(f"{entry.get('id', ''):<13} {entry['date']:<12} {entry['client']:<25} "
+                        f"{entry['hours']:<8.2f} {desc}\n")
+        out.write("".join(rows))
+        if start == 0:
+            out.flush()
+    out.write("\n")
+    out.flush()
 
 
 def get_total_hours(
@@ -196,6 +700,9 @@ def get_total_hours(
     """
     Calculate total hours worked
 
+    Answered from the rollup index when enabled; otherwise streamed from
+    storage without materializing or sorting entries.
+
     Args:
         client_name: Filter by client name
         start_date: Filter entries on or after this date (YYYY-MM-DD)
@@ -204,20 +711,160 @@ def get_total_hours(
     Returns:
         Dictionary with total hours by client
     """
-    entries = list_entries(client_name, start_date, end_date)
+    resolved_name = resolve_client_alias(client_name) if client_name else None
 
-    totals = {}
-    for entry in entries:
-        client = entry["client"]
-        hours = entry["hours"]
-        totals[client] = totals.get(client, 0) + hours
+    # Answer from the rollup's prefix sums when available
+    rollup = get_rollup()
+    if rollup is not None:
+        return {
+            client: values["hours"]
+            for client, values in rollup.totals(resolved_name, start_date, end_date).items()
+        }
 
-    return totals
+    return get_backend().totals(resolved_name, start_date, end_date)
+
+
+def search_entries(
+    query: str,
+    client_name: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    limit: Optional[int] = 20,
+    match_all: bool = False
+) -> List[Dict]:
+    """
+    Ranked full-text search over entry descriptions
+
+    Args:
+        query: Search terms
+        client_name: Filter by client name or alias
+        start_date: Filter entries on or after this date (YYYY-MM-DD)
+        end_date: Filter entries on or before this date (YYYY-MM-DD)
+        limit: Maximum number of results (None for all)
+        match_all: Only return entries containing every term
+
+    Returns:
+        List of {"score": ..., "entry": ...}, best match first
+    """
+    resolved_name = resolve_client_alias(client_name) if client_name else None
+
+    index = get_search_index()
+    if index is None:
+        # Index disabled: build a throwaway one over the filtered entries
+        index = SearchIndex()
+        index.rebuild(get_backend().query(resolved_name, start_date, end_date))
+
+    return index.search(query, resolved_name, start_date, end_date, limit, match_all)
+
+
+def generate_report(
+    client_name: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    top: int = 5,
+    weekly_capacity: float = DEFAULT_WEEKLY_CAPACITY
+) -> Dict:
+    """
+    Build an analytics report over a columnar copy of the matching entries
+
+    Args:
+        client_name: Filter by client name or alias
+        start_date: Filter entries on or after this date (YYYY-MM-DD)
+        end_date: Filter entries on or before this date (YYYY-MM-DD)
+        top: Number of clients in the top-N list
+        weekly_capacity: Available hours per week for utilization
+
+    Returns:
+        Report dictionary (see worklog_analytics.build_report)
+    """
+    resolved_name = resolve_client_alias(client_name) if client_name else None
+    columns = EntryColumns.from_entries(get_backend().query(resolved_name, start_date, end_date))
+    return build_report(columns, top, weekly_capacity)
+
+
+def watermark_path() -> Path:
+    """Path of the per-consumer export watermark file"""
+    return backend_data_path(load_config()["export"]["watermark_file"])
+
+
+def load_watermarks() -> Dict[str, Dict]:
+    """Load export watermarks (consumer -> {"modified_at", "seen"})"""
+    path = watermark_path()
+    if not path.exists():
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def export_entries(
+    out: IO[str],
+    consumer: Optional[str] = None,
+    commit: bool = True
+) -> int:
+    """
+    Stream entries as JSON Lines, optionally only those changed since a consumer's watermark
+
+    The watermark is the newest created_at/updated_at the consumer has seen.
+    Each run re-reads a short grace window before it (entries are timestamped
+    just before they are written, so a slow writer can land slightly behind
+    a faster one) and skips anything already exported at the same timestamp,
+    so entries are never missed or repeated.
+
+    Args:
+        out: Destination for the JSONL stream
+        consumer: Watermark name; None exports every entry without tracking
+        commit: Advance the consumer's watermark after a successful export
+
+    Returns:
+        Number of entries written
+    """
+    grace = timedelta(seconds=load_config()["export"].get("grace_seconds", 60))
+    mark = load_watermarks().get(consumer, {}) if consumer else {}
+    seen = mark.get("seen", {})
+    since = None
+    if mark.get("modified_at"):
+        since = (datetime.fromisoformat(mark["modified_at"]) - grace).isoformat()
+
+    count = 0
+    exported: Dict[str, str] = {}
+    for entry in get_backend().changed_since(since):
+        modified_at = entry_modified_at(entry)
+        if seen.get(entry["id"]) == modified_at:
+            continue
+        out.write(json.dumps(entry) + "\n")
+        exported[entry["id"]] = modified_at
+        count += 1
+
+    if consumer and commit and exported:
+        high = max([mark.get("modified_at") or ""] + list(exported.values()))
+        window_start = (datetime.fromisoformat(high) - grace).isoformat()
+        seen = {
+            entry_id: modified_at
+            for entry_id, modified_at in chain(seen.items(), exported.items())
+            if modified_at >= window_start
+        }
+        with get_backend().locked():
+            watermarks = load_watermarks()
+            watermarks[consumer] = {"modified_at": high, "seen": seen}
+            atomic_write_json(watermark_path(), watermarks)
+
+    return count
+
+
+def reset_watermark(consumer: str) -> bool:
+    """Forget a consumer's watermark so its next export starts from scratch"""
+    with get_backend().locked():
+        watermarks = load_watermarks()
+        if consumer not in watermarks:
+            return False
+        del watermarks[consumer]
+        atomic_write_json(watermark_path(), watermarks)
+    return True
 
 
 def delete_entry(index: int) -> bool:
     """
-    Delete an entry by its index in the list
+    Delete an entry by its index in storage order (legacy; prefer delete_entry_by_id)
 
     Args:
         index: Zero-based index of entry to delete
@@ -225,15 +872,168 @@ def delete_entry(index: int) -> bool:
     Returns:
         True if deleted, False if index out of range
     """
-    worklog = load_worklog()
-    entries = worklog.get("entries", [])
+    with get_backend().locked():
+        indexes = load_indexes()
+        deleted = get_backend().delete(index)
+        if deleted is None:
+            return False
+
+        update_indexes(indexes, [deleted], -1)
+    return True
+
+
+def delete_entry_by_id(entry_id: str) -> bool:
+    """
+    Delete an entry by its stable ID
+
+    Args:
+        entry_id: ID shown by `list`
+
+    Returns:
+        True if deleted, False if no entry has that ID
+    """
+    with get_backend().locked():
+        indexes = load_indexes()
+        deleted = get_backend().delete_by_id(entry_id)
+        if deleted is None:
+            return False
+
+        update_indexes(indexes, [deleted], -1)
+    return True
+
+
+def update_entry(
+    entry_id: str,
+    client_name: Optional[str] = None,
+    hours: Optional[float] = None,
+    description: Optional[str] = None,
+    date: Optional[str] = None
+) -> Dict:
+    """
+    Update fields of an existing entry by its stable ID
+
+    Args:
+        entry_id: ID shown by `list`
+        client_name: New client name or alias
+        hours: New number of hours
+        description: New description
+        date: New date (YYYY-MM-DD)
+
+    Returns:
+        The updated entry dictionary
+
+    Raises:
+        ValueError: If no entry has that ID or a new value is invalid
+    """
+    with get_backend().locked():
+        existing = get_backend().get(entry_id)
+        if existing is None:
+            raise ValueError(f"No entry with ID '{entry_id}'")
+
+        updated = build_entry(
+            client_name if client_name is not None else existing["client"],
+            hours if hours is not None else existing["hours"],
+            description if description is not None else existing["description"],
+            date if date is not None else existing["date"]
+        )
+        updated["id"] = existing["id"]
+        updated["created_at"] = existing["created_at"]
+        updated["updated_at"] = datetime.now().isoformat()
+        # Keep the rate billed at the time unless the client changed
+        if updated["client"] == existing["client"]:
+            updated["hourly_rate"] = existing.get("hourly_rate")
+
+        indexes = load_indexes()
+        get_backend().update(entry_id, updated)
+        update_indexes(indexes, [existing], -1)
+        update_indexes(indexes, [updated], 1)
+
+    return updated
+
+
+def daemon_socket_path() -> Path:
+    """Path of the worklog daemon's Unix domain socket"""
+    return resolve_data_path(load_config()["daemon"]["socket_file"])
+
+
+def run_via_daemon(op: str, params: Dict, local: Callable[[], Any], use_daemon: bool = True) -> Any:
+    """
+    Run an operation through the worklog daemon if it is running, else locally
+
+    Args:
+        op: Daemon operation ("add", "list", "total" or "search")
+        params: Operation parameters
+        local: Fallback that performs the operation in this process
+        use_daemon: Set False to always run locally
 
-    if 0 <= index < len(entries):
-        deleted = entries.pop(index)
-        save_worklog(worklog)
-        return True
+    Raises:
+        ValueError: If the operation itself fails (daemon or local)
+    """
+    if use_daemon and load_config()["daemon"].get("enabled", True):
+        from worklog_server import request
+        try:
+            return request(daemon_socket_path(), op, params, backend=get_backend().name)
+        except DaemonUnavailable:
+            pass
+    return local()
 
-    return False
+
+def add_entry_cached(cache: EntryCache, **params) -> Dict:
+    """
+    Add an entry and keep the daemon's entry cache in step
+
+    The currency check and the write happen under one storage lock, so no
+    other process can write in between; otherwise the cache would take on
+    the new fingerprint while missing that other write.
+    """
+    with get_backend().locked():
+        was_current = cache.is_current()
+        entry = add_entry(**params)
+        if was_current:
+            cache.extend([entry])
+    return entry
+
+
+def serve_daemon() -> None:
+    """Serve add/list/total/search from memory over the daemon socket until stopped"""
+    from worklog_server import serve
+
+    cache = EntryCache(get_backend())
+
+    def handle_add(params: Dict) -> Dict:
+        return add_entry_cached(cache, **params)
+
+    def handle_list(params: Dict) -> List[Dict]:
+        client_name = params.get("client_name")
+        matches = entry_filter(
+            resolve_client_alias(client_name) if client_name else None,
+            params.get("start_date"),
+            params.get("end_date")
+        )
+        return select_recent(
+            (e for e in cache.entries() if matches(e)),
+            params.get("limit"),
+            params.get("offset", 0)
+        )
+
+    def handle_total(params: Dict) -> Dict[str, float]:
+        return get_total_hours(**params)
+
+    def handle_search(params: Dict) -> List[Dict]:
+        return search_entries(**params)
+
+    # Warm everything up front so the first request is already served from memory
+    cache.entries()
+    get_rollup()
+    get_search_index()
+    get_client_names()
+
+    serve(daemon_socket_path(), get_backend().name, {
+        "add": handle_add,
+        "list": handle_list,
+        "total": handle_total,
+        "search": handle_search,
+    })
 
 
 def main():
@@ -241,6 +1041,10 @@ def main():
     import argparse
 
     parser = argparse.ArgumentParser(description="Manage billable hours worklog")
+    parser.add_argument("--backend", choices=["json", "sqlite", "journal"],
+                        help="Storage backend override (defaults to config.json)")
+    parser.add_argument("--no-daemon", action="store_true",
+                        help="Access storage directly even if the worklog daemon is running")
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
 
     # Add entry command
@@ -250,11 +1054,19 @@ def main():
     add_parser.add_argument("--description", required=True, help="Work description")
     add_parser.add_argument("--date", help="Date (YYYY-MM-DD), defaults to today")
 
+    # Batch add command
+    batch_parser = subparsers.add_parser("add-batch", help="Add many entries in a single write")
+    batch_parser.add_argument("--file", help="Input file (JSON, JSONL or CSV); reads stdin if omitted")
+    batch_parser.add_argument("--input-format", choices=["auto", "json", "jsonl", "csv"], default="auto",
+                              help="Input format (default: detect from content)")
+
     # List entries command
     list_parser = subparsers.add_parser("list", help="List worklog entries")
     list_parser.add_argument("--client", help="Filter by client name")
     list_parser.add_argument("--start-date", help="Start date (YYYY-MM-DD)")
     list_parser.add_argument("--end-date", help="End date (YYYY-MM-DD)")
+    list_parser.add_argument("--limit", type=int, help="Show at most this many entries (most recent first)")
+    list_parser.add_argument("--offset", type=int, default=0, help="Skip this many of the most recent entries")
     list_parser.add_argument("--format", choices=["json", "table"], default="table")
 
     # Total hours command
@@ -262,47 +1074,151 @@ def main():
     total_parser.add_argument("--client", help="Filter by client name")
     total_parser.add_argument("--start-date", help="Start date (YYYY-MM-DD)")
     total_parser.add_argument("--end-date", help="End date (YYYY-MM-DD)")
+    total_parser.add_argument("--verify", action="store_true",
+                              help="Recompute from raw entries and report rollup drift")
+
+    # Search command
+    search_parser = subparsers.add_parser("search", help="Ranked keyword search over descriptions")
+    search_parser.add_argument("query", nargs="+", help="Search terms")
+    search_parser.add_argument("--client", help="Filter by client name")
+    search_parser.add_argument("--start-date", help="Start date (YYYY-MM-DD)")
+    search_parser.add_argument("--end-date", help="End date (YYYY-MM-DD)")
+    search_parser.add_argument("--limit", type=int, default=20, help="Maximum results (default: 20)")
+    search_parser.add_argument("--all", action="store_true", help="Require every term to match")
+    search_parser.add_argument("--format", choices=["json", "table"], default="table")
+
+    # Report command
+    report_parser = subparsers.add_parser("report", help="Hours, revenue, weekly utilization and top clients")
+    report_parser.add_argument("--client", help="Filter by client name")
+    report_parser.add_argument("--start-date", help="Start date (YYYY-MM-DD)")
+    report_parser.add_argument("--end-date", help="End date (YYYY-MM-DD)")
+    report_parser.add_argument("--top", type=int, default=5, help="Number of top clients to show")
+    report_parser.add_argument("--weekly-capacity", type=float, default=DEFAULT_WEEKLY_CAPACITY,
+                               help="Available hours per week for utilization")
+    report_parser.add_argument("--format", choices=["json", "table"], default="table")
 
     # List clients command
     subparsers.add_parser("clients", help="List available clients")
 
+    # Update entry command
+    update_parser = subparsers.add_parser("update", help="Update an entry by ID")
+    update_parser.add_argument("id", help="Entry ID (shown by list)")
+    update_parser.add_argument("--client", help="New client name")
+    update_parser.add_argument("--hours", type=float, help="New hours worked")
+    update_parser.add_argument("--description", help="New work description")
+    update_parser.add_argument("--date", help="New date (YYYY-MM-DD)")
+
     # Delete entry command
-    delete_parser = subparsers.add_parser("delete", help="Delete an entry")
-    delete_parser.add_argument("index", type=int, help="Entry index to delete")
+    delete_parser = subparsers.add_parser("delete", help="Delete an entry by ID")
+    delete_parser.add_argument("id", help="Entry ID (shown by list), or a storage index with --index")
+    delete_parser.add_argument("--index", action="store_true",
+                               help="Treat the argument as a legacy zero-based storage index")
+
+    # Import JSON into SQLite command
+    import_parser = subparsers.add_parser("import-json", help="Import worklog.json into the SQLite backend")
+    import_parser.add_argument("--source", help="Source JSON file (defaults to worklog.json)")
+    import_parser.add_argument("--append", action="store_true",
+                               help="Keep existing SQLite entries instead of replacing them")
+
+    # Export command
+    export_parser = subparsers.add_parser("export", help="Stream entries as JSON Lines")
+    export_parser.add_argument("--since-watermark", action="store_true",
+                               help="Only entries created or updated since this consumer's last export")
+    export_parser.add_argument("--consumer", default="default",
+                               help="Watermark name, one per downstream job (default: default)")
+    export_parser.add_argument("--dry-run", action="store_true",
+                               help="Don't advance the watermark")
+    export_parser.add_argument("--reset", action="store_true",
+                               help="Forget the consumer's watermark and exit")
+    export_parser.add_argument("--output", help="Write to this file instead of stdout")
+
+    # Compact journal command
+    subparsers.add_parser("compact", help="Fold the append-only journal into worklog.json")
+
+    # Daemon command
+    serve_parser = subparsers.add_parser("serve", help="Run the in-memory worklog daemon")
+    serve_parser.add_argument("--stop", action="store_true", help="Stop a running daemon")
+    serve_parser.add_argument("--status", action="store_true", help="Report whether the daemon is running")
 
     args = parser.parse_args()
 
+    if args.backend:
+        set_backend(args.backend)
+
+    use_daemon = not args.no_daemon
+
     if args.command == "add":
         try:
-            entry = add_entry(
-                args.client,
-                args.hours,
-                args.description,
-                args.date
-            )
-            print(f"✅ Added entry: {entry['hours']} hours for {entry['client']} on {entry['date']}")
+            params = {
+                "client_name": args.client,
+                "hours": args.hours,
+                "description": args.description,
+                "date": args.date
+            }
+            entry = run_via_daemon("add", params, lambda: add_entry(**params), use_daemon)
+            print(f"✅ Added entry {entry['id']}: {entry['hours']} hours for {entry['client']} on {entry['date']}")
         except ValueError as e:
             print(f"❌ Error: {e}")
             return 1
 
+    elif args.command == "add-batch":
+        try:
+            if args.file:
+                with open(args.file, 'r') as f:
+                    rows = read_batch_rows(f, args.input_format)
+            else:
+                rows = read_batch_rows(sys.stdin, args.input_format)
+        except (IOError, ValueError, csv.Error) as e:
+            print(f"❌ Error: Failed to read batch input: {e}")
+            return 1
+
+        if not rows:
+            print("❌ Error: Batch input contains no rows")
+            return 1
+
+        result = add_entries(rows)
+        print(f"✅ Added {len(result['added'])} of {len(rows)} entries")
+        for error in result["errors"]:
+            print(f"❌ Row {error['row']}: {error['error']}")
+        if result["errors"]:
+            return 1
+
     elif args.command == "list":
-        entries = list_entries(args.client, args.start_date, args.end_date)
+        if (args.limit is not None and args.limit < 0) or args.offset < 0:
+            print("❌ Error: --limit and --offset must not be negative")
+            return 1
 
-        if args.format == "json":
-            print(json.dumps(entries, indent=2))
-        else:
-            if not entries:
+        params = {
+            "client_name": args.client,
+            "start_date": args.start_date,
+            "end_date": args.end_date,
+            "limit": args.limit,
+            "offset": args.offset
+        }
+        entries = run_via_daemon("list", params, lambda: list_entries(**params), use_daemon)
+
+        with broken_pipe_guard():
+            if args.format == "json":
+                print(json.dumps(entries, indent=2))
+            elif not entries:
                 print("No entries found.")
             else:
-                print(f"\n{'Date':<12} {'Client':<25} {'Hours':<8} {'Description'}")
-                print("-" * 80)
-                for entry in entries:
-                    desc = entry["description"][:40] + "..." if len(entry["description"]) > 40 else entry["description"]
-                    print(f"{entry['date']:<12} {entry['client']:<25} {entry['hours']:<8.2f} {desc}")
-                print()
+                write_entry_table(entries)
 
     elif args.command == "total":
-        totals = get_total_hours(args.client, args.start_date, args.end_date)
+        if args.verify:
+            drift = verify_rollup(args.client, args.start_date, args.end_date)
+            if drift:
+                print("⚠️  Rollup drift detected (rollup rebuilt from raw entries):")
+                for item in drift:
+                    print(f"   {item['client']:<30} {item['field']:<7} "
+                          f"rollup={item['rollup']:.2f} raw={item['raw']:.2f}")
+            else:
+                print("✅ Rollup verified against raw entries")
+
+        params = {"client_name": args.client, "start_date": args.start_date, "end_date": args.end_date}
+        totals = run_via_daemon("total", params, lambda: get_total_hours(**params),
+                                use_daemon and not args.verify)
 
         if not totals:
             print("No entries found.")
@@ -318,6 +1234,66 @@ def main():
                     print(f"{client:<30} {hours:>6.2f} hrs")
             print()
 
+        if args.verify and drift:
+            return 1
+
+    elif args.command == "search":
+        params = {
+            "query": " ".join(args.query),
+            "client_name": args.client,
+            "start_date": args.start_date,
+            "end_date": args.end_date,
+            "limit": args.limit,
+            "match_all": args.all
+        }
+        results = run_via_daemon("search", params, lambda: search_entries(**params), use_daemon)
+
+        if args.format == "json":
+            print(json.dumps(results, indent=2))
+        elif not results:
+            print("No matching entries found.")
+        else:
+            print(f"\n{'Score':<7} {'ID':<13} {'Date':<12} {'Client':<25} {'Hours':<8} {'Description'}")
+            print("-" * 101)
+            for result in results:
+                entry = result["entry"]
+                desc = entry["description"][:40] + "..." if len(entry["description"]) > 40 else entry["description"]
+                print(f"{result['score']:<7.2f} {entry.get('id', ''):<13} {entry['date']:<12} "
+                      f"{entry['client']:<25} {entry['hours']:<8.2f} {desc}")
+            print()
+
+    elif args.command == "report":
+        report = generate_report(args.client, args.start_date, args.end_date,
+                                 args.top, args.weekly_capacity)
+
+        with broken_pipe_guard():
+            if args.format == "json":
+                print(json.dumps(report, indent=2))
+            elif not report["entries"]:
+                print("No entries found.")
+            else:
+                print(f"\nWorklog Report ({report['entries']} entries)")
+                print("-" * 60)
+                print(f"{'Client':<30} {'Hours':>10} {'Revenue':>15}")
+                print("-" * 60)
+                for client, values in report["clients"].items():
+                    print(f"{client:<30} {values['hours']:>10.2f} {'$' + format(values['revenue'], ',.2f'):>15}")
+                print("-" * 60)
+                print(f"{'Total':<30} {report['total_hours']:>10.2f} "
+                      f"{'$' + format(report['total_revenue'], ',.2f'):>15}")
+
+                print(f"\n{'Week':<10} {'Hours':>10} {'Utilization':>12}")
+                print("-" * 34)
+                for week, values in report["weeks"].items():
+                    utilization = values["utilization"]
+                    shown = f"{utilization:.0%}" if utilization is not None else "-"
+                    print(f"{week:<10} {values['hours']:>10.2f} {shown:>12}")
+
+                print(f"\nTop {len(report['top_clients'])} Clients by Hours:")
+                for rank, item in enumerate(report["top_clients"], 1):
+                    print(f"{rank:>3}. {item['client']:<30} {item['hours']:>8.2f} hrs")
+                print()
+
     elif args.command == "clients":
         clients = load_invoice_clients()
         print("\nAvailable Clients:")
@@ -327,12 +1303,87 @@ def main():
             print(f"{client['name']:<35} ({rate_info})")
         print()
 
+    elif args.command == "update":
+        try:
+            entry = update_entry(args.id, args.client, args.hours, args.description, args.date)
+            print(f"✅ Updated entry {entry['id']}: {entry['hours']} hours for {entry['client']} on {entry['date']}")
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            return 1
+
     elif args.command == "delete":
-        if delete_entry(args.index):
-            print(f"✅ Deleted entry at index {args.index}")
+        if args.index:
+            try:
+                index = int(args.id)
+            except ValueError:
+                print(f"❌ Error: Invalid index {args.id}")
+                return 1
+            if delete_entry(index):
+                print(f"✅ Deleted entry at index {index}")
+            else:
+                print(f"❌ Error: Invalid index {index}")
+                return 1
+        elif delete_entry_by_id(args.id):
+            print(f"✅ Deleted entry {args.id}")
         else:
-            print(f"❌ Error: Invalid index {args.index}")
+            print(f"❌ Error: No entry with ID '{args.id}'")
+            return 1
+
+    elif args.command == "import-json":
+        source = Path(args.source) if args.source else WORKLOG_FILE
+        if not source.exists():
+            print(f"❌ Error: {source} not found")
             return 1
+        sqlite_path = resolve_data_path(load_config()["storage"]["sqlite_file"])
+        count = import_json_to_sqlite(source, sqlite_path, replace=not args.append)
+        print(f"✅ Imported {count} entries from {source} into {sqlite_path}")
+
+    elif args.command == "export":
+        if args.reset:
+            if reset_watermark(args.consumer):
+                print(f"✅ Reset export watermark for {args.consumer}", file=sys.stderr)
+            else:
+                print(f"No export watermark for {args.consumer}", file=sys.stderr)
+            return 0
+
+        consumer = args.consumer if args.since_watermark else None
+        if args.output:
+            with open(args.output, 'w') as f:
+                count = export_entries(f, consumer, commit=not args.dry_run)
+        else:
+            count = export_entries(sys.stdout, consumer, commit=not args.dry_run)
+        print(f"Exported {count} entries", file=sys.stderr)
+
+    elif args.command == "compact":
+        backend = get_backend()
+        if not isinstance(backend, JournalBackend):
+            print(f"❌ Error: compact requires the journal backend (active: {backend.name})")
+            return 1
+        folded = backend.compact()
+        print(f"✅ Compacted {folded} journal records into {backend.path}")
+
+    elif args.command == "serve":
+        from worklog_server import is_running, request
+
+        socket_path = daemon_socket_path()
+        if args.status:
+            state = "running" if is_running(socket_path) else "not running"
+            print(f"Worklog daemon {state} ({socket_path})")
+        elif args.stop:
+            try:
+                request(socket_path, "shutdown")
+                print("✅ Worklog daemon stopped")
+            except DaemonUnavailable:
+                print("❌ Error: Worklog daemon is not running")
+                return 1
+        else:
+            print(f"Worklog daemon listening on {socket_path} ({get_backend().name} backend)")
+            sys.stdout.flush()
+            try:
+                serve_daemon()
+            except RuntimeError as e:
+                print(f"❌ Error: {e}")
+                return 1
 
     else:
         parser.print_help()
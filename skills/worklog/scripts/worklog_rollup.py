@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Worklog Rollup - Materialized per-client daily totals for the worklog skill
+
+Keeps hours and billed amount per client per day. Range totals (whole
+months included) are answered from per-client prefix sums over the day
+rollup instead of rescanning every entry.
+
+On disk the rollup is a snapshot (worklog.rollup.json) plus an append-only
+log of day deltas (worklog.rollup.log.jsonl), maintained like the journal:
+writers go through RollupLog, which appends one delta per entry without
+loading the rollup, and the log is folded into a new snapshot once it grows
+past a threshold.
+"""
+
+import json
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from worklog_storage import IndexLog, append_log_records, atomic_write_json, read_log_records, reset_log
+
+# 2 = snapshot generation plus delta log
+ROLLUP_VERSION = 2
+
+# Fold the log into the snapshot once it holds this many records
+DEFAULT_COMPACT_RECORDS = 1000
+
+# Tolerance when comparing float sums and when pruning emptied buckets
+EPSILON = 1e-6
+
+
+def entry_amount(entry: Dict) -> float:
+    """Billed amount for an entry (0 for non-hourly clients)."""
+    return entry["hours"] * (entry.get("hourly_rate") or 0)
+
+
+def delta_record(entry: Dict, sign: int) -> Dict:
+    """Log record for an entry's signed contribution to its day."""
+    return {"op": "delta", "client": entry["client"], "date": entry["date"],
+            "hours": sign * entry["hours"], "amount": sign * entry_amount(entry)}
+
+
+class RollupIndex:
+    """Per-client day rollup with prefix-sum range queries."""
+
+    def __init__(self, path: Path, compact_records: int = DEFAULT_COMPACT_RECORDS):
+        """Initialize an empty rollup.
+
+        Args:
+            path: Snapshot location
+            compact_records: Log length that triggers a fold into the snapshot
+        """
+        self.path = Path(path)
+        self.log_path = self.path.with_suffix(".log.jsonl")
+        self.compact_records = compact_records
+        self.fingerprint: Optional[str] = None
+        self.generation = 0
+        # client -> date -> [hours, amount]
+        self.days: Dict[str, Dict[str, List[float]]] = {}
+        self._prefix: Optional[Dict[str, Tuple[List[str], List[float], List[float]]]] = None
+        self._log_records = 0
+        self._pending: List[Dict] = []
+        self._rewrite = False
+
+    @classmethod
+    def load(cls, path: Path, compact_records: int = DEFAULT_COMPACT_RECORDS) -> "RollupIndex":
+        """Load the snapshot and replay the log (empty and unfingerprinted if missing)."""
+        rollup = cls(path, compact_records)
+        if rollup.path.exists():
+            try:
+                with open(rollup.path, 'r') as f:
+                    data = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                data = {}
+            if data.get("version") == ROLLUP_VERSION:
+                rollup.fingerprint = data.get("fingerprint")
+                rollup.generation = data.get("generation", 0)
+                rollup.days = data.get("days", {})
+
+        for record in read_log_records(rollup.log_path, rollup.generation):
+            rollup._log_records += 1
+            if record["op"] == "delta":
+                rollup._apply_delta(record["client"], record["date"], record["hours"], record["amount"])
+            elif record["op"] == "mark":
+                rollup.fingerprint = record["fingerprint"]
+        return rollup
+
+    def save(self) -> None:
+        """Append pending deltas to the log, or fold everything into a new snapshot."""
+        if self._rewrite or self._log_records + len(self._pending) + 1 > self.compact_records:
+            self.generation += 1
+            atomic_write_json(self.path, {
+                "version": ROLLUP_VERSION,
+                "generation": self.generation,
+                "fingerprint": self.fingerprint,
+                "days": self.days
+            }, indent=None)
+            reset_log(self.log_path, self.generation, self.fingerprint)
+            self._log_records = 0
+        else:
+            records = self._pending + [{"op": "mark", "fingerprint": self.fingerprint}]
+            append_log_records(self.log_path, records, self.generation)
+            self._log_records += len(records)
+
+        self._pending = []
+        self._rewrite = False
+
+    def compact(self) -> None:
+        """Fold the log into a new snapshot."""
+        self._rewrite = True
+        self.save()
+
+    def is_current(self, fingerprint: str) -> bool:
+        """Check whether the rollup reflects the given storage fingerprint."""
+        return self.fingerprint is not None and self.fingerprint == fingerprint
+
+    @staticmethod
+    def _bump(buckets: Dict[str, List[float]], key: str, hours: float, amount: float) -> None:
+        bucket = buckets.setdefault(key, [0.0, 0.0])
+        bucket[0] = round(bucket[0] + hours, 6)
+        bucket[1] = round(bucket[1] + amount, 6)
+        if abs(bucket[0]) < EPSILON and abs(bucket[1]) < EPSILON:
+            del buckets[key]
+
+    def _apply_delta(self, client: str, date: str, hours: float, amount: float) -> None:
+        self._bump(self.days.setdefault(client, {}), date, hours, amount)
+        if not self.days[client]:
+            del self.days[client]
+        self._prefix = None
+
+    def apply(self, entry: Dict, sign: int = 1) -> None:
+        """Add (sign=1) or remove (sign=-1) an entry's contribution; persisted by save()."""
+        record = delta_record(entry, sign)
+        self._apply_delta(record["client"], record["date"], record["hours"], record["amount"])
+        self._pending.append(record)
+
+    def rebuild(self, entries: Iterable[Dict]) -> None:
+        """Recompute the rollup from raw entries; the next save() writes a fresh snapshot."""
+        self.days = {}
+        for entry in entries:
+            self.apply(entry)
+        self._pending = []
+        self._rewrite = True
+
+    def _prefix_sums(self) -> Dict[str, Tuple[List[str], List[float], List[float]]]:
+        """Per-client sorted dates with cumulative hours/amount (leading zero)."""
+        if self._prefix is None:
+            self._prefix = {}
+            for client, days in self.days.items():
+                dates = sorted(days)
+                cum_hours, cum_amount = [0.0], [0.0]
+                for date in dates:
+                    cum_hours.append(cum_hours[-1] + days[date][0])
+                    cum_amount.append(cum_amount[-1] + days[date][1])
+                self._prefix[client] = (dates, cum_hours, cum_amount)
+        return self._prefix
+
+    def totals(
+        self,
+        client_name: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Range totals from prefix sums
+
+        Args:
+            client_name: Canonical client name filter
+            start_date: Inclusive start date (YYYY-MM-DD)
+            end_date: Inclusive end date (YYYY-MM-DD)
+
+        Returns:
+            Dictionary of client -> {"hours": ..., "amount": ...}
+        """
+        prefix = self._prefix_sums()
+        clients = [client_name] if client_name else list(prefix)
+
+        totals = {}
+        for client in clients:
+            if client not in prefix:
+                continue
+            dates, cum_hours, cum_amount = prefix[client]
+            lo = bisect_left(dates, start_date) if start_date else 0
+            hi = bisect_right(dates, end_date) if end_date else len(dates)
+            if lo >= hi:
+                continue
+            totals[client] = {
+                "hours": round(cum_hours[hi] - cum_hours[lo], 6),
+                "amount": round(cum_amount[hi] - cum_amount[lo], 6)
+            }
+        return totals
+
+
+class RollupLog(IndexLog):
+    """Write-only view of a RollupIndex that appends day deltas without loading it."""
+
+    index_class = RollupIndex
+
+    def __init__(self, path: Path, compact_records: int = DEFAULT_COMPACT_RECORDS):
+        super().__init__(path, compact_records)
+
+    @classmethod
+    def open(cls, path: Path, compact_records: int = DEFAULT_COMPACT_RECORDS) -> "RollupLog":
+        return super().open(path, compact_records)
+
+    def records(self, entry: Dict, sign: int) -> List[Dict]:
+        return [delta_record(entry, sign)]
+
+
+def compute_totals(entries: Iterable[Dict]) -> Dict[str, Dict[str, float]]:
+    """Recompute client totals ({"hours", "amount"}) directly from raw entries."""
+    totals = {}
+    for entry in entries:
+        bucket = totals.setdefault(entry["client"], {"hours": 0.0, "amount": 0.0})
+        bucket["hours"] += entry["hours"]
+        bucket["amount"] += entry_amount(entry)
+    return totals
+
+
+def find_drift(
+    expected: Dict[str, Dict[str, float]],
+    actual: Dict[str, Dict[str, float]]
+) -> List[Dict]:
+    """
+    Compare rollup totals against totals recomputed from raw entries
+
+    Returns:
+        List of {"client", "field", "rollup", "raw"} mismatches
+    """
+    drift = []
+    for client in sorted(set(expected) | set(actual)):
+        for field in ("hours", "amount"):
+            raw = expected.get(client, {}).get(field, 0.0)
+            rolled = actual.get(client, {}).get(field, 0.0)
+            if abs(raw - rolled) > EPSILON:
+                drift.append({"client": client, "field": field, "rollup": rolled, "raw": raw})
+    return drift
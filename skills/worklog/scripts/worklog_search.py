@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Worklog Search - Incrementally maintained full-text index over descriptions
+
+The index maps each description token to the IDs of the entries that
+contain it (with term frequencies) and keeps a copy of every indexed entry,
+so queries touch only the posting lists of their terms and never scan the
+worklog. Results are ranked with BM25.
+
+The index lives in an SQLite database (worklog.search.db, stdlib sqlite3)
+with one row per (token, entry) posting, keyed by token. A search reads
+only the posting rows of its terms, scores them inside SQLite and then
+fetches just the entries it returns, so it costs the same in a fresh
+process as in the daemon; an add, update or delete touches only the rows
+of that entry's tokens.
+"""
+
+import json
+import math
+import os
+import re
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Stored as PRAGMA user_version; a database with any other version is rebuilt
+SEARCH_VERSION = 2
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens of a description or query."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def term_frequencies(entry: Dict) -> Dict[str, int]:
+    """Token -> occurrence count for an entry's description."""
+    counts: Dict[str, int] = {}
+    for token in tokenize(entry.get("description", "")):
+        counts[token] = counts.get(token, 0) + 1
+    return counts
+
+
+class SearchIndex:
+    """Token -> entry ID inverted index with BM25 ranking, stored in SQLite."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+        CREATE TABLE IF NOT EXISTS docs (
+            id TEXT PRIMARY KEY,
+            entry TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS postings (
+            token TEXT NOT NULL,
+            id TEXT NOT NULL,
+            tf INTEGER NOT NULL,
+            length INTEGER NOT NULL,
+            client TEXT NOT NULL,
+            date TEXT NOT NULL,
+            PRIMARY KEY (token, id)
+        ) WITHOUT ROWID;
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize an index handle; the database is opened on first use.
+
+        Args:
+            path: Database location (None for a throwaway in-memory index)
+        """
+        self.path = Path(path) if path else None
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Lazily open the database, recreating it if it has another schema."""
+        if self._conn is None:
+            try:
+                self._conn = self._connect()
+            except sqlite3.DatabaseError:
+                # Not an SQLite database (e.g. an older JSON index at this path)
+                os.unlink(self.path)
+                self._conn = self._connect()
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] != SEARCH_VERSION:
+                self._conn.executescript(
+                    "DROP TABLE IF EXISTS meta; DROP TABLE IF EXISTS docs; DROP TABLE IF EXISTS postings;"
+                )
+                self._conn.executescript(self.SCHEMA)
+                self._conn.execute(f"PRAGMA user_version = {SEARCH_VERSION}")
+        return self._conn
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.path is None:
+            return sqlite3.connect(":memory:")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        try:
+            # Derived data: a commit lost to a crash only leaves the fingerprint
+            # stale, and the next search rebuilds the index
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+        except sqlite3.DatabaseError:
+            conn.close()
+            raise
+        return conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    @property
+    def fingerprint(self) -> Optional[str]:
+        """Storage fingerprint the index reflects (None if never built)."""
+        return self._meta("fingerprint")
+
+    @fingerprint.setter
+    def fingerprint(self, value: Optional[str]) -> None:
+        self._set_meta("fingerprint", value)
+
+    def is_current(self, fingerprint: str) -> bool:
+        """Check whether the index reflects the given storage fingerprint."""
+        current = self.fingerprint
+        return current is not None and current == fingerprint
+
+    def _stats(self) -> Tuple[int, int]:
+        """Indexed document count and total token count."""
+        return int(self._meta("doc_count") or 0), int(self._meta("total_length") or 0)
+
+    def _add(self, entry: Dict, stats: List[int]) -> None:
+        self._remove(entry["id"], stats)
+        counts = term_frequencies(entry)
+        length = sum(counts.values())
+        self.conn.execute("INSERT INTO docs (id, entry) VALUES (?, ?)", (entry["id"], json.dumps(entry)))
+        self.conn.executemany(
+            "INSERT INTO postings (token, id, tf, length, client, date) VALUES (?, ?, ?, ?, ?, ?)",
+            [(token, entry["id"], tf, length, entry["client"], entry["date"]) for token, tf in counts.items()]
+        )
+        stats[0] += 1
+        stats[1] += length
+
+    def _remove(self, entry_id: str, stats: List[int]) -> None:
+        row = self.conn.execute("SELECT entry FROM docs WHERE id = ?", (entry_id,)).fetchone()
+        if row is None:
+            return
+        counts = term_frequencies(json.loads(row[0]))
+        self.conn.execute("DELETE FROM docs WHERE id = ?", (entry_id,))
+        self.conn.executemany("DELETE FROM postings WHERE token = ? AND id = ?",
+                              [(token, entry_id) for token in counts])
+        stats[0] -= 1
+        stats[1] -= sum(counts.values())
+
+    def _save_stats(self, stats: List[int]) -> None:
+        self._set_meta("doc_count", stats[0])
+        self._set_meta("total_length", stats[1])
+
+    def apply(self, entry: Dict, sign: int = 1) -> None:
+        """Index (sign=1) or unindex (sign=-1) an entry; committed by save()."""
+        stats = list(self._stats())
+        if sign > 0:
+            self._add(entry, stats)
+        else:
+            self._remove(entry["id"], stats)
+        self._save_stats(stats)
+
+    def rebuild(self, entries: Iterable[Dict]) -> None:
+        """Re-index from raw entries; committed by save()."""
+        self.conn.execute("DELETE FROM docs")
+        self.conn.execute("DELETE FROM postings")
+        stats = [0, 0]
+        for entry in entries:
+            self._add(entry, stats)
+        self._save_stats(stats)
+
+    def save(self) -> None:
+        """Commit pending changes (and the fingerprint) in one transaction."""
+        self.conn.commit()
+
+    def search(
+        self,
+        query: str,
+        client_name: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: Optional[int] = 20,
+        match_all: bool = False
+    ) -> List[Dict]:
+        """
+        Ranked multi-term search
+
+        Args:
+            query: Free text; each token is a search term
+            client_name: Canonical client name filter
+            start_date: Inclusive start date (YYYY-MM-DD)
+            end_date: Inclusive end date (YYYY-MM-DD)
+            limit: Maximum number of results (None for all)
+            match_all: Require every term instead of ranking partial matches
+
+        Returns:
+            List of {"score": ..., "entry": ...}, best match first
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        doc_count, total_length = self._stats()
+        if not terms or not doc_count:
+            return []
+
+        avg_length = total_length / doc_count or 1.0
+
+        # Document frequencies are counted from the token index alone
+        idfs = []
+        for term in terms:
+            df = self.conn.execute("SELECT COUNT(*) FROM postings WHERE token = ?", (term,)).fetchone()[0]
+            if df:
+                idfs.append((term, math.log(1 + (doc_count - df + 0.5) / (df + 0.5))))
+            elif match_all:
+                return []
+        if not idfs:
+            return []
+
+        # Score inside SQLite: posting rows carry the document length, client
+        # and date, so filtering and ranking never read the entries themselves
+        where, params = [], []
+        if client_name:
+            where.append("p.client = ?")
+            params.append(client_name)
+        if start_date:
+            where.append("p.date >= ?")
+            params.append(start_date)
+        if end_date:
+            where.append("p.date <= ?")
+            params.append(end_date)
+
+        sql = f"""
+            WITH terms (token, idf) AS (VALUES {", ".join(["(?, ?)"] * len(idfs))})
+            SELECT p.id, SUM(t.idf * p.tf * ? / (p.tf + ? * (1 - ? + ? * p.length / ?))) AS score,
+                   MAX(p.date) AS date
+            FROM terms t JOIN postings p ON p.token = t.token
+            {"WHERE " + " AND ".join(where) if where else ""}
+            GROUP BY p.id
+            {"HAVING COUNT(*) = ?" if match_all else ""}
+            ORDER BY score DESC, date DESC
+            LIMIT ?
+        """
+        args = [value for pair in idfs for value in pair]
+        args += [BM25_K1 + 1, BM25_K1, BM25_B, BM25_B, avg_length] + params
+        args += [len(terms)] if match_all else []
+        # Best score first, most recent first among equal scores
+        rows = self.conn.execute(sql, args + [limit if limit else -1]).fetchall()
+
+        entries = self._entries([row[0] for row in rows])
+        return [{"score": round(row[1], 4), "entry": entry} for row, entry in zip(rows, entries)]
+
+    def _entries(self, entry_ids: List[str]) -> List[Dict]:
+        """Stored entries for the given IDs, in the same order."""
+        entries = {}
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(entry_ids), 500):
+            chunk = entry_ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for entry_id, entry in self.conn.execute(
+                    f"SELECT id, entry FROM docs WHERE id IN ({placeholders})", chunk):
+                entries[entry_id] = json.loads(entry)
+        return [entries[entry_id] for entry_id in entry_ids]
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Worklog Server - Optional long-lived worklog daemon over a Unix domain socket
+
+The daemon (started with `worklog_manager.py serve`) keeps entries, the
+rollup and search indexes and the client registry in memory and answers one
+newline-delimited JSON request per connection:
+
+    {"op": "list", "params": {"client_name": "ALT"}, "backend": "json"}
+    -> {"ok": true, "result": [...]}
+
+worklog_manager.py routes add/list/total/search through it whenever it is running
+and falls back to direct file access otherwise.
+"""
+
+import json
+import signal
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from worklog_storage import WorklogBackend
+
+# Client-side timeout for a single request (seconds)
+DEFAULT_TIMEOUT = 5.0
+
+
+class DaemonUnavailable(Exception):
+    """The daemon is not running or cannot serve this request."""
+    pass
+
+
+class EntryCache:
+    """In-memory copy of all entries, reloaded only when storage changes."""
+
+    def __init__(self, backend: WorklogBackend):
+        self.backend = backend
+        self._entries: List[Dict] = []
+        self._fingerprint: Optional[str] = None
+
+    def is_current(self) -> bool:
+        """Whether the cached entries match what is on disk."""
+        return self._fingerprint is not None and self._fingerprint == self.backend.fingerprint()
+
+    def entries(self) -> List[Dict]:
+        """All entries in storage order (reloaded if another process wrote)."""
+        if not self.is_current():
+            self._entries = list(self.backend.iter_entries())
+            self._fingerprint = self.backend.fingerprint()
+        return self._entries
+
+    def extend(self, entries: List[Dict]) -> None:
+        """Record entries this process just wrote (checked current and written under one lock)."""
+        self._entries.extend(entries)
+        self._fingerprint = self.backend.fingerprint()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Decode one JSON request, dispatch it and write one JSON response."""
+
+    def handle(self) -> None:
+        server: WorklogServer = self.server
+        try:
+            request = json.loads(self.rfile.readline())
+            if request.get("backend") and request["backend"] != server.backend_name:
+                response = {
+                    "ok": False,
+                    "unavailable": True,
+                    "error": f"Daemon serves the {server.backend_name} backend"
+                }
+            elif request.get("op") not in server.handlers:
+                response = {"ok": False, "error": f"Unknown operation: {request.get('op')}"}
+            else:
+                result = server.handlers[request["op"]](request.get("params") or {})
+                response = {"ok": True, "result": result}
+        except ValueError as e:
+            response = {"ok": False, "error": str(e)}
+        except Exception as e:
+            response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+        self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+
+
+class WorklogServer(socketserver.UnixStreamServer):
+    """Single-threaded Unix socket server; requests are handled one at a time."""
+
+    def __init__(self, socket_path: Path, backend_name: str, handlers: Dict[str, Callable[[Dict], Any]]):
+        self.backend_name = backend_name
+        self.handlers = dict(handlers)
+        self.handlers.setdefault("ping", lambda params: "pong")
+        self.handlers["shutdown"] = self._request_shutdown
+        super().__init__(str(socket_path), _RequestHandler)
+
+    def _request_shutdown(self, params: Dict) -> str:
+        # shutdown() blocks until serve_forever exits, so call it off-thread
+        threading.Thread(target=self.shutdown, daemon=True).start()
+        return "stopping"
+
+
+def is_running(socket_path: Path) -> bool:
+    """Check whether a daemon is answering on the socket."""
+    try:
+        return request(socket_path, "ping", timeout=1.0) == "pong"
+    except (DaemonUnavailable, ValueError):
+        return False
+
+
+def serve(socket_path: Path, backend_name: str, handlers: Dict[str, Callable[[Dict], Any]]) -> None:
+    """
+    Run the daemon until it receives SIGINT/SIGTERM or a shutdown request
+
+    Args:
+        socket_path: Unix domain socket to listen on
+        backend_name: Storage backend the handlers operate on
+        handlers: Operation name -> callable taking the request params
+
+    Raises:
+        RuntimeError: If another daemon is already listening on the socket
+    """
+    socket_path = Path(socket_path)
+    if socket_path.exists():
+        if is_running(socket_path):
+            raise RuntimeError(f"Worklog daemon already running on {socket_path}")
+        # Stale socket left behind by a daemon that died
+        socket_path.unlink()
+
+    server = WorklogServer(socket_path, backend_name, handlers)
+
+    def handle_sigterm(signum, frame):
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path.exists():
+            socket_path.unlink()
+
+
+def request(
+    socket_path: Path,
+    op: str,
+    params: Optional[Dict] = None,
+    backend: Optional[str] = None,
+    timeout: float = DEFAULT_TIMEOUT
+) -> Any:
+    """
+    Send one request to the daemon
+
+    Args:
+        socket_path: Daemon socket
+        op: Operation name ("add", "list", "total", "search", "ping", "shutdown")
+        params: Operation parameters
+        backend: Backend the caller expects; the daemon refuses a mismatch
+        timeout: Socket timeout in seconds
+
+    Returns:
+        The operation result
+
+    Raises:
+        DaemonUnavailable: If no daemon answers (the caller should fall back)
+        ValueError: If the daemon rejected the request (e.g. invalid client)
+    """
+    socket_path = Path(socket_path)
+    if not socket_path.exists():
+        raise DaemonUnavailable(f"No daemon socket at {socket_path}")
+
+    payload = json.dumps({"op": op, "params": params or {}, "backend": backend}) + "\n"
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path))
+            sock.sendall(payload.encode("utf-8"))
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+    except OSError as e:
+        raise DaemonUnavailable(str(e))
+
+    try:
+        response = json.loads(b"".join(chunks))
+    except json.JSONDecodeError:
+        raise DaemonUnavailable("Malformed daemon response")
+
+    if response.get("unavailable"):
+        raise DaemonUnavailable(response.get("error", "Daemon unavailable"))
+    if not response.get("ok"):
+        raise ValueError(response.get("error", "Daemon request failed"))
+    return response["result"]
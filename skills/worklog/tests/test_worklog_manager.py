@@ -0,0 +1,203 @@
+"""Tests for the worklog manager."""
+
+import io
+import json
+import shutil
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import worklog_manager  # noqa: E402
+from worklog_manager import ClientRegistry, add_entry_cached, read_batch_rows  # noqa: E402
+from worklog_server import EntryCache  # noqa: E402
+from worklog_storage import JournalBackend, make_entry_id  # noqa: E402
+
+CLIENTS = [
+    {"name": "Acme Corp", "short_name": "Acme", "invoice_type": "hourly", "hourly_rate": 150.0},
+    {"name": "Umbrella", "invoice_type": "subscription"},
+]
+
+
+class ClientRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = self.dir / "clients.json"
+        self.path.write_text(json.dumps({"clients": CLIENTS}))
+
+    def test_get_on_fresh_registry(self):
+        registry = ClientRegistry(self.path)
+        self.assertEqual(registry.get("Acme Corp")["hourly_rate"], 150.0)
+        self.assertEqual(registry.get("Acme")["name"], "Acme Corp")
+
+    def test_rate_on_fresh_registry(self):
+        self.assertEqual(ClientRegistry(self.path).rate("Acme Corp"), 150.0)
+        self.assertIsNone(ClientRegistry(self.path).rate("Umbrella"))
+
+    def test_get_after_file_change(self):
+        registry = ClientRegistry(self.path)
+        self.assertIsNone(registry.get("Globex"))
+        self.path.write_text(json.dumps({"clients": CLIENTS + [{"name": "Globex"}]}))
+        self.assertEqual(registry.get("Globex"), {"name": "Globex"})
+
+    def test_get_client_rate_first_call(self):
+        original = worklog_manager.INVOICE_CLIENTS_FILE, worklog_manager._client_registry
+        self.addCleanup(self._restore_registry, original)
+        worklog_manager.INVOICE_CLIENTS_FILE = self.path
+        worklog_manager._client_registry = None
+
+        self.assertEqual(worklog_manager.get_client_rate("Acme Corp"), 150.0)
+
+    @staticmethod
+    def _restore_registry(original):
+        worklog_manager.INVOICE_CLIENTS_FILE, worklog_manager._client_registry = original
+
+
+class ReadBatchRowsTest(unittest.TestCase):
+
+    ROW = {"client": "Acme", "hours": 1.5, "description": "Fixed billing bug"}
+
+    def rows(self, text: str, input_format: str = "auto") -> list:
+        return read_batch_rows(io.StringIO(text), input_format)
+
+    def test_single_line_jsonl(self):
+        self.assertEqual(self.rows(json.dumps(self.ROW) + "\n"), [self.ROW])
+        self.assertEqual(self.rows(json.dumps(self.ROW), "jsonl"), [self.ROW])
+
+    def test_lone_json_object(self):
+        self.assertEqual(self.rows(json.dumps(self.ROW, indent=2)), [self.ROW])
+        self.assertEqual(self.rows(json.dumps(self.ROW), "json"), [self.ROW])
+
+    def test_json_array_and_entries_document(self):
+        self.assertEqual(self.rows(json.dumps([self.ROW, self.ROW])), [self.ROW, self.ROW])
+        self.assertEqual(self.rows(json.dumps({"entries": [self.ROW]})), [self.ROW])
+
+    def test_multi_line_jsonl(self):
+        text = json.dumps(self.ROW) + "\n" + json.dumps(self.ROW) + "\n"
+        self.assertEqual(self.rows(text), [self.ROW, self.ROW])
+
+    def test_csv(self):
+        rows = self.rows("client,hours,description\nAcme,1.5,Fixed billing bug\n")
+        self.assertEqual(rows, [{"client": "Acme", "hours": "1.5", "description": "Fixed billing bug"}])
+
+    def test_json_scalar_is_rejected(self):
+        for text in ("5", '"text"', "null", '{"entries": 5}'):
+            with self.assertRaisesRegex(ValueError, "object or a list of objects"):
+                self.rows(text, "json")
+
+        with mock.patch.object(sys, "argv", ["worklog_manager.py", "add-batch", "--input-format", "json"]), \
+                mock.patch.object(sys, "stdin", io.StringIO("5")), \
+                redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(worklog_manager.main(), 1)
+        self.assertIn("Failed to read batch input", out.getvalue())
+
+    def test_add_batch_without_rows_fails(self):
+        for text in ("", "[]", '{"entries": []}'):
+            with mock.patch.object(sys, "argv", ["worklog_manager.py", "add-batch"]), \
+                    mock.patch.object(sys, "stdin", io.StringIO(text)), \
+                    redirect_stdout(io.StringIO()) as out:
+                self.assertEqual(worklog_manager.main(), 1)
+            self.assertIn("no rows", out.getvalue())
+
+
+class WorklogDirTestCase(unittest.TestCase):
+    """Points worklog_manager at a temporary worklog directory and clients file."""
+
+    backend = "journal"
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir)
+        clients = self.dir / "clients.json"
+        clients.write_text(json.dumps({"clients": CLIENTS}))
+
+        patches = [
+            mock.patch.multiple(
+                worklog_manager,
+                WORKLOG_DIR=self.dir,
+                WORKLOG_FILE=self.dir / "worklog.json",
+                WORKLOG_CONFIG_FILE=self.dir / "config.json",
+                INVOICE_CLIENTS_FILE=clients,
+                _backend=None, _rollup=None, _search_index=None, _client_registry=None
+            ),
+            mock.patch.dict(os.environ, {"WORKLOG_BACKEND": self.backend}),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+
+class AddEntriesTest(WorklogDirTestCase):
+
+    def test_zero_hours_is_reported_as_invalid_not_missing(self):
+        result = worklog_manager.add_entries([
+            {"client": "Acme", "hours": 0, "description": "zero"},
+            {"client": "Acme", "hours": "", "description": "blank"},
+            {"client": "Acme", "hours": 1.5, "description": "ok"},
+        ])
+
+        self.assertEqual([e["description"] for e in result["added"]], ["ok"])
+        self.assertEqual(result["errors"], [
+            {"row": 1, "error": "Hours must be greater than 0"},
+            {"row": 2, "error": "Missing required field(s): hours"},
+        ])
+
+
+class ClosedPipe(io.StringIO):
+    def write(self, text):
+        raise BrokenPipeError
+
+
+class BrokenPipeTest(WorklogDirTestCase):
+
+    def test_report_and_list_into_closed_pipe(self):
+        worklog_manager.add_entry("Acme", 1.0, "first", "2025-01-01")
+        stdout = sys.stdout
+        self.addCleanup(setattr, sys, "stdout", stdout)
+
+        for command in (["report", "--format", "json"], ["report"], ["list", "--format", "json"]):
+            sys.stdout = ClosedPipe()
+            with mock.patch.object(sys, "argv", ["worklog_manager.py", "--no-daemon", *command]):
+                self.assertEqual(worklog_manager.main(), 0)
+
+
+class DaemonAddTest(WorklogDirTestCase):
+
+    def test_write_between_check_and_add_is_not_lost(self):
+        worklog_manager.add_entry("Acme", 1.0, "first", "2025-01-01")
+        cache = EntryCache(worklog_manager.get_backend())
+        cache.entries()
+
+        # Another process adds an entry right after the daemon checks its cache
+        other = JournalBackend(self.dir / "worklog.json", compact_threshold_bytes=0)
+        writer = threading.Thread(target=other.append, args=({
+            "id": make_entry_id(), "client": "Acme Corp", "date": "2025-01-02", "hours": 2.0,
+            "description": "other process", "hourly_rate": 150.0, "created_at": "2025-01-02T09:00:00"
+        },))
+        is_current = cache.is_current
+
+        def check_then_let_writer_in():
+            current = is_current()
+            writer.start()
+            writer.join(0.5)  # Completes unless the daemon holds the lock
+            return current
+
+        cache.is_current = check_then_let_writer_in
+        add_entry_cached(cache, client_name="Acme", hours=3.0, description="daemon", date="2025-01-03")
+        writer.join()
+        cache.is_current = is_current
+
+        self.assertEqual(sorted(e["description"] for e in cache.entries()),
+                         ["daemon", "first", "other process"])
+
+
+if __name__ == "__main__":
+    unittest.main()
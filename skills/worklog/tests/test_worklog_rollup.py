@@ -0,0 +1,97 @@
+"""Tests for the worklog rollup."""
+
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from worklog_rollup import RollupIndex, RollupLog, compute_totals, find_drift  # noqa: E402
+
+ENTRIES = [
+    {"client": "Acme Corp", "date": "2025-01-31", "hours": 2.0, "hourly_rate": 150.0},
+    {"client": "Acme Corp", "date": "2025-02-01", "hours": 1.5, "hourly_rate": 150.0},
+    {"client": "Acme Corp", "date": "2025-02-28", "hours": 3.0, "hourly_rate": 150.0},
+    {"client": "Umbrella", "date": "2025-02-14", "hours": 4.0, "hourly_rate": None},
+]
+
+
+class RollupIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.rollup = RollupIndex(self.dir / "worklog.rollup.json")
+        self.rollup.rebuild(ENTRIES)
+
+    def test_whole_month_totals(self):
+        february = [e for e in ENTRIES if e["date"].startswith("2025-02")]
+        totals = self.rollup.totals(start_date="2025-02-01", end_date="2025-02-31")
+        self.assertEqual(find_drift(compute_totals(february), totals), [])
+        self.assertEqual(totals["Acme Corp"], {"hours": 4.5, "amount": 675.0})
+
+    def test_incremental_delete_round_trips_through_disk(self):
+        self.rollup.apply(ENTRIES[0], -1)
+        self.rollup.fingerprint = "v2"
+        self.rollup.save()
+
+        loaded = RollupIndex.load(self.rollup.path)
+        self.assertEqual(find_drift(compute_totals(ENTRIES[1:]), loaded.totals()), [])
+        with open(self.rollup.path) as f:
+            self.assertEqual(set(json.load(f)), {"version", "generation", "fingerprint", "days"})
+
+
+class RollupLogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = self.dir / "worklog.rollup.json"
+
+        rollup = RollupIndex(self.path)
+        rollup.rebuild(ENTRIES[:2])
+        rollup.fingerprint = "v1"
+        rollup.save()
+
+    def write(self, fingerprint: str, new_fingerprint: str, entry: dict, sign: int = 1,
+              compact_records: int = 1000) -> RollupLog:
+        log = RollupLog.open(self.path, compact_records)
+        self.assertTrue(log.is_current(fingerprint))
+        log.apply(entry, sign)
+        log.fingerprint = new_fingerprint
+        log.save()
+        return log
+
+    def test_writes_append_without_rewriting_snapshot(self):
+        snapshot = self.path.read_bytes()
+        self.write("v1", "v2", ENTRIES[2])
+        self.write("v2", "v3", ENTRIES[3])
+        self.write("v3", "v4", ENTRIES[0], sign=-1)
+
+        self.assertEqual(self.path.read_bytes(), snapshot)
+        loaded = RollupIndex.load(self.path)
+        self.assertTrue(loaded.is_current("v4"))
+        self.assertEqual(find_drift(compute_totals(ENTRIES[1:]), loaded.totals()), [])
+
+    def test_stale_rollup_is_not_current(self):
+        self.assertFalse(RollupLog.open(self.path).is_current("v0"))
+        self.assertFalse(RollupLog.open(self.dir / "missing.rollup.json").is_current("v1"))
+
+    def test_long_log_is_folded_into_snapshot(self):
+        fingerprint = "v1"
+        for number, entry in enumerate(ENTRIES[2:] * 3):
+            log = self.write(fingerprint, f"w{number}", entry, compact_records=4)
+            fingerprint = f"w{number}"
+
+        self.assertLessEqual(log._log_records, 4)
+        loaded = RollupIndex.load(self.path)
+        self.assertTrue(loaded.is_current(fingerprint))
+        self.assertGreater(loaded.generation, 1)
+        self.assertEqual(find_drift(compute_totals(ENTRIES[:2] + ENTRIES[2:] * 3), loaded.totals()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
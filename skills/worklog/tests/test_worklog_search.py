@@ -0,0 +1,111 @@
+"""Tests for the worklog search index."""
+
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from worklog_search import SearchIndex  # noqa: E402
+
+
+def make_entry(entry_id: str, description: str, client: str = "Acme Corp",
+               date: str = "2025-01-15") -> dict:
+    return {"id": entry_id, "client": client, "date": date, "hours": 1.0,
+            "description": description}
+
+
+class SearchIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = self.dir / "worklog.search.db"
+
+        index = self.open()
+        index.rebuild([make_entry("a", "billing dashboard"), make_entry("b", "invoice export")])
+        index.fingerprint = "v1"
+        index.save()
+
+    def open(self) -> SearchIndex:
+        index = SearchIndex(self.path)
+        self.addCleanup(index.close)
+        return index
+
+    def write(self, fingerprint: str, new_fingerprint: str, entry: dict, sign: int = 1) -> None:
+        index = self.open()
+        self.assertTrue(index.is_current(fingerprint))
+        index.apply(entry, sign)
+        index.fingerprint = new_fingerprint
+        index.save()
+
+    def ids(self, query: str, **filters) -> list:
+        return sorted(r["entry"]["id"] for r in self.open().search(query, **filters))
+
+    def test_writes_persist_across_processes(self):
+        self.write("v1", "v2", make_entry("c", "billing api"))
+        self.write("v2", "v3", make_entry("a", "billing dashboard"), sign=-1)
+
+        self.assertTrue(self.open().is_current("v3"))
+        self.assertEqual(self.ids("billing"), ["c"])
+        self.assertEqual(self.ids("dashboard"), [])
+
+    def test_reindexing_an_entry_replaces_its_postings(self):
+        self.write("v1", "v2", make_entry("a", "quarterly report"))
+
+        self.assertEqual(self.ids("billing"), [])
+        self.assertEqual(self.ids("quarterly"), ["a"])
+        self.assertEqual(self.open()._stats(), (2, 4))
+
+    def test_search_reads_only_postings_of_its_terms(self):
+        index = self.open()
+        statements = []
+        index.conn.set_trace_callback(statements.append)
+
+        self.assertEqual([r["entry"]["id"] for r in index.search("invoice")], ["b"])
+        postings = [sql for sql in statements if "postings" in sql]
+        self.assertTrue(postings)
+        for sql in postings:
+            self.assertIn("'invoice'", sql)
+            plan = " ".join(row[-1] for row in index.conn.execute("EXPLAIN QUERY PLAN " + sql))
+            self.assertNotIn("SCAN p", plan)
+            self.assertNotRegex(plan, r"SCAN postings\b")
+        docs = [sql for sql in statements if "FROM docs" in sql]
+        self.assertEqual(docs, ["SELECT id, entry FROM docs WHERE id IN ('b')"])
+
+    def test_filters_and_match_all(self):
+        self.write("v1", "v2", make_entry("c", "billing invoice", client="Umbrella", date="2025-03-01"))
+
+        self.assertEqual(self.ids("billing invoice"), ["a", "b", "c"])
+        self.assertEqual(self.ids("billing invoice", match_all=True), ["c"])
+        self.assertEqual(self.ids("billing", client_name="Acme Corp"), ["a"])
+        self.assertEqual(self.ids("invoice", start_date="2025-02-01"), ["c"])
+
+    def test_uncommitted_changes_are_not_visible(self):
+        index = self.open()
+        index.apply(make_entry("c", "billing api"))
+        index.fingerprint = "v2"
+        index.close()
+
+        self.assertTrue(self.open().is_current("v1"))
+        self.assertEqual(self.ids("billing"), ["a"])
+
+    def test_stale_or_foreign_file_is_not_current(self):
+        self.assertFalse(self.open().is_current("v0"))
+        self.assertFalse(SearchIndex(self.dir / "missing.search.db").is_current("v1"))
+
+        legacy = self.dir / "worklog.search.json"
+        legacy.write_text('{"version": 1, "docs": {}}')
+        index = SearchIndex(legacy)
+        self.addCleanup(index.close)
+        self.assertFalse(index.is_current("v1"))
+        self.assertEqual(index.search("billing"), [])
+        with sqlite3.connect(str(legacy)) as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""Tests for the worklog storage backends."""
+
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from worklog_storage import JournalBackend, make_entry_id  # noqa: E402
+
+
+def make_entry(description: str) -> dict:
+    return {
+        "id": make_entry_id(),
+        "client": "Acme Corp",
+        "date": "2025-01-15",
+        "hours": 1.0,
+        "description": description,
+        "hourly_rate": 150.0,
+        "created_at": "2025-01-15T09:00:00"
+    }
+
+
+class JournalBackendTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = self.dir / "worklog.json"
+
+    def backend(self) -> JournalBackend:
+        return JournalBackend(self.path, compact_threshold_bytes=0)
+
+    def descriptions(self, backend: JournalBackend) -> list:
+        return [e["description"] for e in backend.iter_entries()]
+
+    def test_append_after_crash_between_snapshot_and_journal_reset(self):
+        backend = self.backend()
+        backend.extend([make_entry("a"), make_entry("b")])
+
+        # Crash window: the snapshot is written but the journal is not yet removed
+        leftover = backend.journal_path.read_bytes()
+        backend.compact()
+        backend.journal_path.write_bytes(leftover)
+
+        reopened = self.backend()
+        self.assertEqual(self.descriptions(reopened), ["a", "b"])
+
+        reopened.append(make_entry("c"))
+        self.assertEqual(self.descriptions(reopened), ["a", "b", "c"])
+        self.assertEqual(self.descriptions(self.backend()), ["a", "b", "c"])
+
+    def test_id_index_after_crash_between_snapshot_and_journal_reset(self):
+        backend = self.backend()
+        backend.extend([make_entry("a"), make_entry("b")])
+        leftover = backend.journal_path.read_bytes()
+        backend.compact()
+        backend.journal_path.write_bytes(leftover)
+
+        reopened = self.backend()
+        reopened.id_index()
+        entry = make_entry("c")
+        reopened.append(entry)
+
+        self.assertEqual(reopened.get(entry["id"])["description"], "c")
+        self.assertEqual(reopened.delete_by_id(entry["id"])["description"], "c")
+        self.assertEqual(self.descriptions(self.backend()), ["a", "b"])
+
+    def test_get_update_delete_by_id_seek_snapshot_and_journal(self):
+        backend = self.backend()
+        snapshot_entries = [make_entry(f"s{n}") for n in range(5)]
+        backend.save({"entries": snapshot_entries})
+        journal_entry = make_entry("j0")
+        backend.append(journal_entry)
+
+        reopened = self.backend()
+        self.assertEqual(reopened.get(snapshot_entries[3]["id"])["description"], "s3")
+        self.assertEqual(reopened.get(journal_entry["id"])["description"], "j0")
+        self.assertIsNone(reopened.get("missing"))
+
+        edited = {**snapshot_entries[1], "description": "s1 edited"}
+        self.assertEqual(reopened.update(edited["id"], edited)["description"], "s1")
+        self.assertEqual(self.backend().get(edited["id"])["description"], "s1 edited")
+
+        self.assertEqual(reopened.delete_by_id(snapshot_entries[0]["id"])["description"], "s0")
+        self.assertIsNone(self.backend().get(snapshot_entries[0]["id"]))
+        self.assertIsNone(self.backend().delete_by_id(snapshot_entries[0]["id"]))
+        self.assertEqual(self.descriptions(self.backend()), ["s1 edited", "s2", "s3", "s4", "j0"])
+
+    def test_get_by_id_does_not_scan(self):
+        backend = self.backend()
+        entries = [make_entry(f"s{n}") for n in range(5)]
+        backend.save({"entries": entries})
+        self.backend().id_index()  # First process writes the ID sidecar
+
+        reopened = self.backend()
+        reopened.iter_entries = None  # Any full scan would fail
+        self.assertEqual(reopened.get(entries[4]["id"])["description"], "s4")
+        self.assertEqual(reopened.delete_by_id(entries[2]["id"])["description"], "s2")
+
+    def test_get_by_id_with_non_ascii_snapshot(self):
+        backend = self.backend()
+        entries = [make_entry("caf\u00e9 \u2014 r\u00e9sum\u00e9"), make_entry("plain")]
+        self.path.write_text(json.dumps({"entries": entries}, ensure_ascii=False), encoding="utf-8")
+
+        self.assertEqual(backend.get(entries[1]["id"])["description"], "plain")
+        self.assertEqual(backend.get(entries[0]["id"])["description"], entries[0]["description"])
+
+
+if __name__ == "__main__":
+    unittest.main()